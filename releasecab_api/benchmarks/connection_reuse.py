@@ -0,0 +1,136 @@
+'''
+Compare request throughput with a new database connection per request
+(CONN_MAX_AGE=0) against persistent connections kept with health checks.
+Worker threads send requests through the full WSGI handler, so connections
+are opened, checked and closed exactly as they are when serving traffic.
+The gap grows with the cost of connecting, so it is widest over TLS or
+across a network to the database server.
+
+Runs against a throwaway test database, so it needs the same database
+settings as the test suite. From the releasecab_api directory:
+
+    python benchmarks/connection_reuse.py --workers 8 --requests 200
+'''
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+import django
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test.utils import setup_test_environment
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'releasecab_api.settings')
+
+
+def create_user():
+    from releasecab_api.tenant.helpers import TenantHelpers
+    from releasecab_api.tenant.models import Tenant
+    from releasecab_api.user.models import User
+
+    tenant = Tenant.objects.create(
+        name='Benchmark', number_of_employees=50, invite_code='BENCHMARK')
+    TenantHelpers.set_default_data(tenant)
+    return User.objects.create(
+        email='benchmark@example.com', tenant=tenant, is_tenant_owner=True)
+
+
+def check_status(status, headers):
+    if not status.startswith('200'):
+        raise RuntimeError(f'Request failed with {status}')
+
+
+def run_worker(handler, path, token, requests, timings):
+    from django.test import RequestFactory
+
+    factory = RequestFactory()
+    for _ in range(requests):
+        environ = factory.get(
+            path, HTTP_AUTHORIZATION=f'Bearer {token}').environ
+        started = time.perf_counter()
+        response = handler(environ, check_status)
+        b''.join(response)
+        # Sends request_finished, where old connections are closed
+        response.close()
+        timings.append((time.perf_counter() - started) * 1000)
+    connections.close_all()
+
+
+def measure(path, token, workers, requests, conn_max_age):
+    '''
+    Returns (requests per second, p50 ms, p95 ms, connections opened)
+    '''
+    from django.core.handlers.wsgi import WSGIHandler
+
+    # Every thread's connection is built from these settings
+    connections.settings['default']['CONN_MAX_AGE'] = conn_max_age
+    handler = WSGIHandler()
+    opened = []
+
+    def count_connection(sender, **kwargs):
+        opened.append(1)
+
+    connection_created.connect(count_connection)
+    timings = [[] for _ in range(workers)]
+    threads = [
+        threading.Thread(
+            target=run_worker,
+            args=(handler, path, token, requests, worker_timings))
+        for worker_timings in timings]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    connection_created.disconnect(count_connection)
+    all_timings = sorted(
+        timing for worker_timings in timings for timing in worker_timings)
+    return (
+        len(all_timings) / elapsed,
+        statistics.median(all_timings),
+        all_timings[int(len(all_timings) * 0.95)],
+        len(opened))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument(
+        '--requests', type=int, default=200, help='Requests per worker')
+    parser.add_argument('--conn-max-age', type=int, default=60)
+    args = parser.parse_args()
+
+    django.setup()
+    from django.urls import reverse
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    setup_test_environment()
+    test_database = connection.creation.create_test_db(verbosity=0)
+    try:
+        token = str(AccessToken.for_user(create_user()))
+        connection.close()
+        print(f'{args.workers} workers, {args.requests} requests each, '
+              f'against {test_database}')
+        print(f"{'view':<28}{'CONN_MAX_AGE':<14}{'req/s':>9}"
+              f"{'p50 ms':>9}{'p95 ms':>9}{'opened':>8}")
+        for name in ('communication-unread-count', 'release-list'):
+            path = reverse(name)
+            # Warm up imports and caches before timing anything
+            measure(path, token, 1, 20, 0)
+            for conn_max_age in (0, args.conn_max_age):
+                throughput, p50, p95, opened = measure(
+                    path, token, args.workers, args.requests, conn_max_age)
+                print(f'{name:<28}{conn_max_age:<14}{throughput:>9.0f}'
+                      f'{p50:>9.2f}{p95:>9.2f}{opened:>8}')
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(test_database, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''
+Compare the latency of read-only views with and without the
+ATOMIC_REQUESTS transaction around them. In a transaction each request
+also pays for the COMMIT round trip, so the gap grows with the latency
+to the database server.
+
+Runs against a throwaway test database, so it needs the same database
+settings as the test suite. From the releasecab_api directory:
+
+    python benchmarks/read_view_transactions.py --requests 500
+'''
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+import django
+from django.db import connection, transaction
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'releasecab_api.settings')
+
+
+def create_data():
+    from releasecab_api.release.models import (Release, ReleaseStage,
+                                               ReleaseType)
+    from releasecab_api.tenant.helpers import TenantHelpers
+    from releasecab_api.tenant.models import Tenant
+    from releasecab_api.user.models import User
+
+    tenant = Tenant.objects.create(
+        name='Benchmark', number_of_employees=50, invite_code='BENCHMARK')
+    TenantHelpers.set_default_data(tenant)
+    user = User.objects.create(
+        email='benchmark@example.com', tenant=tenant, is_tenant_owner=True)
+    stage = ReleaseStage.objects.filter(tenant=tenant).first()
+    release_type = ReleaseType.objects.filter(tenant=tenant).first()
+    now = timezone.now()
+    Release.objects.bulk_create([
+        Release(
+            tenant=tenant,
+            identifier=f'REL{number:05d}',
+            name=f'Release {number}',
+            owner=user,
+            release_type=release_type,
+            current_stage=stage,
+            start_date=now + timedelta(days=number),
+            end_date=now + timedelta(days=number, hours=2))
+        for number in range(100)])
+    return user
+
+
+def measure(views, user, requests):
+    '''
+    Time the views against each other, taking turns so that they all see
+    the same conditions. Returns (mean, p50, p95) in ms per view
+    '''
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    factory = APIRequestFactory()
+    timings = [[] for _ in views]
+    for _ in range(requests):
+        for view, view_timings in zip(views, timings):
+            request = factory.get('/')
+            force_authenticate(request, user=user)
+            started = time.perf_counter()
+            view(request).render()
+            view_timings.append((time.perf_counter() - started) * 1000)
+    results = []
+    for view_timings in timings:
+        view_timings.sort()
+        results.append((
+            statistics.mean(view_timings),
+            view_timings[len(view_timings) // 2],
+            view_timings[int(len(view_timings) * 0.95)]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    django.setup()
+    from releasecab_api.communication.views import CommunicationUnreadCount
+    from releasecab_api.release.views.release_views import ReleaseTenantList
+
+    setup_test_environment()
+    test_database = connection.creation.create_test_db(verbosity=0)
+    try:
+        user = create_data()
+        print(f'{args.requests} requests per view against {test_database}')
+        print(f"{'view':<28}{'transaction':<14}"
+              f"{'mean ms':>9}{'p50 ms':>9}{'p95 ms':>9}")
+        for view_class in (ReleaseTenantList, CommunicationUnreadCount):
+            read_only = view_class.as_view()
+            # What the request handler does with ATOMIC_REQUESTS
+            atomic = transaction.atomic(read_only)
+            measure([atomic, read_only], user, 20)
+            results = measure([atomic, read_only], user, args.requests)
+            for label, (mean, p50, p95) in zip(('atomic', 'none'), results):
+                print(f'{view_class.__name__:<28}{label:<14}'
+                      f'{mean:>9.2f}{p50:>9.2f}{p95:>9.2f}')
+    finally:
+        connection.creation.destroy_test_db(test_database, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
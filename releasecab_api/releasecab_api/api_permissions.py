@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 
-from releasecab_api.user.models import Team
+from releasecab_api.user.principal import Principal
 
 
 class IsAdminPermission(BasePermission):
@@ -28,9 +28,7 @@ class CanCreateBlackoutsPermission(BasePermission):
     """
 
     def has_permission(self, request, view):
-        user_teams = Team.objects.filter(
-            members=request.user, can_create_blackouts=True)
-        return user_teams.exists() or request.user.is_tenant_owner
+        return Principal.for_user(request.user).can_create_blackouts
 
 
 class CanCreateReleasesPermission(BasePermission):
@@ -40,9 +38,7 @@ class CanCreateReleasesPermission(BasePermission):
     """
 
     def has_permission(self, request, view):
-        user_teams = Team.objects.filter(
-            members=request.user, can_create_releases=True)
-        return user_teams.exists() or request.user.is_tenant_owner
+        return Principal.for_user(request.user).can_create_releases
 
 
 class IsTenantOwnerOrTeamManager(BasePermission):
@@ -51,17 +47,10 @@ class IsTenantOwnerOrTeamManager(BasePermission):
     """
 
     def has_permission(self, request, view):
-        user = request.user
-        if user.is_tenant_owner:
-            return True
-        if user.teams_as_manager.exists():
-            return True
-        return False
+        principal = Principal.for_user(request.user)
+        return principal.is_tenant_owner or principal.is_manager
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        if user.is_tenant_owner:
-            return True
-        if obj.managers.filter(id=user.id).exists():
-            return True
-        return False
+        principal = Principal.for_user(request.user)
+        return principal.is_tenant_owner or \
+            obj.id in principal.managed_team_ids
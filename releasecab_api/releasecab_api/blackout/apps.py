@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BlackoutConfig(AppConfig):
     name = 'releasecab_api.blackout'
+
+    def ready(self):
+        import releasecab_api.blackout.signals  # noqa
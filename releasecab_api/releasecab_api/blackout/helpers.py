@@ -0,0 +1,109 @@
+from math import ceil
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from releasecab_api.cache_versions import bump_cache_version, get_cache_version
+from releasecab_api.db_router import primary_reads
+
+from .models import Blackout
+
+
+class BlackoutHelpers:
+    '''
+    Helpers to answer which blackouts are active or coming up for a tenant
+    '''
+    # Upper bound on how long a schedule with nothing coming up is cached
+    SCHEDULE_CACHE_TIMEOUT = 60 * 60 * 24
+
+    @classmethod
+    def get_schedule(cls, tenant_id):
+        '''
+        Every blackout of the tenant that had not ended when the schedule
+        was built, ordered by start date, for the dashboard. It is cached
+        until the next blackout starts or ends, or until a blackout is
+        changed
+        '''
+        now = timezone.now()
+        version = get_cache_version('blackout-schedule', tenant_id)
+        key = f'blackout-schedule:{tenant_id}:{version}'
+        schedule = cache.get(key)
+        if schedule is not None and (
+                schedule['changes_at'] is None or
+                now <= schedule['changes_at']):
+            return schedule
+
+        with primary_reads():
+            windows = list(Blackout.objects.filter(
+                tenant_id=tenant_id,
+                end_date__gte=now,
+            ).order_by('start_date', 'id').calendar_values())
+        changes_at = min(
+            [window['start_date'] if window['start_date'] > now
+             else window['end_date'] for window in windows],
+            default=None)
+        schedule = {
+            'changes_at': changes_at,
+            'windows': windows,
+        }
+        timeout = cls.SCHEDULE_CACHE_TIMEOUT
+        if changes_at is not None:
+            timeout = min(
+                timeout, max(1, ceil((changes_at - now).total_seconds())))
+        cache.set(key, schedule, timeout=timeout)
+        return schedule
+
+    @classmethod
+    def get_state(cls, tenant_id, environment_id=None):
+        '''
+        The blackouts active right now and the next one to start, for the
+        whole tenant or only those covering one release environment
+        '''
+        now = timezone.now()
+        windows = [
+            window for window in cls.get_schedule(tenant_id)['windows']
+            if environment_id is None or
+            environment_id in window['release_environment_ids']]
+        upcoming = [
+            window for window in windows if window['start_date'] > now]
+        return {
+            'active': [
+                window for window in windows
+                if window['start_date'] <= now <= window['end_date']],
+            'next': upcoming[0] if upcoming else None,
+        }
+
+    @staticmethod
+    def get_overlapping(tenant_id, start_date, end_date,
+                        environment_ids=None):
+        '''
+        Blackouts overlapping start_date to end_date, optionally only
+        those sharing one of environment_ids. Writes are validated against
+        this, so it always reads the database instead of the schedule,
+        which another worker may not have invalidated yet
+        '''
+        blackouts = Blackout.objects.filter(
+            tenant_id=tenant_id,
+        ).overlapping(start_date, end_date)
+        if environment_ids is not None:
+            # A subquery, so every environment is still aggregated
+            blackouts = blackouts.filter(pk__in=Blackout.objects.filter(
+                release_environment__in={int(pk) for pk in environment_ids},
+            ).values('pk'))
+        return list(
+            blackouts.order_by('start_date', 'id').calendar_values())
+
+    @staticmethod
+    def get_active_status(start_date, end_date, now=None):
+        if not start_date or not end_date:
+            return ''
+        now = now or timezone.now()
+        if now < start_date:
+            return 'future'
+        elif start_date <= now <= end_date:
+            return 'active'
+        return 'expired'
+
+    @staticmethod
+    def invalidate_schedule(tenant_id):
+        bump_cache_version('blackout-schedule', tenant_id)
@@ -0,0 +1,35 @@
+from django.db import models
+from django.db.models import Case, CharField, Q, Value, When
+
+from releasecab_api.calendar_feeds import CalendarQuerySetMixin
+
+
+class BlackoutQuerySet(CalendarQuerySetMixin, models.QuerySet):
+    def with_active_status(self, now):
+        '''
+        Annotate active_status the same way BlackoutHelpers.get_active_status
+        works it out, against a single point in time
+        '''
+        return self.annotate(
+            active_status=Case(
+                When(start_date__gt=now, then=Value('future')),
+                When(end_date__gte=now, then=Value('active')),
+                default=Value('expired'),
+                output_field=CharField(),
+            )
+        )
+
+    def with_status(self, statuses, now):
+        '''
+        Only blackouts in one of the given active_status values. Filters on
+        the dates themselves so the window index can still be used
+        '''
+        conditions = {
+            'future': Q(start_date__gt=now),
+            'active': Q(start_date__lte=now, end_date__gte=now),
+            'expired': Q(end_date__lt=now),
+        }
+        status_filter = Q(pk__in=[])
+        for status in statuses:
+            status_filter |= conditions[status]
+        return self.filter(status_filter)
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blackout', '0002_initial'),
+        ('release', '0006_alter_releaseconfig_initial_stage'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blackout',
+            index=models.Index(
+                fields=[
+                    'tenant',
+                    'name',
+                    'id'],
+                name='blackout_tenant_name_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blackout', '0003_blackout_blackout_tenant_name_idx'),
+        ('release', '0007_release_release_tenant_name_idx'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blackout',
+            index=models.Index(
+                fields=[
+                    'tenant',
+                    'start_date',
+                    'end_date'],
+                name='blackout_tenant_window_idx'),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:04
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.db.models.deletion
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.core.management.base import CommandError
+from django.db import migrations, models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+
+
+def find_invalid_blackouts(blackouts):
+    '''
+    Blackouts ending before they start, and pairs of blackouts overlapping
+    in a release environment they share. Older validation let both in, and
+    neither can be stored as a window
+    '''
+    problems = [
+        f"'{blackout.name}' (id {blackout.id}) ends before it starts"
+        for blackout in blackouts if blackout.end_date < blackout.start_date]
+    by_environment = {}
+    for blackout in blackouts:
+        if blackout.end_date < blackout.start_date:
+            continue
+        for release_environment in blackout.release_environment.all():
+            by_environment.setdefault(
+                release_environment, []).append(blackout)
+    for release_environment, environment_blackouts in by_environment.items():
+        environment_blackouts.sort(key=lambda blackout: (
+            blackout.start_date, blackout.id))
+        # The blackout reaching furthest so far, every later one starting
+        # before it ends overlaps it
+        latest = None
+        for blackout in environment_blackouts:
+            if latest is not None and blackout.start_date <= latest.end_date:
+                problems.append(
+                    f"'{latest.name}' (id {latest.id}) and "
+                    f"'{blackout.name}' (id {blackout.id}) overlap in "
+                    f"'{release_environment.name}' "
+                    f"(id {release_environment.id}) of tenant "
+                    f"{blackout.tenant_id}")
+            if latest is None or blackout.end_date > latest.end_date:
+                latest = blackout
+    return problems
+
+
+def create_blackout_windows(apps, schema_editor):
+    Blackout = apps.get_model('blackout', 'Blackout')
+    BlackoutWindow = apps.get_model('blackout', 'BlackoutWindow')
+    blackouts = list(Blackout.objects.prefetch_related('release_environment'))
+    problems = find_invalid_blackouts(blackouts)
+    if problems:
+        raise CommandError(
+            'Blackout windows can not overlap within a release environment. '
+            'Change the dates or environments of these blackouts, or delete '
+            'them, and run migrate again:\n  ' + '\n  '.join(problems))
+    for blackout in blackouts:
+        BlackoutWindow.objects.bulk_create([
+            BlackoutWindow(
+                tenant_id=blackout.tenant_id,
+                blackout=blackout,
+                release_environment=release_environment,
+                window=DateTimeTZRange(
+                    blackout.start_date, blackout.end_date, '[]'))
+            for release_environment in blackout.release_environment.all()
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blackout', '0004_blackout_blackout_tenant_window_idx'),
+        ('release', '0010_release_identifier_sequence'),
+        ('tenant', '0001_initial'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name='BlackoutWindow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                 primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('window', django.contrib.postgres.fields.ranges.DateTimeRangeField()),
+                ('blackout',
+                 models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                   related_name='windows',
+                                   to='blackout.blackout')),
+                ('release_environment', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE, to='release.releaseenvironment')),
+                ('tenant', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE, to='tenant.tenant')),
+            ],
+        ),
+        migrations.RunPython(
+            create_blackout_windows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='blackoutwindow',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                expressions=[
+                    ('tenant',
+                     '='),
+                    ('release_environment',
+                     '='),
+                    ('window',
+                     '&&')],
+                name='blackout_window_no_overlap'),
+        ),
+    ]
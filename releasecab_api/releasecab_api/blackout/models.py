@@ -1,12 +1,18 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 from django.utils.translation import gettext_lazy as _
 
 from releasecab_api.base_model import BaseReleaseCabModel
 from releasecab_api.release.models import ReleaseEnvironment
 
+from .managers import BlackoutQuerySet
+
 
 class Blackout(BaseReleaseCabModel):
+    objects = BlackoutQuerySet.as_manager()
     name = models.CharField(max_length=50,
                             help_text="The name of the blackout.")
     description = models.TextField(
@@ -23,6 +29,18 @@ class Blackout(BaseReleaseCabModel):
         on_delete=models.PROTECT,
         help_text="The owner of the blackout.")
 
+    class Meta:
+        indexes = [
+            # Keyset pagination over the default blackout list ordering
+            models.Index(
+                fields=['tenant', 'name', 'id'],
+                name='blackout_tenant_name_idx'),
+            # Calendar windows
+            models.Index(
+                fields=['tenant', 'start_date', 'end_date'],
+                name='blackout_tenant_window_idx'),
+        ]
+
     def clean(self):
         """
         Validate that the start date is before the end date.
@@ -32,5 +50,54 @@ class Blackout(BaseReleaseCabModel):
             raise ValidationError(
                 _('End date should be after the start date.'))
 
+    def get_window(self):
+        return DateTimeTZRange(self.start_date, self.end_date, '[]')
+
+    def sync_windows(self):
+        """
+        Rewrite this blackout's BlackoutWindow rows from its dates and
+        environments. Signals call this on every save and environment change
+        """
+        self.windows.all().delete()
+        window = self.get_window()
+        BlackoutWindow.objects.bulk_create([
+            BlackoutWindow(
+                tenant_id=self.tenant_id,
+                blackout=self,
+                release_environment_id=environment_id,
+                window=window)
+            for environment_id in self.release_environment.values_list(
+                'id', flat=True)
+        ])
+
     def __str__(self):
         return f"{self.name} ({self.start_date} - {self.end_date})"
+
+
+class BlackoutWindow(BaseReleaseCabModel):
+    """
+    A blackout's time range in one of its environments. Postgres rejects
+    two windows for the same tenant and environment that overlap
+    """
+    blackout = models.ForeignKey(
+        Blackout,
+        on_delete=models.CASCADE,
+        related_name='windows')
+    release_environment = models.ForeignKey(
+        ReleaseEnvironment,
+        on_delete=models.CASCADE)
+    window = DateTimeRangeField()
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name='blackout_window_no_overlap',
+                expressions=[
+                    ('tenant', RangeOperators.EQUAL),
+                    ('release_environment', RangeOperators.EQUAL),
+                    ('window', RangeOperators.OVERLAPS),
+                ]),
+        ]
+
+    def __str__(self):
+        return f"{self.blackout} in {self.release_environment}"
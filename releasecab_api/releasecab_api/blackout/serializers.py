@@ -1,8 +1,16 @@
-from django.db.models import Q
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from .helpers import BlackoutHelpers
+from .models import Blackout, BlackoutWindow
 
-from .models import Blackout
+# SQLSTATE Postgres raises when an exclusion constraint is violated
+EXCLUSION_VIOLATION = '23P01'
 
 
 class BlackoutSerializer(serializers.ModelSerializer):
@@ -10,6 +18,8 @@ class BlackoutSerializer(serializers.ModelSerializer):
     active_status = serializers.SerializerMethodField()
     release_environment = serializers.SerializerMethodField()
 
+    OVERLAP_MESSAGE = "This blackout overlaps with an existing one."
+
     class Meta:
         model = Blackout
         fields = '__all__'
@@ -23,25 +33,40 @@ class BlackoutSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         release_environments_data = self.context['request'].data.get(
             'release_environment', None)
-        if release_environments_data is not None:
-            instance.release_environment.set(release_environments_data)
-        instance = super().update(instance, validated_data)
-        if release_environments_data is not None:
-            instance.release_environment.clear()
-            for release_environment in release_environments_data:
-                instance.release_environment.add(release_environment)
+        with self.overlap_guard():
+            instance = super().update(instance, validated_data)
+            if release_environments_data is not None:
+                instance.release_environment.set(release_environments_data)
         return instance
 
     def create(self, validated_data):
-        blackout = Blackout.objects.create(
-            **validated_data)
         release_environments_data = self.context['request'].data.get(
             'release_environment', None)
-        if release_environments_data is not None:
-            for release_environment in release_environments_data:
-                blackout.release_environment.add(release_environment)
+        with self.overlap_guard():
+            blackout = Blackout.objects.create(
+                **validated_data)
+            if release_environments_data is not None:
+                blackout.release_environment.set(release_environments_data)
         return blackout
 
+    @contextmanager
+    def overlap_guard(self):
+        """
+        The exclusion constraint on BlackoutWindow catches overlaps that
+        validate() could not see, such as two requests saving at once
+        """
+        try:
+            with transaction.atomic():
+                yield
+        except IntegrityError as e:
+            # psycopg2 calls the SQLSTATE pgcode, psycopg 3 sqlstate
+            sqlstate = getattr(e.__cause__, 'pgcode', None) or \
+                getattr(e.__cause__, 'sqlstate', None)
+            if sqlstate != EXCLUSION_VIOLATION:
+                raise
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [self.OVERLAP_MESSAGE]})
+
     def validate(self, data):
         data.pop('tenant', None)
         current_date = timezone.now()
@@ -54,27 +79,17 @@ class BlackoutSerializer(serializers.ModelSerializer):
             if start_date < current_date or end_date < current_date:
                 raise serializers.ValidationError(
                     "Dates cannot be in the past.")
-        if self.instance is None:
-            existing_blackouts = Blackout.objects.filter(
-                Q(start_date__lt=end_date, end_date__gt=start_date) |
-                Q(start_date__gte=start_date, start_date__lt=end_date) |
-                Q(end_date__gte=start_date, end_date__lt=end_date),
-                tenant=self.context['request'].user.tenant,
-                release_environment__in=self.context['request'].data.get(
-                    'release_environment', [])
-            )
-        else:
-            existing_blackouts = Blackout.objects.filter(
-                Q(start_date__lt=end_date, end_date__gt=start_date) |
-                Q(start_date__gte=start_date, start_date__lt=end_date) |
-                Q(end_date__gte=start_date, end_date__lt=end_date),
-                tenant=self.context['request'].user.tenant,
-                release_environment__in=self.context['request'].data.get(
-                    'release_environment', [])
-            ).exclude(pk=self.instance.pk)
-        if existing_blackouts.exists():
-            raise serializers.ValidationError(
-                "This blackout overlaps with an existing one.")
+        existing_windows = BlackoutWindow.objects.filter(
+            tenant=self.context['request'].user.tenant,
+            release_environment__in=self.context['request'].data.get(
+                'release_environment', []),
+            window__overlap=DateTimeTZRange(start_date, end_date, '[]'),
+        )
+        if self.instance is not None:
+            existing_windows = existing_windows.exclude(
+                blackout=self.instance)
+        if existing_windows.exists():
+            raise serializers.ValidationError(self.OVERLAP_MESSAGE)
         return data
 
     def get_owner_name(self, obj):
@@ -83,16 +98,11 @@ class BlackoutSerializer(serializers.ModelSerializer):
         return None
 
     def get_active_status(self, obj):
-        now = timezone.now()
-        start_date, end_date = obj.start_date, obj.end_date
-        if start_date and end_date:
-            if now < start_date:
-                return 'future'
-            elif start_date <= now <= end_date:
-                return 'active'
-            else:
-                return 'expired'
-        return ''
+        # Lists annotate it in SQL, against the same time they sorted on
+        if hasattr(obj, 'active_status'):
+            return obj.active_status
+        return BlackoutHelpers.get_active_status(
+            obj.start_date, obj.end_date)
 
     def get_release_environment(self, obj):
         return [{'value': env.pk, 'label': str(env)}
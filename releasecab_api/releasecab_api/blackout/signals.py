@@ -0,0 +1,50 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .helpers import BlackoutHelpers
+from .models import Blackout, BlackoutWindow
+
+
+@receiver(post_save, sender=Blackout)
+@receiver(post_delete, sender=Blackout)
+@receiver(m2m_changed, sender=Blackout.release_environment.through)
+def blackout_schedule_changed(sender, instance, *args, **kwargs):
+    """
+    Any change to a blackout or its environments rebuilds the tenant's
+    cached schedule
+    """
+    BlackoutHelpers.invalidate_schedule(instance.tenant_id)
+
+
+@receiver(post_save, sender=Blackout)
+def blackout_saved(sender, instance, created, *args, **kwargs):
+    """
+    Move the blackout's windows to its new dates. A new blackout has no
+    environments yet
+    """
+    if not created:
+        instance.sync_windows()
+
+
+@receiver(m2m_changed, sender=Blackout.release_environment.through)
+def blackout_environments_changed(
+        sender,
+        instance,
+        action,
+        reverse,
+        pk_set,
+        *args,
+        **kwargs):
+    """
+    Keep one BlackoutWindow per blackout and environment, from either side
+    of the relation
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.sync_windows()
+    elif action == 'post_clear':
+        BlackoutWindow.objects.filter(release_environment=instance).delete()
+    else:
+        for blackout in Blackout.objects.filter(pk__in=pk_set):
+            blackout.sync_windows()
@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from releasecab_api.release.models import ReleaseEnvironment
+from releasecab_api.tenant.models import Tenant
+from releasecab_api.user.models import User
+
+from ..helpers import BlackoutHelpers
+from ..models import Blackout
+
+
+class TestBlackoutHelpers(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=50,
+            invite_code="OTHER123")
+        self.user = User.objects.create(
+            email="user@example.com",
+            password="password456",
+            tenant=self.tenant)
+        self.environment = ReleaseEnvironment.objects.create(
+            name="Production",
+            tenant=self.tenant)
+        self.other_environment = ReleaseEnvironment.objects.create(
+            name="Staging",
+            tenant=self.tenant)
+
+    def create_blackout(self, name, start, end, tenant=None,
+                        environments=()):
+        blackout = Blackout.objects.create(
+            name=name,
+            description="Test Description",
+            start_date=start,
+            end_date=end,
+            tenant=tenant or self.tenant,
+            owner=self.user)
+        blackout.release_environment.set(environments)
+        return blackout
+
+    def test_get_state_is_tenant_scoped(self):
+        now = timezone.now()
+        self.create_blackout(
+            "Other Freeze", now - timedelta(hours=1),
+            now + timedelta(hours=1), tenant=self.other_tenant)
+        state = BlackoutHelpers.get_state(self.tenant.id)
+        self.assertEqual(state['active'], [])
+        self.assertIsNone(state['next'])
+        state = BlackoutHelpers.get_state(self.other_tenant.id)
+        self.assertEqual(
+            [window['name'] for window in state['active']],
+            ["Other Freeze"])
+
+    def test_get_state_active_and_next_per_environment(self):
+        now = timezone.now()
+        self.create_blackout(
+            "Freeze", now - timedelta(hours=1), now + timedelta(hours=1),
+            environments=[self.environment])
+        self.create_blackout(
+            "Later", now + timedelta(days=2), now + timedelta(days=3),
+            environments=[self.other_environment])
+        self.create_blackout(
+            "Soon", now + timedelta(days=1), now + timedelta(days=2),
+            environments=[self.environment])
+        self.create_blackout(
+            "Over", now - timedelta(days=2), now - timedelta(days=1),
+            environments=[self.environment])
+
+        state = BlackoutHelpers.get_state(self.tenant.id)
+        self.assertEqual(
+            [window['name'] for window in state['active']], ["Freeze"])
+        self.assertEqual(state['next']['name'], "Soon")
+        state = BlackoutHelpers.get_state(
+            self.tenant.id, self.other_environment.id)
+        self.assertEqual(state['active'], [])
+        self.assertEqual(state['next']['name'], "Later")
+
+    def test_schedule_cached_until_next_change(self):
+        now = timezone.now()
+        self.create_blackout(
+            "Soon", now + timedelta(hours=1), now + timedelta(hours=2))
+        schedule = BlackoutHelpers.get_schedule(self.tenant.id)
+        self.assertEqual(schedule['changes_at'], now + timedelta(hours=1))
+        with self.assertNumQueries(0):
+            BlackoutHelpers.get_state(self.tenant.id)
+
+    def test_schedule_rebuilt_when_blackouts_change(self):
+        now = timezone.now()
+        BlackoutHelpers.get_state(self.tenant.id)
+        blackout = self.create_blackout(
+            "Freeze", now - timedelta(hours=1), now + timedelta(hours=1))
+        self.assertEqual(
+            len(BlackoutHelpers.get_state(self.tenant.id)['active']), 1)
+        blackout.delete()
+        self.assertEqual(
+            BlackoutHelpers.get_state(self.tenant.id)['active'], [])
+
+    def test_get_overlapping_filters_environments(self):
+        now = timezone.now()
+        self.create_blackout(
+            "Freeze", now + timedelta(days=1), now + timedelta(days=2),
+            environments=[self.environment])
+        overlapping = BlackoutHelpers.get_overlapping(
+            self.tenant.id,
+            now + timedelta(days=1, hours=1),
+            now + timedelta(days=1, hours=2),
+            [self.environment.id])
+        self.assertEqual(
+            [window['name'] for window in overlapping], ["Freeze"])
+        self.assertEqual(BlackoutHelpers.get_overlapping(
+            self.tenant.id,
+            now + timedelta(days=1, hours=1),
+            now + timedelta(days=1, hours=2),
+            [self.other_environment.id]), [])
+
+    def test_get_overlapping_looks_up_past_windows(self):
+        now = timezone.now()
+        self.create_blackout(
+            "Over", now - timedelta(days=2), now - timedelta(days=1),
+            environments=[self.environment])
+        overlapping = BlackoutHelpers.get_overlapping(
+            self.tenant.id,
+            now - timedelta(days=3),
+            now - timedelta(days=1, hours=12),
+            [self.environment.id])
+        self.assertEqual(
+            [window['name'] for window in overlapping], ["Over"])
+
+    def test_get_overlapping_ignores_stale_schedule(self):
+        now = timezone.now()
+        BlackoutHelpers.get_schedule(self.tenant.id)
+        # A worker on its own per process cache never sees the version bump
+        version_key = f'blackout-schedule:{self.tenant.id}:version'
+        version = cache.get(version_key)
+        self.create_blackout(
+            "New", now + timedelta(days=1), now + timedelta(days=2),
+            environments=[self.environment, self.other_environment])
+        cache.set(version_key, version, timeout=None)
+        self.assertEqual(BlackoutHelpers.get_state(self.tenant.id)['next'],
+                         None)
+        overlapping = BlackoutHelpers.get_overlapping(
+            self.tenant.id,
+            now + timedelta(days=1, hours=1),
+            now + timedelta(days=1, hours=2),
+            [self.environment.id])
+        self.assertEqual(
+            [window['name'] for window in overlapping], ["New"])
+        self.assertEqual(
+            overlapping[0]['release_environment_ids'],
+            sorted([self.environment.id, self.other_environment.id]))
+
+    def test_get_active_status(self):
+        now = timezone.now()
+        self.assertEqual(BlackoutHelpers.get_active_status(
+            now + timedelta(hours=1), now + timedelta(hours=2), now),
+            'future')
+        self.assertEqual(BlackoutHelpers.get_active_status(
+            now - timedelta(hours=1), now + timedelta(hours=1), now),
+            'active')
+        self.assertEqual(BlackoutHelpers.get_active_status(
+            now - timedelta(hours=2), now - timedelta(hours=1), now),
+            'expired')
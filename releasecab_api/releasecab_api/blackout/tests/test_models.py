@@ -1,4 +1,5 @@
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from django.utils import timezone
 
@@ -6,7 +7,7 @@ from releasecab_api.release.models import ReleaseEnvironment
 from releasecab_api.tenant.models import Tenant
 from releasecab_api.user.models import User
 
-from ..models import Blackout
+from ..models import Blackout, BlackoutWindow
 
 
 class BlackoutModelTest(TestCase):
@@ -70,3 +71,65 @@ class BlackoutModelTest(TestCase):
         self.assertEqual(
             str(blackout),
             "Test Blackout ({} - {})".format(start_date, end_date))
+
+
+class BlackoutWindowModelTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.environment = ReleaseEnvironment.objects.create(
+            name="Test Environment",
+            tenant=self.tenant)
+        self.other_environment = ReleaseEnvironment.objects.create(
+            name="Other Environment",
+            tenant=self.tenant)
+        self.user = User.objects.create(
+            email="test@example.com",
+            password="password123",
+            tenant=self.tenant)
+        self.start_date = timezone.now()
+
+    def create_blackout(self, hours_from_start, hours):
+        start_date = self.start_date + timezone.timedelta(
+            hours=hours_from_start)
+        return Blackout.objects.create(
+            name="Test Blackout",
+            description="Test Description",
+            start_date=start_date,
+            end_date=start_date + timezone.timedelta(hours=hours),
+            tenant=self.tenant,
+            owner=self.user)
+
+    def test_windows_follow_environments_and_dates(self):
+        blackout = self.create_blackout(0, 1)
+        blackout.release_environment.add(
+            self.environment, self.other_environment)
+        self.assertEqual(blackout.windows.count(), 2)
+        blackout.end_date = self.start_date + timezone.timedelta(hours=3)
+        blackout.save()
+        self.assertEqual(
+            {window.window.upper for window in blackout.windows.all()},
+            {blackout.end_date})
+        blackout.release_environment.remove(self.other_environment)
+        self.assertEqual(
+            list(blackout.windows.values_list(
+                'release_environment', flat=True)),
+            [self.environment.pk])
+        blackout.release_environment.clear()
+        self.assertFalse(BlackoutWindow.objects.exists())
+
+    def test_overlapping_windows_rejected_per_environment(self):
+        self.create_blackout(0, 2).release_environment.add(self.environment)
+        self.create_blackout(1, 2).release_environment.add(
+            self.other_environment)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_blackout(1, 2).release_environment.add(
+                self.environment)
+
+    def test_touching_windows_overlap(self):
+        self.create_blackout(0, 1).release_environment.add(self.environment)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_blackout(1, 1).release_environment.add(
+                self.environment)
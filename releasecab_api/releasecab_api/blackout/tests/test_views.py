@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import AccessToken
@@ -158,6 +159,46 @@ class BlackoutViewsTest(TestCase):
                 pk=self.blackout.pk).name,
             "Updated Blackout Name")
 
+    def test_user_cannot_create_overlapping_blackout_failure(self):
+        self.blackout.release_environment.add(self.environment)
+        url = reverse('blackout-create')
+        payload = {
+            "name": "Test Blackout 2",
+            "description": "Test Description 2",
+            "start_date": datetime.now() + timedelta(hours=1, minutes=30),
+            "end_date": datetime.now() + timedelta(hours=3),
+            "release_environment": [self.environment.pk]
+        }
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['non_field_errors'],
+            ["This blackout overlaps with an existing one."])
+        self.assertEqual(Blackout.objects.count(), 1)
+
+    def test_admin_cannot_move_blackout_onto_another_failure(self):
+        self.blackout.release_environment.add(self.environment)
+        later_blackout = Blackout.objects.create(
+            name="Later Blackout",
+            description="Test Description",
+            start_date=datetime.now() + timedelta(hours=5),
+            end_date=datetime.now() + timedelta(hours=6),
+            tenant=self.tenant,
+            owner=self.admin_user
+        )
+        later_blackout.release_environment.add(self.environment)
+        url = reverse('blackout-update', kwargs={'id': later_blackout.pk})
+        # The environments are left out, so only the constraint sees it
+        payload = {
+            "start_date": datetime.now() + timedelta(hours=1),
+            "end_date": datetime.now() + timedelta(hours=6),
+        }
+        response = self.client.put(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['non_field_errors'],
+            ["This blackout overlaps with an existing one."])
+
     def test_user_cannot_update_blackout_failure(self):
         self.client.credentials(
             HTTP_AUTHORIZATION=f'Bearer \
@@ -191,3 +232,126 @@ class BlackoutViewsTest(TestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(Blackout.objects.count(), 1)
+
+    def test_user_can_page_blackouts_with_cursor_success(self):
+        for i in range(25):
+            Blackout.objects.create(
+                name="Paged Blackout",
+                description="Test Description",
+                start_date=datetime.now() + timedelta(days=i),
+                end_date=datetime.now() + timedelta(days=i, hours=1),
+                tenant=self.tenant,
+                owner=self.admin_user
+            )
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {
+            'pagination': 'cursor',
+            'sort_by': 'name',
+            'order_by': 'desc'})
+        names = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names += [blackout['name']
+                      for blackout in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+        self.assertEqual(len(names), 26)
+        self.assertEqual(names[0], "Test Blackout")
+
+    def test_user_cannot_cursor_page_blackouts_unsupported_sort_failure(self):
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {
+            'pagination': 'cursor',
+            'sort_by': 'description'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def create_status_blackouts(self):
+        now = timezone.now()
+        for name, start_hours in [("Over", -3), ("Now", -1), ("Soon", 3)]:
+            Blackout.objects.create(
+                name=name,
+                description="Test Description",
+                start_date=now + timedelta(hours=start_hours),
+                end_date=now + timedelta(hours=start_hours + 2),
+                tenant=self.tenant,
+                owner=self.admin_user
+            )
+
+    def test_user_can_sort_blackouts_by_status_success(self):
+        self.create_status_blackouts()
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {
+            'sort_by': 'active_status',
+            'order_by': 'desc'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [blackout['active_status']
+             for blackout in response.data['results']],
+            ['future', 'future', 'expired', 'active'])
+        self.assertEqual(response.data['results'][3]['name'], "Now")
+
+    def test_user_can_cursor_page_blackouts_by_status_success(self):
+        self.create_status_blackouts()
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {
+            'pagination': 'cursor',
+            'sort_by': 'active_status'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [blackout['name'] for blackout in response.data['results']],
+            ["Now", "Over", "Test Blackout", "Soon"])
+
+    def test_user_can_filter_blackouts_by_status_success(self):
+        self.create_status_blackouts()
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {'status': 'active,future'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [blackout['name'] for blackout in response.data['results']],
+            ["Now", "Soon", "Test Blackout"])
+        response = self.client.get(url, {'status': 'expired'})
+        self.assertEqual(
+            [blackout['name'] for blackout in response.data['results']],
+            ["Over"])
+
+    def test_user_cannot_list_blackouts_invalid_params_failure(self):
+        url = reverse('blackout-tenant-list')
+        response = self.client.get(url, {'sort_by': 'description'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(url, {'status': 'cancelled'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_user_can_retrieve_calendar_blackouts_in_window_success(self):
+        Blackout.objects.create(
+            name="Next Month Blackout",
+            description="Test Description",
+            start_date=datetime.now() + timedelta(days=30),
+            end_date=datetime.now() + timedelta(days=31),
+            tenant=self.tenant,
+            owner=self.admin_user
+        )
+        url = reverse('calendar-blackout-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        response = self.client.get(url, {
+            'from': datetime.now().date().isoformat(),
+            'to': (datetime.now() + timedelta(days=7)).date().isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [blackout['name'] for blackout in response.data],
+            ["Test Blackout"])
+
+    def test_user_can_retrieve_compact_calendar_blackouts_success(self):
+        self.blackout.release_environment.add(self.environment)
+        url = reverse('calendar-blackout-list')
+        response = self.client.get(url, {'compact': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            'id': self.blackout.id,
+            'name': 'Test Blackout',
+            'start_date': Blackout.objects.get().start_date,
+            'end_date': Blackout.objects.get().end_date,
+            'release_environment_ids': [self.environment.id],
+        }])
@@ -1,8 +1,8 @@
-from django.db.models import Case, CharField, Value, When
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import ParseError
 from rest_framework.generics import (CreateAPIView, DestroyAPIView,
                                      ListAPIView, RetrieveAPIView,
                                      UpdateAPIView)
@@ -12,6 +12,9 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import (CanCreateBlackoutsPermission,
                                             IsAdminPermission)
+from releasecab_api.calendar_feeds import CalendarViewMixin
+from releasecab_api.pagination import KeysetPagination
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..communication.helpers import CommunicationHelpers
 from .models import Blackout
@@ -67,7 +70,7 @@ class BlackoutCreate(CreateAPIView):
             False)
 
 
-class BlackoutRetrieve(RetrieveAPIView):
+class BlackoutRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a blackout by id. Automatically checks the blackout
     exists just for that tenant.
@@ -137,65 +140,65 @@ class BlackoutUpdateView(UpdateAPIView):
                 status=status.HTTP_403_FORBIDDEN)
 
 
-class BlackoutTenantList(ListAPIView):
+class BlackoutTenantList(ReadOnlyViewMixin, ListAPIView):
     """
-    GET a list of all blackouts for that tenant
+    GET a list of all blackouts for that tenant, sorted on any of
+    sort_fields. Pass status=active,future to only get blackouts in those
+    states, and pagination=cursor for keyset pagination
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     serializer_class = BlackoutSerializer
+    sort_fields = [
+        'name',
+        'start_date',
+        'end_date',
+        'created_at',
+        'active_status',
+        'id']
+    statuses = ['active', 'future', 'expired']
 
     def get_queryset(self):
         tenant = self.request.user.tenant
-        blackouts = Blackout.objects.filter(tenant=tenant)
+        now = timezone.now()
+        blackouts = Blackout.objects.filter(
+            tenant=tenant).with_active_status(now)
         sort_by = self.request.query_params.get('sort_by', 'name')
         order = self.request.query_params.get('order_by', 'asc')
         if order not in ['asc', 'desc']:
             order = 'asc'
-        blackouts = blackouts.annotate(
-            active_status=Case(
-                When(
-                    start_date__lte=timezone.now(),
-                    end_date__gte=timezone.now(),
-                    then=Value('active')
-                ),
-                When(
-                    start_date__gt=timezone.now(),
-                    then=Value('future')
-                ),
-                When(
-                    end_date__lt=timezone.now(),
-                    then=Value('expired')
-                ),
-                default=Value(''),
-                output_field=CharField()
-            )
-        )
-        if sort_by == 'active_status':
-            def key(x): return x.active_status
-        else:
-            def key(x): return getattr(x, sort_by)
-        if order == 'asc':
-            blackouts = sorted(blackouts, key=key)
-        else:
-            blackouts = sorted(blackouts, key=key, reverse=True)
-
-        return blackouts
-
-
-class BlackoutTenantCalendarList(ListAPIView):
+        if sort_by not in self.sort_fields:
+            raise ParseError(f"Cannot sort by '{sort_by}'.")
+        status_param = self.request.query_params.get('status')
+        if status_param:
+            statuses = status_param.split(',')
+            for blackout_status in statuses:
+                if blackout_status not in self.statuses:
+                    raise ParseError(
+                        f"'{blackout_status}' is not a blackout status.")
+            blackouts = blackouts.with_status(statuses, now)
+        if KeysetPagination.is_requested(self.request):
+            self.pagination_class = KeysetPagination
+        ordering = [sort_by] if sort_by == 'id' else [sort_by, 'id']
+        if order == 'desc':
+            ordering = [f'-{field}' for field in ordering]
+        return blackouts.order_by(*ordering)
+
+
+class BlackoutTenantCalendarList(ReadOnlyViewMixin, CalendarViewMixin,
+                                 ListAPIView):
     """
-    GET a list of all blackouts for that tenant
+    GET a list of all blackouts for that tenant. Pass from/to to only get
+    the blackouts that overlap that window, and compact=true to only get
+    the fields a calendar cell needs
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     serializer_class = BlackoutSerializer
     pagination_class = None
 
-    def get_queryset(self):
-        tenant = self.request.user.tenant
-        blackouts = Blackout.objects.filter(tenant=tenant).order_by('name')
-        return blackouts
+    def get_calendar_queryset(self):
+        return Blackout.objects.filter(tenant=self.request.user.tenant)
 
 
 class BlackoutDeleteAPIView(DestroyAPIView):
@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _version_key(namespace, tenant_id):
+    return f'{namespace}:{tenant_id}:version'
+
+
+def get_cache_version(namespace, tenant_id):
+    '''
+    The current version of a tenant's cached data in a namespace. Cache
+    keys built with it go stale together when the version is bumped
+    '''
+    return cache.get_or_set(
+        _version_key(namespace, tenant_id), uuid4().hex, timeout=None)
+
+
+def bump_cache_version(namespace, tenant_id):
+    '''
+    Move the tenant onto a new version. It is bumped again once the
+    transaction commits, so anything cached by other requests while it was
+    still open is dropped as well
+    '''
+    def bump_version():
+        cache.set(
+            _version_key(namespace, tenant_id), uuid4().hex, timeout=None)
+
+    bump_version()
+    transaction.on_commit(bump_version)
@@ -0,0 +1,73 @@
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import Q, Value
+from rest_framework.response import Response
+
+from releasecab_api.date_window import get_date_window
+
+
+class CalendarQuerySetMixin:
+    '''
+    Shared by the querysets of everything shown on the calendar, which all
+    have start and end dates and release environments
+    '''
+    # What a calendar cell needs besides the environment ids
+    calendar_fields = ('id', 'name', 'start_date', 'end_date')
+
+    def overlapping(self, window_start=None, window_end=None):
+        '''
+        Rows that overlap the window. A missing bound is open ended
+        '''
+        queryset = self
+        if window_end is not None:
+            queryset = queryset.filter(start_date__lte=window_end)
+        if window_start is not None:
+            queryset = queryset.filter(end_date__gte=window_start)
+        return queryset
+
+    def calendar_values(self):
+        '''
+        Plain dicts holding only the calendar_fields, with the environment
+        ids aggregated in the same query
+        '''
+        return self.annotate(
+            release_environment_ids=ArrayAgg(
+                'release_environment',
+                distinct=True,
+                ordering='release_environment',
+                filter=Q(release_environment__isnull=False),
+                default=Value(
+                    [], output_field=ArrayField(models.BigIntegerField()))),
+        ).values(*self.calendar_fields, 'release_environment_ids')
+
+
+class CalendarViewMixin:
+    '''
+    For list views feeding the calendar. Only rows overlapping the from/to
+    window are listed, and compact=true returns their calendar_values()
+    as they are instead of going through the serializer
+    '''
+
+    def is_compact(self):
+        compact = self.request.query_params.get('compact', 'false')
+        return compact.lower() == 'true'
+
+    def get_calendar_queryset(self):
+        '''
+        Everything the user may see on the calendar, before windowing
+        '''
+        raise NotImplementedError
+
+    def get_queryset(self):
+        window_start, window_end = get_date_window(self.request)
+        queryset = self.get_calendar_queryset().overlapping(
+            window_start, window_end).order_by('name')
+        if self.is_compact():
+            return queryset.calendar_values()
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        if self.is_compact():
+            return Response(list(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from .models import Communication
+from .models import (ArchivedCommunication, Communication, OutboxEmail,
+                     PendingNotification)
 
 
 class CommunicationAdmin(admin.ModelAdmin):
@@ -12,3 +13,37 @@ class CommunicationAdmin(admin.ModelAdmin):
 
 
 admin.site.register(Communication, CommunicationAdmin)
+
+
+class OutboxEmailAdmin(admin.ModelAdmin):
+    model = OutboxEmail
+    list_display = (
+        'to_email', 'subject', 'attempts', 'next_attempt_at', 'sent_at')
+
+    list_filter = ('sent_at',)
+    search_fields = ('to_email', 'subject')
+
+
+admin.site.register(OutboxEmail, OutboxEmailAdmin)
+
+
+class PendingNotificationAdmin(admin.ModelAdmin):
+    model = PendingNotification
+    list_display = ('to_user', 'message_title', 'created_at')
+
+    list_filter = ('to_user',)
+    search_fields = ('message_title', 'message_body')
+
+
+admin.site.register(PendingNotification, PendingNotificationAdmin)
+
+
+class ArchivedCommunicationAdmin(admin.ModelAdmin):
+    model = ArchivedCommunication
+    list_display = ('to_user', 'message_title', 'created_at', 'archived_at')
+
+    list_filter = ('to_user',)
+    search_fields = ('message_title', 'message_body')
+
+
+admin.site.register(ArchivedCommunication, ArchivedCommunicationAdmin)
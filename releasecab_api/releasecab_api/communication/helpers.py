@@ -1,34 +1,337 @@
+import time
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import DurationField, ExpressionWrapper, F, Min, QuerySet
+from django.utils import timezone
+
+from releasecab_api.user.models import User
+
+from .models import (ArchivedCommunication, Communication, OutboxEmail,
+                     PendingNotification)
 
-from .models import Communication
+# Give up on an email after this many failed sends
+OUTBOX_MAX_ATTEMPTS = 8
+# Seconds before the first retry, doubling after every further failure
+OUTBOX_RETRY_DELAY = 60
+OUTBOX_MAX_RETRY_DELAY = 60 * 60 * 6
 
 
 class CommunicationHelpers:
     '''
     Helpers to create communications and send emails
     '''
-    DEBUG = settings.DEBUG
     FROM_EMAIL = settings.FROM_EMAIL
 
     @classmethod
     def create_new_message(cls, users, title, body, send_email):
-        for user in list(set(users)):
-            new_communication = Communication(
-                to_user=user,
-                tenant=user.tenant,
+        '''
+        Message every one of the users, given as User instances, user ids
+        or a queryset of users. Recipients are deduplicated by the database
+        and read back as plain values, and all of the messages are written
+        with one bulk_create however many users there are. Users who get
+        digests have the message held back for DigestHelpers instead
+        '''
+        recipients = cls._get_recipients(users)
+        immediate = [
+            recipient for recipient in recipients if not recipient[3]]
+        Communication.objects.bulk_create([
+            Communication(
+                to_user_id=user_id,
+                tenant_id=tenant_id,
                 message_title=title,
                 message_body=body)
-            new_communication.save()
-            if send_email:
-                cls._send_email(user.email, title, body)
-
-    @classmethod
-    def _send_email(cls, to_email, title, body):
-        if not cls.DEBUG:
-            send_mail(
-                title,
-                body,
-                cls.FROM_EMAIL,
-                [to_email, ],
-            )
+            for user_id, tenant_id, _, _ in immediate])
+        PendingNotification.objects.bulk_create([
+            PendingNotification(
+                to_user_id=user_id,
+                tenant_id=tenant_id,
+                message_title=title,
+                message_body=body,
+                send_email=send_email)
+            for user_id, tenant_id, _, digest_minutes in recipients
+            if digest_minutes])
+        if send_email:
+            cls.queue_emails([
+                (tenant_id, email, title, body)
+                for _, tenant_id, email, _ in immediate])
+
+    @staticmethod
+    def _get_recipients(users):
+        '''
+        (id, tenant id, email, digest minutes) for each distinct user, in
+        one query
+        '''
+        if isinstance(users, QuerySet):
+            user_ids = users.values('pk')
+        else:
+            user_ids = {getattr(user, 'pk', user) for user in users}
+            if not user_ids:
+                return []
+        return list(User.objects.filter(
+            pk__in=user_ids,
+        ).order_by('pk').values_list(
+            'id', 'tenant_id', 'email', 'notification_digest_minutes'))
+
+    @classmethod
+    def queue_emails(cls, emails):
+        '''
+        Add (tenant id, to email, subject, body) emails to the outbox with
+        one insert. With DEBUG on they are still queued, and the console
+        email backend prints them when the outbox is sent
+        '''
+        return OutboxEmail.objects.bulk_create([
+            OutboxEmail(
+                tenant_id=tenant_id,
+                to_email=to_email,
+                from_email=cls.FROM_EMAIL,
+                subject=subject,
+                body=body)
+            for tenant_id, to_email, subject, body in emails])
+
+    @classmethod
+    def queue_email(cls, tenant_id, to_email, subject, body):
+        '''
+        Add an email to the outbox. It is only sent once the surrounding
+        transaction commits, by the send_outbox command
+        '''
+        [email] = cls.queue_emails([(tenant_id, to_email, subject, body)])
+        return email
+
+
+class DigestHelpers:
+    '''
+    Helpers to roll the notifications held back for digest users into one
+    summary message each
+    '''
+
+    @staticmethod
+    def get_due_user_ids(now):
+        '''
+        Users whose oldest pending notification has waited out their
+        digest window, as a subquery
+        '''
+        digest_window = ExpressionWrapper(
+            F('to_user__notification_digest_minutes') * timedelta(minutes=1),
+            output_field=DurationField())
+        return PendingNotification.objects.values('to_user').annotate(
+            due_at=Min('created_at') + digest_window,
+        ).filter(due_at__lte=now).values('to_user')
+
+    @staticmethod
+    def summarize(notifications):
+        '''
+        The title and body of one user's digest. A single notification is
+        passed on as it was
+        '''
+        if len(notifications) == 1:
+            return notifications[0]['message_title'], \
+                notifications[0]['message_body']
+        title = f'You Have {len(notifications)} New Notifications'
+        body = '\n'.join(
+            f"- {notification['message_title']}"
+            for notification in notifications)
+        return title, body
+
+    @classmethod
+    def send_digests(cls, now=None):
+        '''
+        Send every due digest and return how many users got one. The work
+        is a fixed handful of queries however many users and notifications
+        are pending: one to claim the rows, one insert each for the
+        messages and emails, and one delete
+        '''
+        now = now or timezone.now()
+        with transaction.atomic():
+            pending = list(PendingNotification.objects.select_for_update(
+                skip_locked=True, of=('self',),
+            ).filter(
+                to_user__in=cls.get_due_user_ids(now),
+                created_at__lte=now,
+            ).order_by('to_user', 'created_at', 'id').values(
+                'id',
+                'tenant_id',
+                'to_user_id',
+                'to_user__email',
+                'message_title',
+                'message_body',
+                'send_email',
+            ))
+            if not pending:
+                return 0
+
+            messages = []
+            emails = []
+            for user_id, notifications in groupby(
+                    pending, key=itemgetter('to_user_id')):
+                notifications = list(notifications)
+                tenant_id = notifications[0]['tenant_id']
+                title, body = cls.summarize(notifications)
+                messages.append(Communication(
+                    to_user_id=user_id,
+                    tenant_id=tenant_id,
+                    message_title=title,
+                    message_body=body))
+                if any(notification['send_email']
+                       for notification in notifications):
+                    emails.append((
+                        tenant_id,
+                        notifications[0]['to_user__email'],
+                        title,
+                        body))
+
+            Communication.objects.bulk_create(messages)
+            CommunicationHelpers.queue_emails(emails)
+            PendingNotification.objects.filter(
+                id__in=[notification['id'] for notification in pending],
+            ).delete()
+        return len(messages)
+
+
+class OutboxHelpers:
+    '''
+    Helpers to deliver the emails queued in the outbox
+    '''
+
+    @staticmethod
+    def get_retry_delay(attempts):
+        return timedelta(seconds=min(
+            OUTBOX_RETRY_DELAY * 2 ** (attempts - 1),
+            OUTBOX_MAX_RETRY_DELAY))
+
+    @classmethod
+    def send_batch(cls, batch_size=100, now=None):
+        '''
+        Send up to batch_size due emails over a single connection to the
+        mail server and return how many were picked up. Rows are locked
+        with SKIP LOCKED, so several workers can drain the outbox at once.
+        A failed email is retried later with exponential backoff, until it
+        has been tried OUTBOX_MAX_ATTEMPTS times
+        '''
+        now = now or timezone.now()
+        with transaction.atomic():
+            emails = list(OutboxEmail.objects.select_for_update(
+                skip_locked=True,
+            ).filter(
+                sent_at__isnull=True,
+                next_attempt_at__lte=now,
+                attempts__lt=OUTBOX_MAX_ATTEMPTS,
+            ).order_by('next_attempt_at', 'id')[:batch_size])
+            if not emails:
+                return 0
+
+            connection = get_connection()
+            try:
+                connection.open()
+            except Exception as error:
+                for email in emails:
+                    cls._record_failure(email, error, now)
+            else:
+                try:
+                    for email in emails:
+                        cls._send(connection, email, now)
+                finally:
+                    connection.close()
+
+            OutboxEmail.objects.bulk_update(
+                emails,
+                ['attempts', 'next_attempt_at', 'sent_at', 'last_error'])
+        return len(emails)
+
+    @classmethod
+    def send_all(cls, batch_size=100):
+        '''
+        Send batches until nothing is due, returning how many emails were
+        picked up in total
+        '''
+        total = 0
+        while True:
+            picked_up = cls.send_batch(batch_size)
+            total += picked_up
+            if picked_up < batch_size:
+                return total
+
+    @classmethod
+    def _send(cls, connection, email, now):
+        message = EmailMessage(
+            email.subject,
+            email.body,
+            email.from_email,
+            [email.to_email],
+            connection=connection)
+        try:
+            message.send()
+        except Exception as error:
+            cls._record_failure(email, error, now)
+        else:
+            email.attempts += 1
+            email.sent_at = now
+            email.last_error = ''
+
+    @classmethod
+    def _record_failure(cls, email, error, now):
+        email.attempts += 1
+        email.next_attempt_at = now + cls.get_retry_delay(email.attempts)
+        email.last_error = f'{type(error).__name__}: {error}'
+
+
+class RetentionHelpers:
+    '''
+    Helpers to apply the communication retention policy. Work is done in
+    small batches, each in its own short transaction, so a large backlog
+    never holds locks on the inbox for long or writes one huge transaction
+    '''
+
+    @staticmethod
+    def get_cutoff(days, now):
+        return now - timedelta(days=days) if days else None
+
+    @classmethod
+    def archive(cls, days=None, batch_size=1000, now=None, pause=0):
+        '''
+        Move communications older than days into the archive and return
+        how many were moved
+        '''
+        now = now or timezone.now()
+        if days is None:
+            days = settings.COMMUNICATION_RETENTION_DAYS
+        cutoff = cls.get_cutoff(days, now)
+        if cutoff is None:
+            return 0
+        return cls._run_batches(
+            lambda: Communication.objects.archive_batch(
+                cutoff, batch_size, now),
+            batch_size, pause)
+
+    @classmethod
+    def purge(cls, days=None, batch_size=1000, now=None, pause=0):
+        '''
+        Delete archived communications older than days and return how many
+        were deleted
+        '''
+        now = now or timezone.now()
+        if days is None:
+            days = settings.COMMUNICATION_ARCHIVE_DAYS
+        cutoff = cls.get_cutoff(days, now)
+        if cutoff is None:
+            return 0
+        return cls._run_batches(
+            lambda: ArchivedCommunication.objects.purge_batch(
+                cutoff, batch_size),
+            batch_size, pause)
+
+    @staticmethod
+    def _run_batches(run_batch, batch_size, pause):
+        total = 0
+        while True:
+            with transaction.atomic():
+                done = run_batch()
+            total += done
+            if done < batch_size:
+                return total
+            if pause:
+                time.sleep(pause)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from ...helpers import RetentionHelpers
+
+
+class Command(BaseCommand):
+    help = ('Move old communications to the archive and delete expired '
+            'archived ones')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='Archive communications older than this many days. '
+                 'Defaults to COMMUNICATION_RETENTION_DAYS')
+        parser.add_argument(
+            '--archive-days',
+            type=int,
+            help='Delete archived communications older than this many days. '
+                 'Defaults to COMMUNICATION_ARCHIVE_DAYS')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='How many rows to move or delete in each transaction')
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='Seconds to wait between batches')
+
+    def handle(self, *args, **options):
+        archived = RetentionHelpers.archive(
+            days=options['retention_days'],
+            batch_size=options['batch_size'],
+            pause=options['pause'])
+        purged = RetentionHelpers.purge(
+            days=options['archive_days'],
+            batch_size=options['batch_size'],
+            pause=options['pause'])
+        self.stdout.write(
+            f'Archived {archived} communications, '
+            f'deleted {purged} archived communications')
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...helpers import DigestHelpers
+
+
+class Command(BaseCommand):
+    help = 'Send notification digests that are due'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running, checking for due digests every --interval '
+                 'seconds')
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=60,
+            help='Seconds to wait between checks when running with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            sent = DigestHelpers.send_digests()
+            if sent:
+                self.stdout.write(f'Sent {sent} notification digests')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+            # Recycle the connection between passes the same way requests
+            # do, so a long running loop survives the server dropping it
+            close_old_connections()
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...helpers import OutboxHelpers
+
+
+class Command(BaseCommand):
+    help = 'Send the emails waiting in the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='How many emails to send over each mail server connection')
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running, checking the outbox every --interval seconds')
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Seconds to wait between checks when running with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            picked_up = OutboxHelpers.send_all(options['batch_size'])
+            if picked_up:
+                self.stdout.write(f'Processed {picked_up} outbox emails')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+            # Recycle the connection between passes the same way requests
+            # do, so a long running loop survives the server dropping it
+            close_old_connections()
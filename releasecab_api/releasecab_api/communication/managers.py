@@ -0,0 +1,64 @@
+from django.apps import apps
+from django.db import connection, models
+from django.db.backends.postgresql.psycopg_any import sql
+
+# Every column an archived communication keeps, in the same order in both
+# tables
+ARCHIVED_COLUMNS = ('id', 'tenant_id', 'created_at', 'to_user_id',
+                    'message_title', 'message_body', 'read_at')
+
+
+class CommunicationManager(models.Manager):
+    def archive_batch(self, cutoff, batch_size, archived_at):
+        '''
+        Move up to batch_size communications created before the cutoff
+        into the archive table, oldest first, and return how many moved.
+        The delete and the insert are one statement, so a batch is never
+        half moved. Rows locked by someone else are left for the next run
+        '''
+        archive_model = apps.get_model(
+            'communication', 'ArchivedCommunication')
+        columns = sql.SQL(', ').join(map(sql.Identifier, ARCHIVED_COLUMNS))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL('''
+                WITH moved AS (
+                    DELETE FROM {table}
+                    WHERE id IN (
+                        SELECT id FROM {table}
+                        WHERE created_at < %s
+                        ORDER BY created_at, id
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED)
+                    RETURNING {columns}
+                )
+                INSERT INTO {archive_table} ({columns}, archived_at)
+                SELECT {columns}, %s FROM moved
+                ''').format(
+                    table=sql.Identifier(self.model._meta.db_table),
+                    archive_table=sql.Identifier(
+                        archive_model._meta.db_table),
+                    columns=columns),
+                [cutoff, batch_size, archived_at])
+            return cursor.rowcount
+
+
+class ArchivedCommunicationManager(models.Manager):
+    def purge_batch(self, cutoff, batch_size):
+        '''
+        Delete up to batch_size archived communications created before the
+        cutoff and return how many were deleted
+        '''
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL('''
+                DELETE FROM {table}
+                WHERE id IN (
+                    SELECT id FROM {table}
+                    WHERE created_at < %s
+                    ORDER BY created_at, id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED)
+                ''').format(table=sql.Identifier(self.model._meta.db_table)),
+                [cutoff, batch_size])
+            return cursor.rowcount
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communication', '0002_initial'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='communication',
+            index=models.Index(
+                fields=[
+                    'tenant',
+                    'to_user',
+                    '-created_at',
+                    '-id'],
+                name='communication_inbox_idx'),
+        ),
+    ]
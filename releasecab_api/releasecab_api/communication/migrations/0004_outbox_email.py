@@ -0,0 +1,32 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communication', '0003_communication_communication_inbox_idx'),
+        ('tenant', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEmail', fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True, primary_key=True, serialize=False, verbose_name='ID')), ('created_at', models.DateTimeField(
+                        auto_now_add=True)), ('to_email', models.EmailField(
+                            max_length=254)), ('from_email', models.EmailField(
+                                max_length=254)), ('subject', models.TextField()), ('body', models.TextField()), ('attempts', models.PositiveSmallIntegerField(
+                                    default=0)), ('next_attempt_at', models.DateTimeField(
+                                        default=django.utils.timezone.now)), ('sent_at', models.DateTimeField(
+                                            blank=True, null=True)), ('last_error', models.TextField(
+                                                blank=True, default='')), ('tenant', models.ForeignKey(
+                                                    on_delete=django.db.models.deletion.CASCADE, to='tenant.tenant')), ], options={
+                'indexes': [
+                    models.Index(
+                        condition=models.Q(
+                            ('sent_at__isnull', True)), fields=[
+                            'next_attempt_at', 'id'], name='outbox_email_pending_idx')], }, ), ]
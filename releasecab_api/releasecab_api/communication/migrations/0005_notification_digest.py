@@ -0,0 +1,54 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communication', '0004_outbox_email'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingNotification',
+            fields=[
+                ('id',
+                 models.BigAutoField(
+                     auto_created=True,
+                     primary_key=True,
+                     serialize=False,
+                     verbose_name='ID')),
+                ('created_at',
+                 models.DateTimeField(
+                     auto_now_add=True)),
+                ('message_title',
+                 models.TextField()),
+                ('message_body',
+                 models.TextField()),
+                ('send_email',
+                 models.BooleanField(
+                     default=False)),
+                ('tenant',
+                 models.ForeignKey(
+                     on_delete=django.db.models.deletion.CASCADE,
+                     to='tenant.tenant')),
+                ('to_user',
+                 models.ForeignKey(
+                     on_delete=django.db.models.deletion.CASCADE,
+                     to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        fields=[
+                            'to_user',
+                            'created_at'],
+                        name='pending_notification_user_idx')],
+            },
+        ),
+    ]
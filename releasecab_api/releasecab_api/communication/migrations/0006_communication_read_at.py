@@ -0,0 +1,35 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communication', '0005_notification_digest'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='communication',
+            name='read_at',
+            field=models.DateTimeField(
+                blank=True,
+                help_text='When the user read the message, empty while unread',
+                null=True),
+        ),
+        migrations.AddIndex(
+            model_name='communication',
+            index=models.Index(
+                condition=models.Q(
+                    ('read_at__isnull',
+                     True)),
+                fields=[
+                    'tenant',
+                    'to_user'],
+                name='communication_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communication', '0007_archived_communication'),
+        ('tenant', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedcommunication',
+            index=models.Index(
+                fields=[
+                    'created_at',
+                    'id'],
+                name='archived_communication_age_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='communication',
+            index=models.Index(
+                fields=[
+                    'created_at',
+                    'id'],
+                name='communication_age_idx'),
+        ),
+    ]
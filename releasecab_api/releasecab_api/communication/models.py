@@ -1,14 +1,112 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
 from releasecab_api.base_model import BaseReleaseCabModel
 
+from .managers import ArchivedCommunicationManager, CommunicationManager
+
 
 class Communication(BaseReleaseCabModel):
+    objects = CommunicationManager()
     to_user = models.ForeignKey('user.User', on_delete=models.PROTECT)
     message_title = models.TextField(
         help_text="Title of the message", blank=False)
     message_body = models.TextField(
         help_text="Body of the message", blank=False)
+    read_at = models.DateTimeField(
+        blank=True, null=True,
+        help_text="When the user read the message, empty while unread")
+
+    class Meta:
+        indexes = [
+            # Keyset pagination over a user's inbox, newest first
+            models.Index(
+                fields=['tenant', 'to_user', '-created_at', '-id'],
+                name='communication_inbox_idx'),
+            # Unread counts only ever touch the unread rows
+            models.Index(
+                fields=['tenant', 'to_user'],
+                condition=Q(read_at__isnull=True),
+                name='communication_unread_idx'),
+            # Retention archives the oldest rows first, in batches
+            models.Index(
+                fields=['created_at', 'id'],
+                name='communication_age_idx'),
+        ]
+
+    def __str__(self):
+        return self.to_user.__str__() + " " + self.message_title
+
+
+class ArchivedCommunication(BaseReleaseCabModel):
+    '''
+    A Communication past the retention period. Rows keep their original
+    id, created_at and read state, and drop out of the inbox
+    '''
+    objects = ArchivedCommunicationManager()
+    id = models.BigIntegerField(primary_key=True)
+    to_user = models.ForeignKey('user.User', on_delete=models.CASCADE)
+    message_title = models.TextField()
+    message_body = models.TextField()
+    read_at = models.DateTimeField(blank=True, null=True)
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            # Purging deletes the oldest rows first, in batches
+            models.Index(
+                fields=['created_at', 'id'],
+                name='archived_communication_age_idx'),
+        ]
 
     def __str__(self):
         return self.to_user.__str__() + " " + self.message_title
+
+
+class PendingNotification(BaseReleaseCabModel):
+    '''
+    A message held back for a user who receives digests. The send_digests
+    command rolls a user's pending notifications into one Communication
+    '''
+    to_user = models.ForeignKey('user.User', on_delete=models.CASCADE)
+    message_title = models.TextField()
+    message_body = models.TextField()
+    send_email = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['to_user', 'created_at'],
+                name='pending_notification_user_idx'),
+        ]
+
+    def __str__(self):
+        return self.to_user.__str__() + " " + self.message_title
+
+
+class OutboxEmail(BaseReleaseCabModel):
+    '''
+    An email waiting to be sent. Rows are written in the same transaction
+    as whatever caused them, and the send_outbox command delivers them
+    '''
+    to_email = models.EmailField()
+    from_email = models.EmailField()
+    subject = models.TextField()
+    body = models.TextField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        indexes = [
+            # The worker only ever looks at what is still to be sent
+            models.Index(
+                fields=['next_attempt_at', 'id'],
+                condition=Q(sent_at__isnull=True),
+                name='outbox_email_pending_idx'),
+        ]
+
+    def __str__(self):
+        return self.to_email + " " + self.subject
@@ -8,4 +8,16 @@ class CommunicationSerializer(serializers.ModelSerializer):
         model = Communication
         fields = '__all__'
         read_only_fields = [
-            'pk', 'tenant', 'created_at']
+            'pk', 'tenant', 'created_at', 'read_at']
+
+
+class MarkCommunicationsReadSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False)
+    all = serializers.BooleanField(default=False)
+
+    def validate(self, data):
+        if not data['all'] and not data.get('ids'):
+            raise serializers.ValidationError(
+                "Pass the ids to mark as read, or all.")
+        return data
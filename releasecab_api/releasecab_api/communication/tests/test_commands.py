@@ -0,0 +1,57 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from releasecab_api.tenant.models import Tenant
+from releasecab_api.user.models import User
+
+from ..helpers import CommunicationHelpers
+from ..models import ArchivedCommunication, Communication, OutboxEmail
+
+
+class SendOutboxCommandTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+
+    def test_send_outbox(self):
+        for number in range(3):
+            CommunicationHelpers.queue_email(
+                self.tenant.id, f"user{number}@example.com", "Hi", "Body")
+        out = StringIO()
+        call_command('send_outbox', '--batch-size', '2', stdout=out)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('Processed 3 outbox emails', out.getvalue())
+        self.assertFalse(
+            OutboxEmail.objects.filter(sent_at__isnull=True).exists())
+
+    @override_settings(
+        COMMUNICATION_RETENTION_DAYS=30, COMMUNICATION_ARCHIVE_DAYS=60)
+    def test_archive_communications(self):
+        user = User.objects.create(
+            email="user@example.com",
+            password="password123",
+            tenant=self.tenant)
+        for days_old in (10, 40, 70):
+            communication = Communication.objects.create(
+                to_user=user,
+                tenant=self.tenant,
+                message_title=f"{days_old} days old",
+                message_body="Body")
+            Communication.objects.filter(id=communication.id).update(
+                created_at=timezone.now() - timedelta(days=days_old))
+        out = StringIO()
+        call_command('archive_communications', stdout=out)
+        self.assertIn(
+            'Archived 2 communications, deleted 1 archived communications',
+            out.getvalue())
+        self.assertEqual(
+            Communication.objects.get().message_title, "10 days old")
+        self.assertEqual(
+            ArchivedCommunication.objects.get().message_title, "40 days old")
@@ -0,0 +1,298 @@
+from datetime import timedelta
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from releasecab_api.tenant.models import Tenant
+from releasecab_api.user.models import Team, User
+
+from ..helpers import (OUTBOX_MAX_ATTEMPTS, CommunicationHelpers,
+                       DigestHelpers, OutboxHelpers, RetentionHelpers)
+from ..models import (ArchivedCommunication, Communication, OutboxEmail,
+                      PendingNotification)
+
+
+class StandInSMTPBackend(EmailBackend):
+    '''
+    Stands in for a mail server: counts connections, refuses recipients
+    at bounce.example.com and can be made unreachable
+    '''
+    opened = 0
+    reachable = True
+
+    def open(self):
+        if not StandInSMTPBackend.reachable:
+            raise SMTPServerDisconnected('Connection unexpectedly closed')
+        StandInSMTPBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        for message in messages:
+            if any(to.endswith('@bounce.example.com') for to in message.to):
+                raise SMTPRecipientsRefused({message.to[0]: (550, b'No')})
+        return super().send_messages(messages)
+
+
+class CommunicationHelpersTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.users = [
+            User.objects.create(
+                email=f"user{number}@example.com",
+                password="password123",
+                tenant=self.tenant)
+            for number in range(5)]
+
+    def test_create_new_message_for_users(self):
+        with self.assertNumQueries(2):
+            CommunicationHelpers.create_new_message(
+                self.users + [self.users[0]], "Title", "Body", False)
+        messages = Communication.objects.order_by('to_user_id')
+        self.assertEqual(
+            [message.to_user_id for message in messages],
+            [user.id for user in self.users])
+        self.assertTrue(all(
+            message.tenant_id == self.tenant.id
+            and message.message_title == "Title"
+            and message.message_body == "Body"
+            for message in messages))
+
+    def test_create_new_message_for_user_ids(self):
+        user_ids = [self.users[1].id, self.users[2].id, self.users[1].id]
+        CommunicationHelpers.create_new_message(
+            user_ids, "Title", "Body", False)
+        self.assertEqual(
+            set(Communication.objects.values_list('to_user_id', flat=True)),
+            {self.users[1].id, self.users[2].id})
+
+    def test_create_new_message_for_queryset(self):
+        team = Team.objects.create(name="Team", tenant=self.tenant)
+        team.members.add(*self.users[:3])
+        team.managers.add(self.users[0])
+        recipients = User.objects.filter(teams_as_member=team) | \
+            User.objects.filter(teams_as_manager=team)
+        with self.assertNumQueries(2):
+            CommunicationHelpers.create_new_message(
+                recipients, "Title", "Body", False)
+        self.assertEqual(Communication.objects.count(), 3)
+
+    def test_create_new_message_without_users(self):
+        with self.assertNumQueries(0):
+            CommunicationHelpers.create_new_message([], "Title", "Body", False)
+        self.assertFalse(Communication.objects.exists())
+
+
+class OutboxHelpersTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        StandInSMTPBackend.opened = 0
+        StandInSMTPBackend.reachable = True
+
+    def queue(self, to_email):
+        return CommunicationHelpers.queue_email(
+            self.tenant.id, to_email, "Subject", "Body")
+
+    def test_queue_email_does_not_send(self):
+        self.queue("user@example.com")
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboxEmail.objects.get().sent_at, None)
+
+    @override_settings(EMAIL_BACKEND=(
+        'releasecab_api.communication.tests.test_helpers.StandInSMTPBackend'))
+    def test_send_batch_reuses_one_connection(self):
+        for number in range(5):
+            self.queue(f"user{number}@example.com")
+        self.assertEqual(OutboxHelpers.send_batch(batch_size=3), 3)
+        self.assertEqual(StandInSMTPBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboxHelpers.send_all(batch_size=3), 2)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertFalse(
+            OutboxEmail.objects.filter(sent_at__isnull=True).exists())
+        self.assertEqual(OutboxHelpers.send_batch(), 0)
+
+    @override_settings(EMAIL_BACKEND=(
+        'releasecab_api.communication.tests.test_helpers.StandInSMTPBackend'))
+    def test_failed_email_is_retried_with_backoff(self):
+        bounced = self.queue("user@bounce.example.com")
+        delivered = self.queue("user@example.com")
+        now = timezone.now()
+        OutboxHelpers.send_batch(now=now)
+        bounced.refresh_from_db()
+        delivered.refresh_from_db()
+        self.assertIsNotNone(delivered.sent_at)
+        self.assertIsNone(bounced.sent_at)
+        self.assertEqual(bounced.attempts, 1)
+        self.assertIn('SMTPRecipientsRefused', bounced.last_error)
+        self.assertEqual(
+            bounced.next_attempt_at, now + OutboxHelpers.get_retry_delay(1))
+
+        # Not due again until the backoff has passed
+        self.assertEqual(OutboxHelpers.send_batch(now=now), 0)
+        later = now + OutboxHelpers.get_retry_delay(1)
+        self.assertEqual(OutboxHelpers.send_batch(now=later), 1)
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.attempts, 2)
+        self.assertGreater(
+            OutboxHelpers.get_retry_delay(2), OutboxHelpers.get_retry_delay(1))
+
+    @override_settings(EMAIL_BACKEND=(
+        'releasecab_api.communication.tests.test_helpers.StandInSMTPBackend'))
+    def test_unreachable_server_defers_batch(self):
+        email = self.queue("user@example.com")
+        StandInSMTPBackend.reachable = False
+        OutboxHelpers.send_batch()
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('SMTPServerDisconnected', email.last_error)
+
+    def test_gives_up_after_max_attempts(self):
+        email = self.queue("user@example.com")
+        email.attempts = OUTBOX_MAX_ATTEMPTS
+        email.save()
+        later = timezone.now() + timedelta(days=1)
+        self.assertEqual(OutboxHelpers.send_batch(now=later), 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class DigestHelpersTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.immediate_user = User.objects.create(
+            email="immediate@example.com",
+            password="password123",
+            tenant=self.tenant)
+        self.digest_users = [
+            User.objects.create(
+                email=f"digest{number}@example.com",
+                password="password123",
+                notification_digest_minutes=60,
+                tenant=self.tenant)
+            for number in range(4)]
+        self.users = [self.immediate_user] + self.digest_users
+
+    def test_digest_users_have_messages_held_back(self):
+        CommunicationHelpers.create_new_message(
+            self.users, "Release Updated", "Body", True)
+        self.assertEqual(
+            list(Communication.objects.values_list('to_user', flat=True)),
+            [self.immediate_user.id])
+        self.assertEqual(PendingNotification.objects.count(), 4)
+        self.assertEqual(
+            list(OutboxEmail.objects.values_list('to_email', flat=True)),
+            ["immediate@example.com"])
+
+    def test_send_digests_coalesces_per_user(self):
+        for number in range(3):
+            CommunicationHelpers.create_new_message(
+                self.users, f"Release {number} Updated", "Body", number == 1)
+        now = timezone.now()
+        self.assertEqual(DigestHelpers.send_digests(now=now), 0)
+
+        later = now + timedelta(minutes=61)
+        with self.assertNumQueries(6):
+            self.assertEqual(DigestHelpers.send_digests(now=later), 4)
+        self.assertFalse(PendingNotification.objects.exists())
+        digest = Communication.objects.get(to_user=self.digest_users[0])
+        self.assertEqual(
+            digest.message_title, "You Have 3 New Notifications")
+        self.assertEqual(
+            digest.message_body,
+            "- Release 0 Updated\n- Release 1 Updated\n- Release 2 Updated")
+        self.assertEqual(
+            OutboxEmail.objects.filter(
+                to_email="digest0@example.com").count(), 1)
+        self.assertEqual(
+            Communication.objects.filter(
+                to_user=self.immediate_user).count(), 3)
+        self.assertEqual(DigestHelpers.send_digests(now=later), 0)
+
+    def test_send_digests_waits_for_each_users_window(self):
+        User.objects.filter(pk=self.digest_users[0].pk).update(
+            notification_digest_minutes=5)
+        CommunicationHelpers.create_new_message(
+            self.digest_users, "Release Updated", "Body", False)
+        soon = timezone.now() + timedelta(minutes=6)
+        self.assertEqual(DigestHelpers.send_digests(now=soon), 1)
+        message = Communication.objects.get()
+        self.assertEqual(message.to_user, self.digest_users[0])
+        self.assertEqual(message.message_title, "Release Updated")
+        self.assertEqual(PendingNotification.objects.count(), 3)
+
+
+class RetentionHelpersTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.user = User.objects.create(
+            email="user@example.com",
+            password="password123",
+            tenant=self.tenant)
+        self.now = timezone.now()
+
+    def create_messages(self, count, days_old):
+        messages = Communication.objects.bulk_create([
+            Communication(
+                to_user=self.user,
+                tenant=self.tenant,
+                message_title=f"Title {number}",
+                message_body="Body")
+            for number in range(count)])
+        Communication.objects.filter(
+            id__in=[message.id for message in messages],
+        ).update(created_at=self.now - timedelta(days=days_old))
+        return messages
+
+    def test_archive_moves_old_messages_in_batches(self):
+        old = self.create_messages(5, days_old=100)
+        recent = self.create_messages(2, days_old=10)
+        Communication.objects.filter(id=old[0].id).update(read_at=self.now)
+
+        with CaptureQueriesContext(connection) as queries:
+            archived = RetentionHelpers.archive(
+                days=90, batch_size=2, now=self.now)
+        self.assertEqual(archived, 5)
+        self.assertEqual(
+            len([query for query in queries.captured_queries
+                 if 'WITH moved AS' in query['sql']]), 3)
+        self.assertEqual(
+            set(Communication.objects.values_list('id', flat=True)),
+            {message.id for message in recent})
+        archived_message = ArchivedCommunication.objects.get(id=old[0].id)
+        self.assertEqual(archived_message.read_at, self.now)
+        self.assertEqual(archived_message.archived_at, self.now)
+        self.assertEqual(
+            archived_message.created_at, self.now - timedelta(days=100))
+        self.assertEqual(archived_message.message_title, "Title 0")
+        self.assertEqual(archived_message.to_user, self.user)
+
+    def test_purge_deletes_expired_archive(self):
+        self.create_messages(3, days_old=400)
+        self.create_messages(2, days_old=100)
+        RetentionHelpers.archive(days=90, now=self.now)
+        self.assertEqual(
+            RetentionHelpers.purge(days=365, batch_size=2, now=self.now), 3)
+        self.assertEqual(ArchivedCommunication.objects.count(), 2)
+
+    def test_zero_days_keeps_everything(self):
+        self.create_messages(3, days_old=1000)
+        self.assertEqual(RetentionHelpers.archive(days=0, now=self.now), 0)
+        RetentionHelpers.archive(days=90, now=self.now)
+        self.assertEqual(RetentionHelpers.purge(days=0, now=self.now), 0)
+        self.assertEqual(ArchivedCommunication.objects.count(), 3)
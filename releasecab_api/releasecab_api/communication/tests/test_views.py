@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -89,3 +91,76 @@ class CommunicationViewTest(TestCase):
         self.assertEqual(response.data['to_user'], self.normal_user.id)
         self.assertEqual(response.data['message_title'], 'Normal Test Title')
         self.assertEqual(response.data['message_body'], 'Normal Test Body')
+
+    def test_communication_list_cursor_pagination(self):
+        Communication.objects.bulk_create([
+            Communication(
+                to_user=self.normal_user,
+                message_title=f'Title {i}',
+                message_body='Body',
+                tenant=self.tenant) for i in range(30)])
+        url = reverse('communication-user-list')
+        response = self.normal_client.get(url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNone(response.data['previous'])
+        next_page = self.normal_client.get(response.data['next'])
+        self.assertEqual(len(next_page.data['results']), 11)
+        self.assertIsNone(next_page.data['next'])
+        ids = [message['id'] for message in
+               response.data['results'] + next_page.data['results']]
+        self.assertEqual(ids, list(Communication.objects.filter(
+            to_user=self.normal_user).order_by(
+                '-created_at', '-id').values_list('id', flat=True)))
+
+    def create_messages(self, count):
+        return Communication.objects.bulk_create([
+            Communication(
+                to_user=self.normal_user,
+                message_title=f'Title {i}',
+                message_body='Body',
+                tenant=self.tenant) for i in range(count)])
+
+    def test_unread_count(self):
+        self.create_messages(3)
+        url = reverse('communication-unread-count')
+        response = self.normal_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 4)
+        response = self.admin_client.get(url)
+        self.assertEqual(response.data['count'], 1)
+
+    def test_mark_read_by_ids(self):
+        messages = self.create_messages(3)
+        url = reverse('communication-mark-read')
+        payload = {'ids': [messages[0].id, messages[1].id,
+                           self.admin_communication.id]}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.normal_client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [query['sql'].split()[0] for query in queries.captured_queries
+             if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))],
+            ['UPDATE'])
+        self.assertEqual(response.data['updated'], 2)
+        self.admin_communication.refresh_from_db()
+        self.assertIsNone(self.admin_communication.read_at)
+        response = self.normal_client.get(
+            reverse('communication-user-list'), {'unread': 'true'})
+        self.assertEqual(
+            {message['id'] for message in response.data['results']},
+            {messages[2].id, self.normal_communication.id})
+
+    def test_mark_all_read(self):
+        self.create_messages(3)
+        url = reverse('communication-mark-read')
+        response = self.normal_client.post(url, {'all': True}, format='json')
+        self.assertEqual(response.data['updated'], 4)
+        response = self.normal_client.get(
+            reverse('communication-unread-count'))
+        self.assertEqual(response.data['count'], 0)
+
+    def test_mark_read_requires_ids_or_all(self):
+        url = reverse('communication-mark-read')
+        response = self.normal_client.post(url, {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,7 +2,8 @@ from django.urls import path
 from rest_framework.urlpatterns import format_suffix_patterns
 
 from .views import (AdminCommunicationDetail, AdminCommunicationList,
-                    CommunicationRetrieve, CommunicationUserList)
+                    CommunicationMarkRead, CommunicationRetrieve,
+                    CommunicationUnreadCount, CommunicationUserList)
 
 urlpatterns = [
     # Admin
@@ -15,6 +16,10 @@ urlpatterns = [
          name='communication-user-list'),
     path('communication/<int:id>/', CommunicationRetrieve.as_view(),
          name='communication-retrieve'),
+    path('unread-count/', CommunicationUnreadCount.as_view(),
+         name='communication-unread-count'),
+    path('mark-read/', CommunicationMarkRead.as_view(),
+         name='communication-mark-read'),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -1,14 +1,19 @@
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import IsAdminPermission
+from releasecab_api.pagination import KeysetPagination
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from .models import Communication
-from .serializers import CommunicationSerializer
+from .serializers import (CommunicationSerializer,
+                          MarkCommunicationsReadSerializer)
 
 
 class AdminCommunicationList(ListAPIView):
@@ -33,23 +38,30 @@ class AdminCommunicationDetail(RetrieveAPIView):
     serializer_class = CommunicationSerializer
 
 
-class CommunicationUserList(ListAPIView):
+class CommunicationUserList(ReadOnlyViewMixin, ListAPIView):
     """
-    GET a list of all Communications for that tenant/user
+    GET a list of all Communications for that tenant/user, newest first.
+    Pass pagination=cursor for keyset pagination and unread=true for only
+    the unread ones
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     serializer_class = CommunicationSerializer
 
     def get_queryset(self):
+        if KeysetPagination.is_requested(self.request):
+            self.pagination_class = KeysetPagination
         tenant = self.request.user.tenant
         Communications = Communication.objects.filter(
             tenant=tenant, to_user=self.request.user).order_by('-created_at')
+        unread = self.request.query_params.get('unread', '')
+        if unread.lower() == 'true':
+            Communications = Communications.filter(read_at__isnull=True)
 
         return Communications
 
 
-class CommunicationRetrieve(RetrieveAPIView):
+class CommunicationRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a communication by id
     """
@@ -70,3 +82,40 @@ class CommunicationRetrieve(RetrieveAPIView):
             return Response(
                 {"error": "Communication not found."},
                 status=status.HTTP_404_NOT_FOUND)
+
+
+class CommunicationUnreadCount(ReadOnlyViewMixin, APIView):
+    """
+    GET how many unread Communications the user has
+    """
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [JWTAuthentication, SessionAuthentication]
+
+    def get(self, request):
+        count = Communication.objects.filter(
+            tenant=request.user.tenant_id,
+            to_user=request.user,
+            read_at__isnull=True).count()
+        return Response({'count': count})
+
+
+class CommunicationMarkRead(APIView):
+    """
+    POST the ids of the user's Communications to mark as read, or all to
+    mark every one of them, in a single update
+    """
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [JWTAuthentication, SessionAuthentication]
+
+    def post(self, request):
+        serializer = MarkCommunicationsReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        communications = Communication.objects.filter(
+            tenant=request.user.tenant_id,
+            to_user=request.user,
+            read_at__isnull=True)
+        if not serializer.validated_data['all']:
+            communications = communications.filter(
+                id__in=serializer.validated_data['ids'])
+        updated = communications.update(read_at=timezone.now())
+        return Response({'updated': updated})
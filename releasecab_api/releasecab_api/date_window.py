@@ -0,0 +1,37 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ParseError
+
+
+def get_date_window(request):
+    '''
+    Read the optional `from` and `to` query parameters calendar feeds use
+    to ask for a window of time. Both accept an ISO date or datetime, a
+    bare `to` date covers that whole day. Missing bounds come back as None
+    '''
+    window_start = _parse_bound(request, 'from', time.min)
+    window_end = _parse_bound(request, 'to', time.max)
+    if window_start and window_end and window_start > window_end:
+        raise ParseError("'from' must be before 'to'.")
+    return window_start, window_end
+
+
+def _parse_bound(request, param, default_time):
+    value = request.query_params.get(param)
+    if not value:
+        return None
+    try:
+        bound = parse_datetime(value)
+        if bound is None:
+            day = parse_date(value)
+            if day is not None:
+                bound = datetime.combine(day, default_time)
+    except ValueError:
+        bound = None
+    if bound is None:
+        raise ParseError(f"'{param}' must be an ISO 8601 date or datetime.")
+    if timezone.is_naive(bound):
+        bound = timezone.make_aware(bound)
+    return bound
@@ -0,0 +1,188 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.exceptions import (FieldDoesNotExist, ImproperlyConfigured,
+                                    ValidationError)
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the queryset's ordering plus the id.
+    The view orders the queryset as usual and this paginator adds `id` as
+    a tie-breaker, so every page is one index range scan with no OFFSET
+    and no COUNT, however deep into the list it is.
+    Every ordering column must be non-nullable.
+    """
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    @staticmethod
+    def is_requested(request):
+        '''
+        Views opt into keyset pagination with ?pagination=cursor
+        '''
+        return request.query_params.get('pagination', '') == 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+
+        position, reverse = self.decode_cursor(request, queryset)
+        if reverse:
+            ordering = [(field, not descending)
+                        for field, descending in self.ordering]
+        else:
+            ordering = self.ordering
+
+        queryset = queryset.order_by(*[
+            f'-{field}' if descending else field
+            for field, descending in ordering])
+        if position is not None:
+            queryset = queryset.filter(self.seek(ordering, position))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_ordering(self, queryset):
+        '''
+        Read the ordering the view applied and append the id tie-breaker.
+        Foreign keys are compared on their raw id column.
+        '''
+        ordering = []
+        for order in queryset.query.order_by or ('-created_at',):
+            if not isinstance(order, str):
+                raise ImproperlyConfigured(
+                    'KeysetPagination only supports ordering by field name.')
+            descending = order.startswith('-')
+            name = order.lstrip('-')
+            if name == 'pk':
+                name = 'id'
+            try:
+                field = queryset.model._meta.get_field(name)
+                if field.is_relation:
+                    name = field.attname
+            except FieldDoesNotExist:
+                # Annotations are compared by their alias
+                pass
+            ordering.append((name, descending))
+        if 'id' not in [name for name, _ in ordering]:
+            ordering.append(('id', ordering[0][1]))
+        return ordering
+
+    def seek(self, ordering, position):
+        '''
+        Build the "rows after this position" filter for a mixed-direction
+        ordering: (a > x) OR (a = x AND b > y) OR ...
+        '''
+        seek = Q()
+        for index, (field, descending) in enumerate(ordering):
+            lookup = 'lt' if descending else 'gt'
+            clause = Q(**{f'{field}__{lookup}': position[index]})
+            for prior_index, (prior_field, _) in enumerate(ordering[:index]):
+                clause &= Q(**{prior_field: position[prior_index]})
+            seek |= clause
+        return seek
+
+    def encode_cursor(self, instance, reverse):
+        position = [
+            self.encode_value(getattr(instance, field))
+            for field, _ in self.ordering]
+        token = urlsafe_b64encode(
+            json.dumps({'p': position, 'r': reverse}).encode('utf-8')
+        ).decode('ascii')
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, queryset):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            cursor = json.loads(urlsafe_b64decode(token.encode('ascii')))
+            position = cursor['p']
+            reverse = bool(cursor['r'])
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or \
+                len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [
+                self.decode_value(queryset, field, value)
+                for (field, _), value in zip(self.ordering, position)]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    @staticmethod
+    def decode_value(queryset, name, value):
+        '''
+        Convert a cursor value with the field it is compared against, so a
+        tampered cursor is turned away here instead of failing the query
+        '''
+        if value is None:
+            raise ValueError('Ordering columns are never null')
+        if name in queryset.query.annotations:
+            field = queryset.query.annotations[name].output_field
+        else:
+            field = next(
+                (field for field in queryset.model._meta.concrete_fields
+                 if field.attname == name), None)
+        if field is None:
+            return value
+        return field.to_python(value)
+
+    @staticmethod
+    def encode_value(value):
+        # isoformat keeps the microseconds that DjangoJSONEncoder drops
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
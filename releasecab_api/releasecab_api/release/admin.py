@@ -1,7 +1,8 @@
 from django.contrib import admin
 
 from .models import (Release, ReleaseComment, ReleaseConfig,
-                     ReleaseEnvironment, ReleaseStage, ReleaseStageConnection,
+                     ReleaseEnvironment, ReleaseIdentifierSequence,
+                     ReleaseStage, ReleaseStageConnection,
                      ReleaseStageConnectionApprover, ReleaseType)
 
 
@@ -36,6 +37,10 @@ class ReleaseConfigAdmin(admin.ModelAdmin):
     list_display = ('initial_stage',)
 
 
+class ReleaseIdentifierSequenceAdmin(admin.ModelAdmin):
+    list_display = ('tenant', 'prefix', 'padding', 'last_value')
+
+
 class ReleaseCommentAdmin(admin.ModelAdmin):
     list_display = ('comment_body', 'writer', 'release')
 
@@ -49,4 +54,7 @@ admin.site.register(
     ReleaseStageConnectionApprover,
     ReleaseStageConnectionApproverAdmin)
 admin.site.register(ReleaseConfig, ReleaseConfigAdmin)
+admin.site.register(
+    ReleaseIdentifierSequence,
+    ReleaseIdentifierSequenceAdmin)
 admin.site.register(ReleaseComment, ReleaseCommentAdmin)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ReleaseConfig(AppConfig):
     name = 'releasecab_api.release'
+
+    def ready(self):
+        import releasecab_api.release.signals  # noqa
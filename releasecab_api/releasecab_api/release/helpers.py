@@ -1,6 +1,4 @@
-from django.shortcuts import get_object_or_404
-
-from releasecab_api.user.models import Role, Team
+from releasecab_api.user.principal import Principal
 
 
 class ReleaseHelpers:
@@ -8,36 +6,37 @@ class ReleaseHelpers:
     Helpers for release related things
     '''
     @staticmethod
-    def is_user_in_role_connection(user, approver_roles):
+    def get_user_approver_ids(user):
+        '''
+        The ids of the user's roles and of the teams they are a member or
+        manager of, from the request's principal
+        '''
+        principal = Principal.for_user(user)
+        return principal.role_ids, principal.team_ids
+
+    @staticmethod
+    def get_approver_ids(approver_entries):
+        '''
+        Approver roles or teams come in as ids or as dicts with an id
+        '''
+        approver_ids = set()
+        for approver_info in approver_entries:
+            if isinstance(approver_info, dict):
+                approver_info = approver_info.get('id')
+            if approver_info:
+                approver_ids.add(int(approver_info))
+        return approver_ids
+
+    @classmethod
+    def is_user_in_role_connection(cls, user, approver_roles):
         if not approver_roles:
             return True  # Any role is good to go
-        for approver_role_info in approver_roles:
-            if isinstance(approver_role_info, dict):
-                approver_role_id = approver_role_info.get('id')
-                if approver_role_id:
-                    role = get_object_or_404(Role, id=approver_role_id)
-                    if user.role.filter(id=role.id).exists():
-                        return True  # User is in this role
-            elif isinstance(approver_role_info, int):
-                role = get_object_or_404(Role, id=approver_role_info)
-                if user.role.filter(id=role.id).exists():
-                    return True  # User is in this role
-        return False
+        role_ids, _ = cls.get_user_approver_ids(user)
+        return not role_ids.isdisjoint(cls.get_approver_ids(approver_roles))
 
-    @staticmethod
-    def is_user_in_team_connection(user, approver_teams):
+    @classmethod
+    def is_user_in_team_connection(cls, user, approver_teams):
         if not approver_teams:
             return True  # Any team is good to go
-        for approver_team_info in approver_teams:
-            if isinstance(approver_team_info, dict):
-                approver_team_id = approver_team_info.get('id')
-                if approver_team_id:
-                    team = get_object_or_404(Team, id=approver_team_id)
-                    if user in team.members.all() or \
-                            user in team.managers.all():
-                        return True  # User is in this team
-            elif isinstance(approver_team_info, int):
-                team = get_object_or_404(Team, id=approver_team_info)
-                if user in team.members.all() or user in team.managers.all():
-                    return True  # User is in this team
-        return False
+        _, team_ids = cls.get_user_approver_ids(user)
+        return not team_ids.isdisjoint(cls.get_approver_ids(approver_teams))
@@ -0,0 +1,80 @@
+from django.contrib.postgres.search import (SearchQuery, SearchRank,
+                                            SearchVector, TrigramSimilarity)
+from django.db import connection, models
+from django.db.backends.postgresql.psycopg_any import sql
+from django.db.models import Case, FloatField, Q, Value, When
+from django.utils import timezone
+
+from releasecab_api.calendar_feeds import CalendarQuerySetMixin
+
+
+class ReleaseQuerySet(CalendarQuerySetMixin, models.QuerySet):
+    calendar_fields = ('id', 'identifier', 'name', 'start_date', 'end_date',
+                       'current_stage_id')
+
+    def with_related(self):
+        '''
+        Join the foreign keys and prefetch the many to many fields that
+        the ReleaseSerializer renders, so a page of releases costs the
+        same number of queries no matter how many rows are on it
+        '''
+        return self.select_related(
+            'release_type',
+            'current_stage',
+            'next_stage',
+            'owner',
+        ).prefetch_related(
+            'release_environment',
+            'affected_teams',
+        )
+
+    def search(self, term):
+        '''
+        Rank releases against a typeahead search term. A release matches
+        on an identifier prefix, the term anywhere in its name, or a full
+        text match over its name and description. Each of those has its
+        own index, and exact identifier matches rank first
+        '''
+        # Must match release_search_vector_idx for the index to be used
+        vector = SearchVector('name', 'description', config='english')
+        query = SearchQuery(term, config='english', search_type='websearch')
+        return self.annotate(
+            search_vector=vector,
+        ).filter(
+            Q(identifier__istartswith=term) |
+            Q(name__icontains=term) |
+            Q(search_vector=query)
+        ).annotate(
+            rank=Case(
+                When(identifier__iexact=term, then=Value(2.0)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ) + SearchRank(vector, query) +
+            TrigramSimilarity('name', term),
+        ).order_by('-rank', 'name', 'id')
+
+
+class ReleaseIdentifierSequenceManager(models.Manager):
+    def next_identifier(self, tenant):
+        '''
+        Allocate the next release identifier for a tenant. The counter is
+        created on first use and bumped by a single upsert, so concurrent
+        creates queue on the tenant's row instead of racing each other
+        '''
+        defaults = {
+            field: self.model._meta.get_field(field).get_default()
+            for field in ('prefix', 'padding')}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL('''
+                INSERT INTO {table}
+                    (tenant_id, created_at, prefix, padding, last_value)
+                VALUES (%s, %s, %s, %s, 1)
+                ON CONFLICT (tenant_id) DO UPDATE
+                    SET last_value = {table}.last_value + 1
+                RETURNING prefix, padding, last_value
+                ''').format(table=sql.Identifier(self.model._meta.db_table)),
+                [tenant.pk, timezone.now(),
+                 defaults['prefix'], defaults['padding']])
+            prefix, padding, value = cursor.fetchone()
+        return self.model.format_identifier(prefix, padding, value)
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:55
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('release', '0008_release_release_tenant_window_idx'),
+        ('tenant', '0001_initial'),
+        ('user', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='release',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'),
+                    name='gin_trgm_ops'),
+                name='release_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='release',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('identifier'),
+                    name='gin_trgm_ops'),
+                name='release_identifier_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='release',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    'name',
+                    'description',
+                    config='english'),
+                name='release_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def seed_identifier_sequences(apps, schema_editor):
+    # Start each tenant's counter after the highest REL identifier it
+    # already has, so new identifiers never collide with the random ones
+    Release = apps.get_model('release', 'Release')
+    ReleaseIdentifierSequence = apps.get_model(
+        'release', 'ReleaseIdentifierSequence')
+    tenant_ids = Release.objects.values_list(
+        'tenant_id', flat=True).distinct()
+    for tenant_id in tenant_ids:
+        identifiers = Release.objects.filter(
+            tenant_id=tenant_id,
+            identifier__regex=r'^REL[0-9]+$',
+        ).values_list('identifier', flat=True)
+        ReleaseIdentifierSequence.objects.create(
+            tenant_id=tenant_id,
+            last_value=max(
+                (int(identifier[3:]) for identifier in identifiers),
+                default=0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('release', '0009_release_search_indexes'),
+        ('tenant', '0001_initial'),
+        ('user', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReleaseIdentifierSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                 primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('prefix', models.CharField(blank=True, default='REL', max_length=20)),
+                ('padding', models.PositiveSmallIntegerField(default=5)),
+                ('last_value', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='release',
+            constraint=models.UniqueConstraint(
+                fields=(
+                    'tenant',
+                    'identifier'),
+                name='release_unique_tenant_identifier'),
+        ),
+        migrations.AddField(
+            model_name='releaseidentifiersequence',
+            name='tenant',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to='tenant.tenant'),
+        ),
+        migrations.AddConstraint(
+            model_name='releaseidentifiersequence',
+            constraint=models.UniqueConstraint(
+                fields=('tenant',), name='release_identifier_sequence_unique_tenant'),
+        ),
+        migrations.RunPython(
+            seed_identifier_sequences, migrations.RunPython.noop),
+    ]
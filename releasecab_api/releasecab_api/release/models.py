@@ -1,11 +1,17 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 from releasecab_api.base_model import BaseReleaseCabModel
 from releasecab_api.user.models import Role, Team
 
+from .managers import ReleaseIdentifierSequenceManager, ReleaseQuerySet
+
 
 class Release(BaseReleaseCabModel):
+    objects = ReleaseQuerySet.as_manager()
     name = models.CharField(max_length=500)
     identifier = models.CharField(max_length=500)
     release_type = models.ForeignKey('ReleaseType', on_delete=models.PROTECT)
@@ -29,10 +35,62 @@ class Release(BaseReleaseCabModel):
         related_name="next_stages",
         null=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination over the default release list ordering
+            models.Index(
+                fields=['tenant', 'name', 'id'],
+                name='release_tenant_name_idx'),
+            # Calendar windows
+            models.Index(
+                fields=['tenant', 'start_date', 'end_date'],
+                name='release_tenant_window_idx'),
+            # Search: trigram indexes serve the case-insensitive
+            # LIKE lookups, the tsvector index serves full text matches
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='release_name_trgm_idx'),
+            GinIndex(
+                OpClass(Upper('identifier'), name='gin_trgm_ops'),
+                name='release_identifier_trgm_idx'),
+            GinIndex(
+                SearchVector('name', 'description', config='english'),
+                name='release_search_vector_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['tenant', 'identifier'],
+                name='release_unique_tenant_identifier'),
+        ]
+
     def __str__(self):
         return self.name
 
 
+class ReleaseIdentifierSequence(BaseReleaseCabModel):
+    # One counter row per tenant, see ReleaseIdentifierSequenceManager
+    objects = ReleaseIdentifierSequenceManager()
+    prefix = models.CharField(max_length=20, default='REL', blank=True)
+    padding = models.PositiveSmallIntegerField(default=5)
+    last_value = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['tenant'],
+                name='release_identifier_sequence_unique_tenant'),
+        ]
+
+    @staticmethod
+    def format_identifier(prefix, padding, value):
+        return f"{prefix}{value:0{padding}d}"
+
+    def __str__(self):
+        last_identifier = self.format_identifier(
+            self.prefix, self.padding, self.last_value)
+        return f"Last identifier: {last_identifier}"
+
+
 class ReleaseComment(BaseReleaseCabModel):
     comment_body = models.TextField()
     writer = models.ForeignKey('user.User', on_delete=models.PROTECT)
@@ -1,14 +1,10 @@
-import random
-import string
-
 from rest_framework import serializers
 
-from releasecab_api.blackout.models import Blackout
+from releasecab_api.blackout.helpers import BlackoutHelpers
 
-from ..helpers import ReleaseHelpers
-from ..models import (Release, ReleaseConfig, ReleaseStage,
-                      ReleaseStageConnection, ReleaseStageConnectionApprover,
+from ..models import (Release, ReleaseConfig, ReleaseIdentifierSequence,
                       ReleaseType)
+from ..workflow import WorkflowGraph
 
 
 class ReleaseSerializer(serializers.ModelSerializer):
@@ -111,64 +107,32 @@ class ReleaseSerializer(serializers.ModelSerializer):
         current_stage_before_save = getattr(instance, 'current_stage',
                                             None)
         current_stage_to_save = value
-        connection = ReleaseStageConnection.objects.get(
-            from_stage=current_stage_before_save,
-            to_stage=current_stage_to_save,
-            tenant=user.tenant)
-        stage = ReleaseStage.objects.get(pk=current_stage_to_save,
-                                         tenant=user.tenant)
-        if not connection.approvers.values():
-            # No approver so they can progress
+        workflow = WorkflowGraph.for_tenant(user.tenant_id)
+        connection = None
+        if current_stage_before_save is not None:
+            connection = workflow.get_connection(
+                current_stage_before_save.id, current_stage_to_save)
+        if connection is None:
+            raise serializers.ValidationError(
+                "The release cannot move to that stage.")
+        stage = workflow.get_stage(current_stage_to_save)
+        is_release_owner = instance.owner_id == user.id and \
+            instance.tenant_id == user.tenant_id
+        if not connection['approvers'] or \
+                workflow.is_approver(user, connection) or \
+                ((connection['owner_only'] or connection['owner_included'])
+                 and is_release_owner):
+            # No approver needed, or this user can approve, so they can
+            # progress
             instance.current_stage = stage
             instance.pending_approval = False
             instance.next_stage = None
             instance.save()
             return current_stage_to_save
-        else:
-            for approver in connection.approvers.values():
-                connection_approver = \
-                    ReleaseStageConnectionApprover.objects.get(
-                        pk=approver['id'])
-                approver_roles = \
-                    connection_approver.approver_role.values()
-                approver_teams = \
-                    connection_approver.approver_team.values()
-                role_approver_found = \
-                    ReleaseHelpers.is_user_in_role_connection(
-                        user, approver_roles)
-                team_approver_found = \
-                    ReleaseHelpers.is_user_in_team_connection(
-                        user, approver_teams)
-                owner_only_approver = connection.owner_only
-                owner_included = connection.owner_included
-                if team_approver_found and role_approver_found:
-                    # No approver so they can progress
-                    instance.pending_approval = False
-                    instance.next_stage = None
-                    instance.current_stage = stage
-                    instance.save()
-                    return current_stage_to_save
-                elif owner_only_approver or owner_included:
-                    if Release.objects.filter(
-                            id=instance.id,
-                            owner=user,
-                            tenant=user.tenant).exists():
-                        instance.pending_approval = False
-                        instance.next_stage = None
-                        instance.current_stage = stage
-                        instance.save()
-                        return current_stage_to_save
-            instance.pending_approval = True
-            instance.next_stage = stage
-            instance.save()
-            return current_stage_before_save
-
-    # TODO: Handle identifier logic to be random or counted up
-    def generate_unique_identifier(self):
-        identifier = f"REL{''.join(random.choices(string.digits, k=5))}"
-        while Release.objects.filter(identifier=identifier).exists():
-            identifier = f"REL{''.join(random.choices(string.digits, k=5))}"
-        return identifier
+        instance.pending_approval = True
+        instance.next_stage = stage
+        instance.save()
+        return current_stage_before_save
 
     def create(self, validated_data):
         tenant = self.context['request'].user.tenant
@@ -184,7 +148,8 @@ class ReleaseSerializer(serializers.ModelSerializer):
         if release_type_data is not None:
             validated_data['release_type'] = ReleaseType.objects.get(
                 pk=release_type_data, tenant=tenant)
-        unique_identifier = self.generate_unique_identifier()
+        unique_identifier = ReleaseIdentifierSequence.objects.next_identifier(
+            tenant)
         release = Release.objects.create(
             **validated_data,
             current_stage=ReleaseConfig.objects.get(
@@ -205,16 +170,16 @@ class ReleaseSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError(
                         "End date must be after the start date.")
                 tenant = self.context['request'].user.tenant
-                overlapping_blackouts = Blackout.objects.filter(
-                    tenant=tenant,
-                    start_date__lte=end_date,
-                    end_date__gte=start_date,
-                    release_environment__in=self.context['request'].data.get(
-                        'release_environment')
-                )
-                if overlapping_blackouts.exists():
+                overlapping_blackouts = BlackoutHelpers.get_overlapping(
+                    tenant.id,
+                    start_date,
+                    end_date,
+                    self.context['request'].data.get(
+                        'release_environment') or [])
+                if overlapping_blackouts:
                     blackout_names = ", ".join(
-                        [blackout.name for blackout in overlapping_blackouts]
+                        [blackout['name']
+                         for blackout in overlapping_blackouts]
                     )
                     raise serializers.ValidationError(
                         f"The provided dates fall within blackout period(s): \
@@ -0,0 +1,44 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from releasecab_api.user.models import Role, Team
+
+from .models import (Release, ReleaseStage, ReleaseStageConnection,
+                     ReleaseStageConnectionApprover)
+from .stats import invalidate_release_stats
+from .workflow import WorkflowGraph
+
+
+@receiver(post_save, sender=Release)
+@receiver(post_delete, sender=Release)
+@receiver(post_save, sender=ReleaseStage)
+@receiver(post_delete, sender=ReleaseStage)
+def release_stats_changed(sender, instance, *args, **kwargs):
+    """
+    Releases being created, moved between stages or deleted, and stages
+    switching is_end_stage, all change the open release counts
+    """
+    invalidate_release_stats(instance.tenant_id)
+
+
+@receiver(post_save, sender=ReleaseStage)
+@receiver(post_delete, sender=ReleaseStage)
+@receiver(post_save, sender=ReleaseStageConnection)
+@receiver(post_delete, sender=ReleaseStageConnection)
+@receiver(post_save, sender=ReleaseStageConnectionApprover)
+@receiver(post_delete, sender=ReleaseStageConnectionApprover)
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=Team)
+@receiver(m2m_changed, sender=ReleaseStageConnection.approvers.through)
+@receiver(
+    m2m_changed,
+    sender=ReleaseStageConnectionApprover.approver_role.through)
+@receiver(
+    m2m_changed,
+    sender=ReleaseStageConnectionApprover.approver_team.through)
+def release_workflow_changed(sender, instance, *args, **kwargs):
+    """
+    Recompile the tenant's workflow graph after any change to its stages,
+    connections or approvers, or to a role or team an approver may use
+    """
+    WorkflowGraph.invalidate(instance.tenant_id)
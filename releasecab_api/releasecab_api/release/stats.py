@@ -0,0 +1,43 @@
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from releasecab_api.cache_versions import bump_cache_version, get_cache_version
+from releasecab_api.db_router import primary_reads
+
+from .models import Release
+
+# Entries are unreachable as soon as the tenant's version moves on, the
+# timeout only bounds how long orphaned ones linger in the cache
+STATS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_open_release_counts(user):
+    '''
+    Count the open releases in the user's tenant and the ones the user
+    owns. Both are cached under the tenant's current stats version, so a
+    warm dashboard does not touch the database
+    '''
+    version = get_cache_version('release-stats', user.tenant_id)
+    all_key = f'release-stats:{user.tenant_id}:{version}:all'
+    my_key = f'release-stats:{user.tenant_id}:{version}:user:{user.pk}'
+    cached = cache.get_many([all_key, my_key])
+    if all_key in cached and my_key in cached:
+        return cached[all_key], cached[my_key]
+
+    with primary_reads():
+        counts = Release.objects.filter(
+            tenant_id=user.tenant_id,
+            current_stage__is_end_stage=False,
+        ).aggregate(
+            all_open_releases=Count('id'),
+            my_open_releases=Count('id', filter=Q(owner=user)),
+        )
+    cache.set_many({
+        all_key: counts['all_open_releases'],
+        my_key: counts['my_open_releases'],
+    }, timeout=STATS_CACHE_TIMEOUT)
+    return counts['all_open_releases'], counts['my_open_releases']
+
+
+def invalidate_release_stats(tenant_id):
+    bump_cache_version('release-stats', tenant_id)
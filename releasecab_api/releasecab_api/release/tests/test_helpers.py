@@ -39,3 +39,48 @@ class TestReleaseHelpers(TestCase):
         self.assertTrue(
             ReleaseHelpers.is_user_in_team_connection(
                 self.user, []))
+
+    def test_manager_is_in_team_connection(self):
+        self.team.managers.add(self.user)
+        self.assertTrue(ReleaseHelpers.is_user_in_team_connection(
+            self.user, [self.team.id]))
+
+    def test_user_not_in_connection(self):
+        other_role = Role.objects.create(
+            name="Other Role", tenant=self.tenant)
+        other_team = Team.objects.create(
+            name="Other Team", tenant=self.tenant)
+        self.user.role.add(self.role)
+        self.team.members.add(self.user)
+        self.assertFalse(ReleaseHelpers.is_user_in_role_connection(
+            self.user, [{'id': other_role.id}]))
+        self.assertFalse(ReleaseHelpers.is_user_in_team_connection(
+            self.user, [other_team.id]))
+
+    def test_connection_checks_load_user_once(self):
+        roles = [
+            Role.objects.create(name=f"Role {i}", tenant=self.tenant)
+            for i in range(10)]
+        teams = [
+            Team.objects.create(name=f"Team {i}", tenant=self.tenant)
+            for i in range(10)]
+        members = [
+            User.objects.create(
+                email=f"member{i}@example.com",
+                password="password456",
+                tenant=self.tenant)
+            for i in range(20)]
+        for team in teams:
+            team.members.add(*members)
+        teams[-1].members.add(self.user)
+        self.user.role.add(roles[-1])
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(2):
+            for role, team in zip(roles, teams):
+                ReleaseHelpers.is_user_in_role_connection(user, [role.id])
+                ReleaseHelpers.is_user_in_team_connection(
+                    user, [{'id': team.id}])
+            self.assertTrue(ReleaseHelpers.is_user_in_role_connection(
+                user, [role.id for role in roles]))
+            self.assertTrue(ReleaseHelpers.is_user_in_team_connection(
+                user, [team.id for team in teams]))
@@ -6,7 +6,7 @@ from releasecab_api.tenant.models import Tenant
 from releasecab_api.user.models import Team, User
 
 from ..models import (Release, ReleaseComment, ReleaseEnvironment,
-                      ReleaseStage, ReleaseType)
+                      ReleaseIdentifierSequence, ReleaseStage, ReleaseType)
 
 
 class ReleaseModelTest(TestCase):
@@ -90,6 +90,25 @@ class ReleaseModelTest(TestCase):
         )
         self.assertEqual(str(release), "Test Release")
 
+    def test_identifier_unique_per_tenant(self):
+        other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=50,
+            invite_code="OTHER123")
+        release_data = {
+            'name': "Test Release",
+            'identifier': "TEST001",
+            'release_type': self.release_type,
+            'start_date': timezone.now(),
+            'end_date': timezone.now() + timezone.timedelta(hours=1),
+            'owner': self.user,
+            'current_stage': self.stage,
+        }
+        Release.objects.create(**release_data, tenant=self.tenant)
+        Release.objects.create(**release_data, tenant=other_tenant)
+        with self.assertRaises(IntegrityError):
+            Release.objects.create(**release_data, tenant=self.tenant)
+
 
 class ReleaseCommentModelTest(TestCase):
     def setUp(self):
@@ -143,3 +162,39 @@ class ReleaseCommentModelTest(TestCase):
         self.assertEqual(
             str(comment),
             "Comment by test@example.com on Test Release")
+
+
+class ReleaseIdentifierSequenceModelTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=50,
+            invite_code="OTHER123")
+
+    def test_identifiers_count_up_per_tenant(self):
+        next_identifier = ReleaseIdentifierSequence.objects.next_identifier
+        self.assertEqual(next_identifier(self.tenant), "REL00001")
+        self.assertEqual(next_identifier(self.tenant), "REL00002")
+        self.assertEqual(next_identifier(self.other_tenant), "REL00001")
+        self.assertEqual(
+            ReleaseIdentifierSequence.objects.get(
+                tenant=self.tenant).last_value, 2)
+
+    def test_configured_prefix_and_padding(self):
+        ReleaseIdentifierSequence.objects.create(
+            tenant=self.tenant,
+            prefix="CHG-",
+            padding=3,
+            last_value=998)
+        next_identifier = ReleaseIdentifierSequence.objects.next_identifier
+        self.assertEqual(next_identifier(self.tenant), "CHG-999")
+        self.assertEqual(next_identifier(self.tenant), "CHG-1000")
+
+    def test_allocation_is_one_query(self):
+        ReleaseIdentifierSequence.objects.next_identifier(self.tenant)
+        with self.assertNumQueries(1):
+            ReleaseIdentifierSequence.objects.next_identifier(self.tenant)
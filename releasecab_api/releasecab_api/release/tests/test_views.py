@@ -1,6 +1,12 @@
+import json
+import time
+from base64 import urlsafe_b64encode
 from datetime import datetime, timedelta
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -783,6 +789,9 @@ class ReleaseTest(TestCase):
         }
         response = self.client.post(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['identifier'], "REL00001")
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.data['identifier'], "REL00002")
 
     def test_user_can_retrieve_release_by_identifier_success(self):
         self.client.credentials(
@@ -816,6 +825,53 @@ class ReleaseTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_user_can_retrieve_calendar_releases_in_window_success(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer \
+                {create_access_token(self.admin_user)}')
+        url = reverse('release-calendar')
+        today = timezone.now().date()
+        response = self.client.get(url, {
+            'from': (today - timedelta(days=1)).isoformat(),
+            'to': (today + timedelta(days=1)).isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        response = self.client.get(url, {
+            'from': (timezone.now() + timedelta(days=2)).isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
+
+    def test_user_can_retrieve_compact_calendar_releases_success(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer \
+                {create_access_token(self.admin_user)}')
+        environment = ReleaseEnvironment.objects.create(
+            name="Test Environment", tenant=self.tenant)
+        self.release.release_environment.add(environment)
+        url = reverse('release-calendar')
+        response = self.client.get(url, {'compact': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            'id': self.release.id,
+            'identifier': 'TEST-123',
+            'name': 'Test Release',
+            'start_date': self.release.start_date,
+            'end_date': self.release.end_date,
+            'current_stage_id': self.release.current_stage_id,
+            'release_environment_ids': [environment.id],
+        }])
+
+    def test_user_cannot_retrieve_calendar_with_bad_window_failure(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer \
+                {create_access_token(self.admin_user)}')
+        url = reverse('release-calendar')
+        response = self.client.get(url, {'from': 'last tuesday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            url, {'from': '2024-03-02', 'to': '2024-03-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_tenant_owner_can_update_release_success(self):
         self.client.credentials(
             HTTP_AUTHORIZATION=f'Bearer \
@@ -844,9 +900,96 @@ class ReleaseTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+class ReleaseSearchTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.user = User.objects.create(
+            email="user@example.com",
+            password="password123",
+            tenant=self.tenant,
+            is_tenant_owner=True
+        )
+        self.release_type = ReleaseType.objects.create(
+            name="Test Type", tenant=self.tenant)
+        self.stage = ReleaseStage.objects.create(
+            name="Test Stage", tenant=self.tenant)
+        self.create_release(
+            "REL00001", "Payments Deployment", "Rolls out the new ledger")
+        self.create_release(
+            "REL00002", "Login Hotfix", "Patches the session timeout")
+        self.create_release(
+            "REL00010", "Search Rewrite", "Ledger reconciliation search")
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {create_access_token(self.user)}')
+
+    def create_release(self, identifier, name, description):
+        return Release.objects.create(
+            name=name,
+            identifier=identifier,
+            description=description,
+            tenant=self.tenant,
+            release_type=self.release_type,
+            start_date=timezone.now(),
+            end_date=timezone.now() + timedelta(hours=1),
+            owner=self.user,
+            current_stage=self.stage)
+
+    def search(self, term):
+        response = self.client.get(reverse('release-search'), {'search': term})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_search_matches_partial_name(self):
+        self.assertEqual(
+            self.search("deploy"), ["REL00001 - Payments Deployment"])
+
+    def test_search_matches_identifier_prefix(self):
+        self.assertEqual(
+            self.search("rel0001"), ["REL00010 - Search Rewrite"])
+
+    def test_search_ranks_exact_identifier_first(self):
+        self.assertEqual(self.search("REL00001")[0],
+                         "REL00001 - Payments Deployment")
+
+    def test_search_matches_description_full_text(self):
+        self.assertEqual(
+            sorted(self.search("ledgers")),
+            ["REL00001 - Payments Deployment", "REL00010 - Search Rewrite"])
+
+    def test_search_without_match(self):
+        self.assertEqual(self.search("nothing"), ["No Releases Found"])
+
+    def test_search_is_limited(self):
+        for i in range(30):
+            self.create_release(f"BULK{i:05d}", f"Bulk Release {i}", "")
+        self.assertEqual(len(self.search("bulk")), 20)
+
+    def test_search_is_tenant_scoped(self):
+        other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=5,
+            invite_code="OTHER1")
+        Release.objects.filter(identifier="REL00001").update(
+            tenant=other_tenant)
+        self.assertEqual(self.search("deploy"), ["No Releases Found"])
+
+    def test_search_uses_indexes(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = Release.objects.search("ledger").explain()
+        self.assertIn('release_name_trgm_idx', plan)
+        self.assertIn('release_identifier_trgm_idx', plan)
+        self.assertIn('release_search_vector_idx', plan)
+
+
 class ReleaseStatViewForUserTest(TestCase):
     def setUp(self):
         self.client = APIClient()
+        cache.clear()
         self.tenant = Tenant.objects.create(
             name="Test Tenant",
             number_of_employees=50,
@@ -948,3 +1091,401 @@ class ReleaseStatViewForUserTest(TestCase):
         self.assertEqual(response.data['my_open_releases'], 2)
         self.assertEqual(response.data['all_open_releases'], 2)
         self.assertFalse(response.data['current_blackout'])
+
+    def create_open_release(self, identifier, owner, stage):
+        return Release.objects.create(
+            name="Test Release",
+            tenant=self.tenant,
+            identifier=identifier,
+            release_type=self.release_type,
+            start_date=timezone.now(),
+            end_date=timezone.now() + timedelta(hours=1),
+            owner=owner,
+            current_stage=stage)
+
+    def test_dashboard_stats_cached_until_releases_change(self):
+        self.release_type = ReleaseType.objects.create(
+            name="Test Type",
+            tenant=self.tenant)
+        stage = ReleaseStage.objects.create(
+            name="Test Stage",
+            tenant=self.tenant)
+        other_user = User.objects.create(
+            email="other@example.com",
+            password="password123",
+            tenant=self.tenant)
+        self.create_open_release("TEST-1", self.user, stage)
+        self.create_open_release("TEST-2", other_user, stage)
+        url = reverse('release-stats')
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.data['my_open_releases'], 1)
+        self.assertEqual(response.data['all_open_releases'], 2)
+        # Only the authenticated user is loaded
+        selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+        self.assertIn('FROM "user_user"', selects[0])
+
+        self.create_open_release("TEST-3", self.user, stage)
+        response = self.client.get(url)
+        self.assertEqual(response.data['my_open_releases'], 2)
+        self.assertEqual(response.data['all_open_releases'], 3)
+
+        stage.is_end_stage = True
+        stage.save()
+        response = self.client.get(url)
+        self.assertEqual(response.data['my_open_releases'], 0)
+        self.assertEqual(response.data['all_open_releases'], 0)
+
+
+class ReleaseWorkflowTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.user = User.objects.create(
+            email="owner@example.com",
+            password="password123",
+            tenant=self.tenant,
+            is_tenant_owner=True)
+        self.role = Role.objects.create(name="Approver", tenant=self.tenant)
+        self.draft = ReleaseStage.objects.create(
+            name="Draft", tenant=self.tenant)
+        self.review = ReleaseStage.objects.create(
+            name="Review", tenant=self.tenant)
+        self.approved = ReleaseStage.objects.create(
+            name="Approved", tenant=self.tenant)
+        ReleaseStageConnection.objects.create(
+            from_stage=self.draft, to_stage=self.review, tenant=self.tenant)
+        approved_connection = ReleaseStageConnection.objects.create(
+            from_stage=self.draft,
+            to_stage=self.approved,
+            tenant=self.tenant)
+        approver = ReleaseStageConnectionApprover.objects.create(
+            tenant=self.tenant)
+        approver.approver_role.add(self.role)
+        approved_connection.approvers.add(approver)
+        self.release = Release.objects.create(
+            name="Test Release",
+            identifier="TEST-123",
+            release_type=ReleaseType.objects.create(
+                name="Test Type", tenant=self.tenant),
+            start_date=timezone.now(),
+            end_date=timezone.now() + timedelta(hours=1),
+            owner=self.user,
+            current_stage=self.draft,
+            tenant=self.tenant)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {create_access_token(self.user)}')
+
+    def get_to_stages(self):
+        url = reverse(
+            'release-stage-connection-get-to-stages',
+            kwargs={'release_stage_id': self.draft.id})
+        response = self.client.get(url, {'release': self.release.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return (
+            [stage['name']
+             for stage in response.data['to_stages_without_approver']],
+            [stage['name']
+             for stage in response.data['to_stages_with_approver']])
+
+    def test_to_stages_split_by_approval(self):
+        self.assertEqual(self.get_to_stages(), (["Review"], ["Approved"]))
+        self.user.role.add(self.role)
+        self.assertEqual(self.get_to_stages(), (["Review", "Approved"], []))
+
+    def test_to_stages_do_not_query_workflow_tables_when_cached(self):
+        self.get_to_stages()
+        with CaptureQueriesContext(connection) as queries:
+            self.get_to_stages()
+        self.assertFalse(any(
+            'release_releasestage' in query['sql']
+            for query in queries.captured_queries))
+
+    def test_to_stages_follow_workflow_changes(self):
+        self.get_to_stages()
+        approver = ReleaseStageConnectionApprover.objects.create(
+            tenant=self.tenant)
+        approver.approver_role.add(self.role)
+        ReleaseStageConnection.objects.get(
+            to_stage=self.review).approvers.add(approver)
+        self.assertEqual(self.get_to_stages(), ([], ["Review", "Approved"]))
+
+    @override_settings(WORKFLOW_CACHE_TIMEOUT=1)
+    def test_to_stages_follow_missed_workflow_changes_after_timeout(self):
+        self.get_to_stages()
+        # A worker on its own per process cache never sees the version bump
+        version_key = f'release-workflow:{self.tenant.id}:version'
+        version = cache.get(version_key)
+        approver = ReleaseStageConnectionApprover.objects.create(
+            tenant=self.tenant)
+        approver.approver_role.add(self.role)
+        ReleaseStageConnection.objects.get(
+            to_stage=self.review).approvers.add(approver)
+        cache.set(version_key, version, timeout=None)
+        self.assertEqual(self.get_to_stages(), (["Review"], ["Approved"]))
+        time.sleep(1.1)
+        self.assertEqual(self.get_to_stages(), ([], ["Review", "Approved"]))
+
+    def test_unknown_stage_not_found(self):
+        other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=50,
+            invite_code="OTHER123")
+        other_stage = ReleaseStage.objects.create(
+            name="Other", tenant=other_tenant)
+        url = reverse(
+            'release-stage-connection-get-to-stages',
+            kwargs={'release_stage_id': other_stage.id})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_move_release_without_approver(self):
+        url = reverse('release-update', kwargs={'id': self.release.id})
+        response = self.client.patch(
+            url, {'current_stage': self.review.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.release.refresh_from_db()
+        self.assertEqual(self.release.current_stage, self.review)
+        self.assertFalse(self.release.pending_approval)
+
+    def test_move_release_needing_approval(self):
+        url = reverse('release-update', kwargs={'id': self.release.id})
+        response = self.client.patch(
+            url, {'current_stage': self.approved.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.release.refresh_from_db()
+        self.assertEqual(self.release.current_stage, self.draft)
+        self.assertEqual(self.release.next_stage, self.approved)
+        self.assertTrue(self.release.pending_approval)
+
+    def test_move_release_as_approver(self):
+        self.user.role.add(self.role)
+        url = reverse('release-update', kwargs={'id': self.release.id})
+        response = self.client.patch(
+            url, {'current_stage': self.approved.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_stage'], "Approved")
+        self.release.refresh_from_db()
+        self.assertEqual(self.release.current_stage, self.approved)
+
+    def test_move_release_without_connection_failure(self):
+        url = reverse('release-update', kwargs={'id': self.release.id})
+        response = self.client.patch(
+            url, {'current_stage': self.draft.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ReleaseCursorPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.user = User.objects.create(
+            email="user@example.com",
+            password="password123",
+            tenant=self.tenant,
+            is_tenant_owner=True
+        )
+        release_type = ReleaseType.objects.create(
+            name="Test Type", tenant=self.tenant)
+        stage = ReleaseStage.objects.create(
+            name="Test Stage", tenant=self.tenant)
+        start_date = timezone.now()
+        for i in range(45):
+            # Groups of five releases share a name and start date so the
+            # id tie-breaker is what keeps pages stable
+            Release.objects.create(
+                name=f"Release {i // 5}",
+                identifier=f"REL{i:05d}",
+                tenant=self.tenant,
+                release_type=release_type,
+                start_date=start_date + timedelta(days=i // 5),
+                end_date=start_date + timedelta(days=i // 5, hours=1),
+                owner=self.user,
+                current_stage=stage)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {create_access_token(self.user)}')
+
+    def walk_pages(self, params):
+        identifiers = []
+        response = self.client.get(reverse('release-list'), params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            identifiers += [
+                release['identifier'] for release in response.data['results']]
+            if not response.data['next']:
+                return identifiers, response
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_pages_cover_every_release_once(self):
+        for sort_by in ['name', 'start_date', 'current_stage']:
+            for order in ['asc', 'desc']:
+                identifiers, _ = self.walk_pages({
+                    'pagination': 'cursor',
+                    'sort_by': sort_by,
+                    'order_by': order})
+                self.assertEqual(len(identifiers), 45)
+                self.assertEqual(len(set(identifiers)), 45)
+
+    def test_cursor_pages_follow_sort_order(self):
+        identifiers, _ = self.walk_pages({
+            'pagination': 'cursor',
+            'sort_by': 'start_date',
+            'order_by': 'desc'})
+        expected = list(Release.objects.order_by(
+            '-start_date', '-id').values_list('identifier', flat=True))
+        self.assertEqual(identifiers, expected)
+
+    def test_cursor_previous_link_returns_prior_page(self):
+        params = {'pagination': 'cursor', 'sort_by': 'name'}
+        first_page = self.client.get(reverse('release-list'), params)
+        self.assertIsNone(first_page.data['previous'])
+        second_page = self.client.get(first_page.data['next'])
+        previous_page = self.client.get(second_page.data['previous'])
+        self.assertEqual(
+            previous_page.data['results'], first_page.data['results'])
+
+    def test_cursor_pagination_rejects_unsupported_sort(self):
+        response = self.client.get(reverse('release-list'), {
+            'pagination': 'cursor',
+            'sort_by': 'description'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor_not_found(self):
+        response = self.client.get(reverse('release-list'), {
+            'pagination': 'cursor',
+            'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        # Well formed cursors carrying values their columns can't hold
+        for sort_by, position in (
+                ('start_date', ['garbage', 1]),
+                ('name', ['x', 'abc']),
+                ('name', [None, 1]),
+                ('start_date', [{'a': 1}, 1])):
+            cursor = urlsafe_b64encode(json.dumps(
+                {'p': position, 'r': False}).encode('utf-8')).decode('ascii')
+            response = self.client.get(reverse('release-list'), {
+                'pagination': 'cursor',
+                'sort_by': sort_by,
+                'cursor': cursor})
+            self.assertEqual(
+                response.status_code, status.HTTP_404_NOT_FOUND, position)
+
+
+class ReleaseQueryBudgetTest(TestCase):
+    '''
+    Every release endpoint should stay under a fixed number of queries,
+    however many releases end up on the page
+    '''
+    QUERY_BUDGET = 8
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+        self.user = User.objects.create(
+            email="admin@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            tenant=self.tenant,
+            is_staff=True,
+            is_superuser=True,
+            is_tenant_owner=True
+        )
+        self.release_type = ReleaseType.objects.create(
+            name="Test Type", tenant=self.tenant)
+        self.stage = ReleaseStage.objects.create(
+            name="Test Stage", tenant=self.tenant)
+        self.next_stage = ReleaseStage.objects.create(
+            name="Next Stage", tenant=self.tenant)
+        self.environments = [
+            ReleaseEnvironment.objects.create(
+                name=f"Env {i}", tenant=self.tenant) for i in range(2)]
+        self.teams = [
+            Team.objects.create(name=f"Team {i}", tenant=self.tenant)
+            for i in range(2)]
+        self.release_count = 0
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {create_access_token(self.user)}')
+
+    def create_releases(self, count):
+        for _ in range(count):
+            self.release_count += 1
+            release = Release.objects.create(
+                name=f"Release {self.release_count}",
+                identifier=f"REL{self.release_count:05d}",
+                tenant=self.tenant,
+                release_type=self.release_type,
+                start_date=timezone.now(),
+                end_date=timezone.now() + timedelta(hours=1),
+                owner=self.user,
+                current_stage=self.stage,
+                next_stage=self.next_stage,
+                pending_approval=True)
+            release.release_environment.set(self.environments)
+            release.affected_teams.set(self.teams)
+
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context)
+
+    def assertQueryBudget(self, url, params=None):
+        self.create_releases(1)
+        single_row = self.count_queries(url, params)
+        self.create_releases(24)
+        full_page = self.count_queries(url, params)
+        self.assertEqual(single_row, full_page)
+        self.assertLessEqual(full_page, self.QUERY_BUDGET)
+
+    def test_release_list_query_budget(self):
+        self.assertQueryBudget(reverse('release-list'))
+
+    def test_release_list_filtered_query_budget(self):
+        self.assertQueryBudget(reverse('release-list'), {
+            'filter_by_me': 'true',
+            'filter_by_type': self.release_type.id,
+            'filter_by_env': self.environments[0].id,
+            'sort_by': 'start_date',
+            'order_by': 'desc'})
+
+    def test_release_calendar_query_budget(self):
+        self.assertQueryBudget(reverse('release-calendar'))
+
+    def test_release_calendar_compact_query_budget(self):
+        self.assertQueryBudget(
+            reverse('release-calendar'), {'compact': 'true'})
+
+    def test_admin_release_list_query_budget(self):
+        self.assertQueryBudget(reverse('admin-release-list'))
+
+    def test_release_detail_query_budget(self):
+        self.create_releases(1)
+        self.assertLessEqual(
+            self.count_queries(reverse(
+                'release-detail', kwargs={'identifier': 'REL00001'})),
+            self.QUERY_BUDGET)
+
+    def test_admin_release_detail_query_budget(self):
+        self.create_releases(1)
+        release = Release.objects.get(identifier='REL00001')
+        self.assertLessEqual(
+            self.count_queries(reverse(
+                'admin-release-detail', kwargs={'pk': release.pk})),
+            self.QUERY_BUDGET)
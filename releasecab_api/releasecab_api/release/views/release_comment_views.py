@@ -9,6 +9,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import IsAdminPermission
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import Release, ReleaseComment
 from ..serializers.release_comment_serializer import ReleaseCommentSerializer
@@ -36,7 +37,7 @@ class AdminReleaseCommentDetail(RetrieveAPIView):
     serializer_class = ReleaseCommentSerializer
 
 
-class ReleaseCommentRetrieve(ListAPIView):
+class ReleaseCommentRetrieve(ReadOnlyViewMixin, ListAPIView):
     """
     GET all release comment associated with a release ID
     """
@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import IsAdminPermission
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import ReleaseConfig
 from ..serializers.release_config_serializers import ReleaseConfigSerializer
@@ -31,7 +32,7 @@ class AdminReleaseConfigDetail(RetrieveAPIView):
     serializer_class = ReleaseConfigSerializer
 
 
-class ReleaseConfigByTenantId(ListAPIView):
+class ReleaseConfigByTenantId(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of release configs by Tenant ID.
     """
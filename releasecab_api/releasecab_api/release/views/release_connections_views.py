@@ -12,13 +12,14 @@ from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
 from releasecab_api.user.models import Role, Team
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
-from ..helpers import ReleaseHelpers
-from ..models import (Release, ReleaseStage, ReleaseStageConnection,
+from ..models import (Release, ReleaseStageConnection,
                       ReleaseStageConnectionApprover)
 from ..serializers.release_connections_serializers import \
     ReleaseStageConnectionSerializer
 from ..serializers.release_stage_serializers import ReleaseStageSerializer
+from ..workflow import WorkflowGraph
 
 
 class AdminStageConnectionList(ListAPIView):
@@ -43,7 +44,7 @@ class AdminStageConnectionDetail(RetrieveAPIView):
     serializer_class = ReleaseStageConnectionSerializer
 
 
-class ReleaseStageConnectionsByTenantId(ListAPIView):
+class ReleaseStageConnectionsByTenantId(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of stage connections by Tenant ID.
     """
@@ -133,7 +134,7 @@ class ReleaseStageConnectionUpdateView(UpdateAPIView):
         instance.save()
 
 
-class ReleaseStageConnectionsView(APIView):
+class ReleaseStageConnectionsView(ReadOnlyViewMixin, APIView):
     """
     GET Given a release_stage_id, get all valid next
     stages for that user
@@ -144,72 +145,44 @@ class ReleaseStageConnectionsView(APIView):
 
     def get(self, request, release_stage_id, format=None):
         release_id = self.request.query_params.get('release')
-        try:
-            from_stage = ReleaseStage.objects.get(pk=release_stage_id)
-            connections = ReleaseStageConnection.objects.filter(
-                from_stage=from_stage, tenant=request.user.tenant)
-            approver_connections = set()
-            non_approver_connections = set()
-            for connection in connections:
-                if connection.owner_only:
-                    # Check if the user is the owner of the release
-                    if Release.objects.filter(
-                            id=release_id,
-                            owner=request.user,
-                            tenant=request.user.tenant).exists():
-                        non_approver_connections.add(connection)
-                else:
-                    if not connection.approvers.values():
-                        # No approvers for that connection
-                        non_approver_connections.add(connection)
-                    else:
-                        for approver in connection.approvers.values():
-                            connection_approver = \
-                                ReleaseStageConnectionApprover.objects.get(
-                                    pk=approver['id'])
-                            approver_roles = \
-                                connection_approver.approver_role.values()
-                            approver_teams = \
-                                connection_approver.approver_team.values()
-
-                            if connection.owner_included and \
-                                Release.objects.filter(
-                                    id=release_id,
-                                    owner=request.user,
-                                    tenant=request.user.tenant).exists():
-                                non_approver_connections.add(connection)
-                            else:
-                                role_approver_found = \
-                                    ReleaseHelpers.is_user_in_role_connection(
-                                        request.user, approver_roles)
-                                team_approver_found = \
-                                    ReleaseHelpers.is_user_in_team_connection(
-                                        request.user, approver_teams)
-                                if team_approver_found and role_approver_found:
-                                    non_approver_connections.add(connection)
-                                else:
-                                    approver_connections.add(connection)
-            to_stages_no_approver = [
-                connection.to_stage for connection in non_approver_connections]
-            serialized_to_stages_no_approver = ReleaseStageSerializer(
-                to_stages_no_approver, many=True)
-            to_stages_with_approver = [
-                connection.to_stage for connection in approver_connections]
-            serialized_to_stages_with_approver = ReleaseStageSerializer(
-                to_stages_with_approver, many=True)
-            to_stages = {
-                'to_stages_with_approver':
-                serialized_to_stages_with_approver.data,
-                'to_stages_without_approver':
-                serialized_to_stages_no_approver.data}
-            return Response(to_stages)
-
-        except ReleaseStage.DoesNotExist:
+        workflow = WorkflowGraph.for_tenant(request.user.tenant_id)
+        if not workflow.has_stage(release_stage_id):
             return Response(
                 {
                     "error": f"ReleaseStage with id \
                         {release_stage_id} does not exist"},
                 status=status.HTTP_404_NOT_FOUND)
+        connections = workflow.get_connections(release_stage_id)
+        # Check if the user is the owner of the release, once
+        is_release_owner = any(
+            connection['owner_only'] or connection['owner_included']
+            for connection in connections) and Release.objects.filter(
+                id=release_id,
+                owner=request.user,
+                tenant=request.user.tenant).exists()
+        to_stages_no_approver = []
+        to_stages_with_approver = []
+        for connection in connections:
+            to_stage = workflow.get_stage(connection['to_stage_id'])
+            if connection['owner_only']:
+                if is_release_owner:
+                    to_stages_no_approver.append(to_stage)
+            elif not connection['approvers'] or \
+                    (connection['owner_included'] and is_release_owner) or \
+                    workflow.is_approver(request.user, connection):
+                to_stages_no_approver.append(to_stage)
+            else:
+                to_stages_with_approver.append(to_stage)
+        serialized_to_stages_no_approver = ReleaseStageSerializer(
+            to_stages_no_approver, many=True)
+        serialized_to_stages_with_approver = ReleaseStageSerializer(
+            to_stages_with_approver, many=True)
+        to_stages = {
+            'to_stages_with_approver':
+            serialized_to_stages_with_approver.data,
+            'to_stages_without_approver':
+            serialized_to_stages_no_approver.data}
+        return Response(to_stages)
 
 
 class ReleaseConnectionDeleteAPIView(DestroyAPIView):
@@ -11,6 +11,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import ReleaseEnvironment
 from ..serializers.release_env_serializers import ReleaseEnvironmentSerializer
@@ -39,7 +40,7 @@ class AdminReleaseEnvironmentDetail(RetrieveAPIView):
     serializer_class = ReleaseEnvironmentSerializer
 
 
-class ReleaseEnvRetrieve(RetrieveAPIView):
+class ReleaseEnvRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a release Env by identifier. Only tenant owners
     """
@@ -109,7 +110,7 @@ class ReleaseEnvUpdateView(UpdateAPIView):
                 status=status.HTTP_403_FORBIDDEN)
 
 
-class ReleaseEnvironmentByTenantId(ListAPIView):
+class ReleaseEnvironmentByTenantId(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of ReleaseEnvironments by Tenant ID.
     """
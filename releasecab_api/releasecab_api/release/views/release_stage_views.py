@@ -11,6 +11,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import ReleaseStage
 from ..serializers.release_stage_serializers import ReleaseStageSerializer
@@ -38,7 +39,7 @@ class AdminStageDetail(RetrieveAPIView):
     serializer_class = ReleaseStageSerializer
 
 
-class ReleaseStageRetrieve(RetrieveAPIView):
+class ReleaseStageRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a release stage by identifier.
     """
@@ -106,7 +107,7 @@ class ReleaseStageUpdateView(UpdateAPIView):
                 status=status.HTTP_403_FORBIDDEN)
 
 
-class ReleaseStageByTenantId(ListAPIView):
+class ReleaseStageByTenantId(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of Release Stage by Tenant ID.
     """
@@ -1,6 +1,4 @@
 
-from django.db.models import Q
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
@@ -8,12 +6,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from releasecab_api.blackout.models import Blackout
+from releasecab_api.blackout.helpers import BlackoutHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
-from ..models import Release
+from ..stats import get_open_release_counts
 
 
-class ReleaseStatViewForUser(APIView):
+class ReleaseStatViewForUser(ReadOnlyViewMixin, APIView):
     '''
     GET a user's dashboard stats
     '''
@@ -22,22 +21,10 @@ class ReleaseStatViewForUser(APIView):
 
     def get(self, request, *args, **kwargs):
         user = self.request.user
-        my_open_releases = Release.objects.filter(
-            owner=user,
-            current_stage__is_end_stage=False,
-            tenant=user.tenant
-        )
-        all_open_releases = Release.objects.filter(
-            current_stage__is_end_stage=False,
-            tenant=user.tenant
-        )
-        current_datetime = timezone.now()
-        blackout_exists_now = Blackout.objects.filter(
-            Q(start_date__lte=current_datetime) &
-            Q(end_date__gte=current_datetime)
-        ).exists()
+        all_open_releases, my_open_releases = get_open_release_counts(user)
+        blackout_state = BlackoutHelpers.get_state(user.tenant_id)
 
-        return Response({'my_open_releases': my_open_releases.count(),
-                         'all_open_releases': all_open_releases.count(),
-                         'current_blackout': blackout_exists_now},
+        return Response({'my_open_releases': my_open_releases,
+                         'all_open_releases': all_open_releases,
+                         'current_blackout': bool(blackout_state['active'])},
                         status=status.HTTP_200_OK)
@@ -11,6 +11,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import ReleaseType
 from ..serializers.release_type_serializers import ReleaseTypeSerializer
@@ -39,7 +40,7 @@ class AdminReleaseTypeDetail(RetrieveAPIView):
     serializer_class = ReleaseTypeSerializer
 
 
-class ReleaseTypesByTenantId(ListAPIView):
+class ReleaseTypesByTenantId(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of ReleaseTypes by Tenant ID.
     """
@@ -107,7 +108,7 @@ class ReleaseTypeCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ReleaseTypeRetrieve(RetrieveAPIView):
+class ReleaseTypeRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a release type by identifier.
     """
@@ -1,6 +1,7 @@
 from django.http import Http404
-from rest_framework import filters, status
+from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import ParseError
 from rest_framework.generics import (CreateAPIView, DestroyAPIView,
                                      ListAPIView, RetrieveAPIView,
                                      UpdateAPIView, get_object_or_404)
@@ -10,7 +11,10 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import (CanCreateReleasesPermission,
                                             IsAdminPermission)
+from releasecab_api.calendar_feeds import CalendarViewMixin
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.pagination import KeysetPagination
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import Release
 from ..serializers.release_serializers import ReleaseSerializer
@@ -22,7 +26,7 @@ class AdminReleaseList(ListAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = Release.objects.all()
+    queryset = Release.objects.with_related()
     serializer_class = ReleaseSerializer
 
 
@@ -34,7 +38,7 @@ class AdminReleaseDetail(RetrieveAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = Release.objects.all()
+    queryset = Release.objects.with_related()
     serializer_class = ReleaseSerializer
 
 
@@ -57,7 +61,7 @@ class ReleaseCreate(CreateAPIView):
             False)
 
 
-class ReleaseRetrieve(RetrieveAPIView):
+class ReleaseRetrieve(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET a release by identifier. Automatically checks the release
     exists just for that tenant.
@@ -71,7 +75,7 @@ class ReleaseRetrieve(RetrieveAPIView):
         tenant = self.request.user.tenant
 
         try:
-            releases = Release.objects.get(
+            releases = Release.objects.with_related().get(
                 identifier=identifier, tenant=tenant)
             self.check_object_permissions(self.request, releases)
             return releases
@@ -79,17 +83,21 @@ class ReleaseRetrieve(RetrieveAPIView):
             raise Http404("Release does not exist.")
 
 
-class ReleaseTenantList(ListAPIView):
+class ReleaseTenantList(ReadOnlyViewMixin, ListAPIView):
     """
-    GET a list of all releases for that tenant
+    GET a list of all releases for that tenant.
+    Pass pagination=cursor for keyset pagination on any cursor_sort_fields
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     serializer_class = ReleaseSerializer
+    cursor_sort_fields = [
+        'name', 'identifier', 'start_date', 'end_date', 'created_at',
+        'current_stage', 'release_type', 'owner', 'id']
 
     def get_queryset(self):
         tenant = self.request.user.tenant
-        releases = Release.objects.filter(tenant=tenant)
+        releases = Release.objects.with_related().filter(tenant=tenant)
         sort_by = self.request.query_params.get('sort_by', 'name')
         order = self.request.query_params.get('order_by', 'asc')
         filter_by_me = self.request.query_params.get('filter_by_me', "false")
@@ -108,6 +116,12 @@ class ReleaseTenantList(ListAPIView):
         if order not in ['asc', 'desc']:
             order = 'asc'
 
+        if KeysetPagination.is_requested(self.request):
+            if sort_by not in self.cursor_sort_fields:
+                raise ParseError(
+                    f"Cursor pagination cannot sort by '{sort_by}'.")
+            self.pagination_class = KeysetPagination
+
         if order == 'asc':
             releases = releases.order_by(sort_by)
         else:
@@ -116,19 +130,26 @@ class ReleaseTenantList(ListAPIView):
         return releases
 
 
-class ReleaseTenantCalendarList(ListAPIView):
+class ReleaseTenantCalendarList(ReadOnlyViewMixin, CalendarViewMixin,
+                                ListAPIView):
     """
-    GET a list of all releases for that tenant
+    GET a list of all releases for that tenant. Pass from/to to only get
+    the releases that overlap that window, and compact=true to only get
+    the fields a calendar cell needs
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     serializer_class = ReleaseSerializer
     pagination_class = None
 
+    def get_calendar_queryset(self):
+        return Release.objects.filter(tenant=self.request.user.tenant)
+
     def get_queryset(self):
-        tenant = self.request.user.tenant
-        releases = Release.objects.filter(tenant=tenant).order_by('name')
-        return releases
+        releases = super().get_queryset()
+        if self.is_compact():
+            return releases
+        return releases.with_related()
 
 
 class ReleaseUpdateView(UpdateAPIView):
@@ -140,7 +161,7 @@ class ReleaseUpdateView(UpdateAPIView):
     authentication_classes = [JWTAuthentication, SessionAuthentication]
 
     def get_queryset(self):
-        return Release.objects.all()
+        return Release.objects.with_related()
 
     def get_object(self):
         queryset = self.get_queryset()
@@ -217,27 +238,31 @@ class ReleaseDeleteAPIView(DestroyAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class ReleaseSearchView(ListAPIView):
+class ReleaseSearchView(ReadOnlyViewMixin, ListAPIView):
     '''
-    GET search for releases. Rough version of search
+    GET search for releases by identifier, name and description.
+    Returns the best max_results matches for the search term
     '''
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
     pagination_class = None
-    queryset = Release.objects.all()
     serializer_class = ReleaseSerializer
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['name', 'identifier']
+    max_results = 20
 
     def get_queryset(self):
-        return Release.objects.filter(tenant=self.request.user.tenant)
+        releases = Release.objects.filter(tenant=self.request.user.tenant)
+        term = self.request.query_params.get('search', '').strip()
+        if term:
+            return releases.search(term)
+        return releases.order_by('name', 'id')
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_queryset().values_list(
+            'identifier', 'name')[:self.max_results]
 
         release_list = [
-            f"{release.identifier} - {release.name}"
-            for release in queryset
+            f"{identifier} - {name}"
+            for identifier, name in queryset
         ]
         if not release_list:
             release_list = [
@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from releasecab_api.cache_versions import bump_cache_version, get_cache_version
+from releasecab_api.db_router import primary_reads
+
+from .helpers import ReleaseHelpers
+from .models import ReleaseStage, ReleaseStageConnection
+
+
+class WorkflowGraph:
+    '''
+    A tenant's release stages and stage connections, compiled once into
+    adjacency lists keyed by the from stage. Each connection carries its
+    approvers as plain sets of role and team ids, so answering "where can
+    this release move" needs no queries against the workflow tables
+    '''
+
+    def __init__(self, stages, adjacency):
+        # {stage id: ReleaseStage field values}
+        self.stages = stages
+        # {from stage id: [connection, ...]}, where a connection is a dict
+        # of id, to_stage_id, owner_only, owner_included and approvers, a
+        # list of {'roles': frozenset, 'teams': frozenset}
+        self.adjacency = adjacency
+
+    @classmethod
+    def for_tenant(cls, tenant_id):
+        version = get_cache_version('release-workflow', tenant_id)
+        key = f'release-workflow:{tenant_id}:{version}'
+        graph = cache.get(key)
+        if graph is None:
+            with primary_reads():
+                graph = cls.compile(tenant_id)
+            cache.set(key, graph, timeout=settings.WORKFLOW_CACHE_TIMEOUT)
+        return graph
+
+    @classmethod
+    def compile(cls, tenant_id):
+        stages = {
+            stage['id']: stage
+            for stage in ReleaseStage.objects.filter(
+                tenant_id=tenant_id).values()}
+        adjacency = {}
+        connections = ReleaseStageConnection.objects.filter(
+            tenant_id=tenant_id,
+        ).prefetch_related(
+            'approvers__approver_role',
+            'approvers__approver_team',
+        ).order_by('id')
+        for connection in connections:
+            adjacency.setdefault(connection.from_stage_id, []).append({
+                'id': connection.id,
+                'to_stage_id': connection.to_stage_id,
+                'owner_only': connection.owner_only,
+                'owner_included': connection.owner_included,
+                'approvers': [
+                    {
+                        'roles': frozenset(
+                            role.id
+                            for role in approver.approver_role.all()),
+                        'teams': frozenset(
+                            team.id
+                            for team in approver.approver_team.all()),
+                    }
+                    for approver in connection.approvers.all()],
+            })
+        return cls(stages, adjacency)
+
+    @staticmethod
+    def invalidate(tenant_id):
+        bump_cache_version('release-workflow', tenant_id)
+
+    def has_stage(self, stage_id):
+        return int(stage_id) in self.stages
+
+    def get_stage(self, stage_id):
+        '''
+        A ReleaseStage built from the compiled values, good for assigning
+        to a release or serializing without fetching it again
+        '''
+        stage = ReleaseStage(**self.stages[int(stage_id)])
+        stage._state.adding = False
+        return stage
+
+    def get_connections(self, from_stage_id):
+        return self.adjacency.get(int(from_stage_id), [])
+
+    def get_connection(self, from_stage_id, to_stage_id):
+        for connection in self.get_connections(from_stage_id):
+            if connection['to_stage_id'] == int(to_stage_id):
+                return connection
+        return None
+
+    @staticmethod
+    def is_approver(user, connection):
+        '''
+        Whether the user satisfies any one of the connection's approvers
+        '''
+        for approver in connection['approvers']:
+            if ReleaseHelpers.is_user_in_role_connection(
+                    user, approver['roles']) and \
+                    ReleaseHelpers.is_user_in_team_connection(
+                        user, approver['teams']):
+                return True
+        return False
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third Party Apps
     'rest_framework',
     'rest_framework_simplejwt',
@@ -52,6 +53,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'releasecab_api.db_router.PrimaryPinMiddleware',
 ]
 
 ROOT_URLCONF = 'releasecab_api.urls'
@@ -80,12 +82,47 @@ DATABASES = {
         'NAME': 'postgres',
         'USER': os.environ.get("POSTGRES_USERNAME"),
         'PASSWORD': os.environ.get("POSTGRES_PASSWORD"),
-        'HOST': 'db',
-        'PORT': 5432,
+        'HOST': os.environ.get("POSTGRES_HOST", default='db'),
+        'PORT': int(os.environ.get("POSTGRES_PORT", default=5432)),
         'ATOMIC_REQUESTS': True,
+        # Seconds a worker keeps its connection open for the requests after
+        # it, 0 closes it at the end of every request. A kept connection is
+        # checked before each request and reopened if the server dropped it
+        'CONN_MAX_AGE': int(
+            os.environ.get("POSTGRES_CONN_MAX_AGE", default=60)),
+        'CONN_HEALTH_CHECKS': bool(int(
+            os.environ.get("POSTGRES_CONN_HEALTH_CHECKS", default=1))),
+        # Behind a transaction pooler such as PgBouncer the next query may
+        # run on another server connection, where a server side cursor
+        # would not exist
+        'DISABLE_SERVER_SIDE_CURSORS': bool(int(
+            os.environ.get("POSTGRES_TRANSACTION_POOLING", default=0))),
     }
 }
 
+# Read replicas as a comma separated list of hosts. Each one gets its own
+# alias and the reads of read only views are spread across them. Tests
+# use the test database itself in their place
+REPLICA_HOSTS = [
+    host for host in os.environ.get(
+        "POSTGRES_REPLICA_HOSTS", default='').split(',') if host]
+DATABASE_REPLICAS = []
+for number, host in enumerate(REPLICA_HOSTS, start=1):
+    DATABASES[f'replica_{number}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'ATOMIC_REQUESTS': False,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{number}')
+
+DATABASE_ROUTERS = ['releasecab_api.db_router.PrimaryReplicaRouter']
+
+# How long a user's reads stay on the primary after they write. Pins are
+# kept in the cache, so every process needs to share one for them to hold
+REPLICA_STICKY_SECONDS = int(
+    os.environ.get("REPLICA_STICKY_SECONDS", default=10))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -126,10 +163,38 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'user.User'
 
+# Dashboard stats, blackout schedules, release workflow graphs and replica
+# pins are cached here. Changes invalidate cached data by bumping a version
+# kept in the same cache, so with the default per process cache they only
+# reach the worker that made them. Point CACHE_BACKEND/CACHE_LOCATION at a
+# shared cache (memcached, redis) when running more than one worker
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            "CACHE_BACKEND",
+            default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get("CACHE_LOCATION", default=''),
+    }
+}
+
+# Seconds a tenant's compiled workflow graph is kept. Stage moves are
+# authorized against it, so this bounds how long a worker that missed an
+# invalidation applies old approver rules. Can be raised with a shared cache
+WORKFLOW_CACHE_TIMEOUT = int(
+    os.environ.get("WORKFLOW_CACHE_TIMEOUT", default=60))
+
 FROM_EMAIL = os.environ.get("FROM_EMAIL", default='localhost@localhost')
 
 RELEASECAB_ONLY_ONE_TENANT = int(os.environ.get(
     "RELEASECAB_ONLY_ONE_TENANT", default=1))
 
+# The archive_communications command moves communications older than
+# COMMUNICATION_RETENTION_DAYS out of the inbox into the archive table, and
+# deletes archived ones older than COMMUNICATION_ARCHIVE_DAYS. 0 keeps them
+COMMUNICATION_RETENTION_DAYS = int(os.environ.get(
+    "COMMUNICATION_RETENTION_DAYS", default=90))
+COMMUNICATION_ARCHIVE_DAYS = int(os.environ.get(
+    "COMMUNICATION_ARCHIVE_DAYS", default=365))
+
 if DEBUG:
     EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -0,0 +1,275 @@
+'''
+The starting data a new tenant can be given. Each template lists the rows
+to create per model, with stage connections and the initial stage given
+by stage name
+'''
+
+DEFAULT_TENANT_TEMPLATE = 'standard'
+
+TENANT_TEMPLATES = {
+    'standard': {
+        'label': 'Standard',
+        'description': 'Plan, get ready to deploy, then deploy releases',
+        'roles': [
+            {
+                'name': 'Technical Manager',
+                'description':
+                    'Typically can approve most stages of the release',
+            },
+            {
+                'name': 'Developers',
+                'description': 'Typically can create new releases',
+            },
+            {
+                'name': 'Testers',
+                'description':
+                    'Typically can approve certain stages of the release',
+            },
+        ],
+        'teams': [
+            {'name': 'Frontend'},
+            {'name': 'Backend'},
+            {'name': 'Leadership'},
+        ],
+        'release_types': [
+            {
+                'name': 'Feature',
+                'description': 'The release is for a new feature',
+            },
+            {
+                'name': 'Hotfix',
+                'description': 'The release is for a hotfix',
+            },
+            {
+                'name': 'Patch',
+                'description': 'The release is for patching',
+            },
+        ],
+        'release_environments': [
+            {
+                'name': 'Production',
+                'description': 'Production environment',
+            },
+            {
+                'name': 'Staging',
+                'description': 'Staging environment',
+            },
+        ],
+        'release_stages': [
+            {
+                'name': 'Planning in Progress',
+                'description': 'Planning in Progress',
+                'allow_release_delete': True,
+                'allow_release_update': True,
+            },
+            {
+                'name': 'In Progress',
+                'description': 'In Progress',
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Ready To Deploy',
+                'description': 'Ready To Deploy',
+                'allow_release_delete': True,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Completed',
+                'description': 'Completed',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Cancelled',
+                'description': 'Cancelled',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+        ],
+        'release_stage_connections': [
+            ('In Progress', 'Completed'),
+            ('Planning in Progress', 'Cancelled'),
+            ('Planning in Progress', 'Ready To Deploy'),
+            ('Ready To Deploy', 'In Progress'),
+            ('Ready To Deploy', 'Cancelled'),
+        ],
+        'initial_stage': 'Planning in Progress',
+    },
+    'simple': {
+        'label': 'Simple',
+        'description': 'A short workflow for small teams',
+        'roles': [
+            {
+                'name': 'Developers',
+                'description': 'Typically can create new releases',
+            },
+        ],
+        'teams': [
+            {'name': 'Engineering'},
+        ],
+        'release_types': [
+            {
+                'name': 'Feature',
+                'description': 'The release is for a new feature',
+            },
+            {
+                'name': 'Hotfix',
+                'description': 'The release is for a hotfix',
+            },
+        ],
+        'release_environments': [
+            {
+                'name': 'Production',
+                'description': 'Production environment',
+            },
+        ],
+        'release_stages': [
+            {
+                'name': 'Planning in Progress',
+                'description': 'Planning in Progress',
+                'allow_release_delete': True,
+                'allow_release_update': True,
+            },
+            {
+                'name': 'In Progress',
+                'description': 'In Progress',
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Completed',
+                'description': 'Completed',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Cancelled',
+                'description': 'Cancelled',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+        ],
+        'release_stage_connections': [
+            ('Planning in Progress', 'In Progress'),
+            ('Planning in Progress', 'Cancelled'),
+            ('In Progress', 'Completed'),
+            ('In Progress', 'Cancelled'),
+        ],
+        'initial_stage': 'Planning in Progress',
+    },
+    'change_advisory': {
+        'label': 'Change Advisory Board',
+        'description':
+            'Changes are reviewed and approved before they are deployed',
+        'roles': [
+            {
+                'name': 'Change Manager',
+                'description': 'Typically chairs the change advisory board',
+            },
+            {
+                'name': 'Developers',
+                'description': 'Typically can create new releases',
+            },
+            {
+                'name': 'Testers',
+                'description':
+                    'Typically can approve certain stages of the release',
+            },
+        ],
+        'teams': [
+            {'name': 'Engineering'},
+            {'name': 'Operations'},
+            {'name': 'Leadership'},
+        ],
+        'release_types': [
+            {
+                'name': 'Standard Change',
+                'description': 'A pre-approved, low risk change',
+            },
+            {
+                'name': 'Normal Change',
+                'description': 'A change that needs to be approved',
+            },
+            {
+                'name': 'Emergency Change',
+                'description': 'A change that has to be made straight away',
+            },
+        ],
+        'release_environments': [
+            {
+                'name': 'Production',
+                'description': 'Production environment',
+            },
+            {
+                'name': 'Staging',
+                'description': 'Staging environment',
+            },
+            {
+                'name': 'Development',
+                'description': 'Development environment',
+            },
+        ],
+        'release_stages': [
+            {
+                'name': 'Draft',
+                'description': 'The change is being written up',
+                'allow_release_delete': True,
+                'allow_release_update': True,
+            },
+            {
+                'name': 'Awaiting Approval',
+                'description': 'The change is waiting for the board',
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Approved',
+                'description': 'The change can be deployed',
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Deploying',
+                'description': 'The change is being deployed',
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Completed',
+                'description': 'Completed',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Rejected',
+                'description': 'The board did not approve the change',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+            {
+                'name': 'Cancelled',
+                'description': 'Cancelled',
+                'is_end_stage': True,
+                'allow_release_delete': False,
+                'allow_release_update': False,
+            },
+        ],
+        'release_stage_connections': [
+            ('Draft', 'Awaiting Approval'),
+            ('Draft', 'Cancelled'),
+            ('Awaiting Approval', 'Approved'),
+            ('Awaiting Approval', 'Rejected'),
+            ('Approved', 'Deploying'),
+            ('Approved', 'Cancelled'),
+            ('Deploying', 'Completed'),
+        ],
+        'initial_stage': 'Draft',
+    },
+}
@@ -3,131 +3,39 @@ from releasecab_api.release.models import (ReleaseConfig, ReleaseEnvironment,
                                            ReleaseStageConnection, ReleaseType)
 from releasecab_api.user.models import Role, Team
 
+from .default_data import DEFAULT_TENANT_TEMPLATE, TENANT_TEMPLATES
+
 
 class TenantHelpers():
     '''
     Tenant helpers
     '''
     @staticmethod
-    def set_default_data(tenant):
+    def set_default_data(tenant, template=DEFAULT_TENANT_TEMPLATE):
         '''
-        Set the default data for a new tenant
+        Set the default data for a new tenant from one of the named
+        TENANT_TEMPLATES, with a single insert per model
         '''
-        Role.objects.create(
-            name='Technical Manager',
-            description='Typically can approve most stages of the release',
-            tenant=tenant
-        )
-        Role.objects.create(
-            name='Developers',
-            description='Typically can create new releases',
-            tenant=tenant
-        )
-        Role.objects.create(
-            name='Testers',
-            description='Typically can approve certain stages of the release',
-            tenant=tenant
-        )
-        Team.objects.create(
-            name='Frontend',
-            tenant=tenant
-        )
-        Team.objects.create(
-            name='Backend',
-            tenant=tenant
-        )
-        Team.objects.create(
-            name='Leadership',
-            tenant=tenant
-        )
-        ReleaseType.objects.create(
-            name='Feature',
-            description='The release is for a new feature',
-            tenant=tenant
-        )
-        ReleaseType.objects.create(
-            name='Hotfix',
-            description='The release is for a hotfix',
-            tenant=tenant
-        )
-        ReleaseType.objects.create(
-            name='Patch',
-            description='The release is for patching',
-            tenant=tenant
-        )
-        ReleaseEnvironment.objects.create(
-            name='Production',
-            description='Production environment',
-            tenant=tenant
-        )
-        ReleaseEnvironment.objects.create(
-            name='Staging',
-            description='Staging environment',
-            tenant=tenant
-        )
-        planning_stage = ReleaseStage.objects.create(
-            name='Planning in Progress',
-            description='Planning in Progress',
-            allow_release_delete=True,
-            allow_release_update=True,
-            tenant=tenant
-        )
-        in_progress_stage = ReleaseStage.objects.create(
-            name='In Progress',
-            description='In Progress',
-            allow_release_delete=False,
-            allow_release_update=False,
-            tenant=tenant
-        )
-        ready_to_deploy_stage = ReleaseStage.objects.create(
-            name='Ready To Deploy',
-            description='Ready To Deploy',
-            allow_release_delete=True,
-            allow_release_update=False,
-            tenant=tenant
-        )
-        completed_stage = ReleaseStage.objects.create(
-            name='Completed',
-            description='Completed',
-            tenant=tenant,
-            is_end_stage=True,
-            allow_release_delete=False,
-            allow_release_update=False,
-        )
-        cancelled_stage = ReleaseStage.objects.create(
-            name='Cancelled',
-            description='Cancelled',
-            tenant=tenant,
-            is_end_stage=True,
-            allow_release_delete=False,
-            allow_release_update=False
-        )
-        ReleaseStageConnection.objects.create(
-            from_stage=in_progress_stage,
-            to_stage=completed_stage,
-            tenant=tenant,
-        )
-        ReleaseStageConnection.objects.create(
-            from_stage=planning_stage,
-            to_stage=cancelled_stage,
-            tenant=tenant,
-        )
-        ReleaseStageConnection.objects.create(
-            from_stage=planning_stage,
-            to_stage=ready_to_deploy_stage,
-            tenant=tenant,
-        )
-        ReleaseStageConnection.objects.create(
-            from_stage=ready_to_deploy_stage,
-            to_stage=in_progress_stage,
-            tenant=tenant,
-        )
-        ReleaseStageConnection.objects.create(
-            from_stage=ready_to_deploy_stage,
-            to_stage=cancelled_stage,
-            tenant=tenant,
-        )
+        data = TENANT_TEMPLATES[template]
+        for model, rows in (
+                (Role, data['roles']),
+                (Team, data['teams']),
+                (ReleaseType, data['release_types']),
+                (ReleaseEnvironment, data['release_environments'])):
+            model.objects.bulk_create([
+                model(tenant=tenant, **values) for values in rows])
+        stages = {
+            stage.name: stage
+            for stage in ReleaseStage.objects.bulk_create([
+                ReleaseStage(tenant=tenant, **values)
+                for values in data['release_stages']])}
+        ReleaseStageConnection.objects.bulk_create([
+            ReleaseStageConnection(
+                from_stage=stages[from_stage],
+                to_stage=stages[to_stage],
+                tenant=tenant)
+            for from_stage, to_stage in data['release_stage_connections']])
         ReleaseConfig.objects.create(
-            initial_stage=planning_stage,
+            initial_stage=stages[data['initial_stage']],
             tenant=tenant
         )
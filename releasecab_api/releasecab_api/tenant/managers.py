@@ -0,0 +1,18 @@
+from django.apps import apps
+from django.db import models
+from django.db.models import Exists, OuterRef
+
+
+class InvitedUserQuerySet(models.QuerySet):
+    def with_has_joined(self):
+        '''
+        Annotate whether a user with the invited email has joined the
+        tenant, as a subquery so it can be sorted and filtered on
+        '''
+        user_model = apps.get_model('user', 'User')
+        return self.annotate(
+            has_joined=Exists(user_model.objects.filter(
+                email=OuterRef('email'),
+                tenant=OuterRef('tenant'),
+            )),
+        )
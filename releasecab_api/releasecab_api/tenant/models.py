@@ -1,5 +1,7 @@
 from django.db import models
 
+from .managers import InvitedUserQuerySet
+
 
 class Tenant(models.Model):
     name = models.CharField(max_length=100)
@@ -11,6 +13,7 @@ class Tenant(models.Model):
 
 
 class InvitedUser(models.Model):
+    objects = InvitedUserQuerySet.as_manager()
     email = models.CharField(max_length=100)
     tenant = models.ForeignKey(
         Tenant, on_delete=models.CASCADE, db_index=True)
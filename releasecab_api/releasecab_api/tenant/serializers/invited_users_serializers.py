@@ -16,8 +16,8 @@ class InvitedUserSerializer(serializers.ModelSerializer):
             'pk', 'tenant', 'created_at']
 
     def get_has_joined(self, obj):
-        if 'request' in self.context:
-            user = self.context['request'].user
-            return User.objects.filter(
-                email=obj.email, tenant=user.tenant).exists()
-        return False
+        # Lists annotate it with InvitedUserQuerySet.with_has_joined
+        if hasattr(obj, 'has_joined'):
+            return obj.has_joined
+        return User.objects.filter(
+            email=obj.email, tenant=obj.tenant_id).exists()
@@ -3,12 +3,17 @@ import string
 
 from rest_framework import serializers
 
+from ..default_data import DEFAULT_TENANT_TEMPLATE, TENANT_TEMPLATES
 from ..helpers import TenantHelpers
 from ..models import Tenant
 
 
 class TenantSerializer(serializers.ModelSerializer):
     invite_code = serializers.CharField(required=False)
+    template = serializers.ChoiceField(
+        choices=list(TENANT_TEMPLATES),
+        default=DEFAULT_TENANT_TEMPLATE,
+        write_only=True)
 
     class Meta:
         model = Tenant
@@ -17,6 +22,7 @@ class TenantSerializer(serializers.ModelSerializer):
             'pk', 'created_at']
 
     def create(self, validated_data):
+        template = validated_data.pop('template', DEFAULT_TENANT_TEMPLATE)
         invite_code = ''.join(random.choices(
             string.ascii_letters + string.digits, k=10))
 
@@ -27,6 +33,6 @@ class TenantSerializer(serializers.ModelSerializer):
         tenant = Tenant.objects.create(
             **validated_data, invite_code=invite_code)
 
-        TenantHelpers.set_default_data(tenant=tenant)
+        TenantHelpers.set_default_data(tenant=tenant, template=template)
 
         return tenant
@@ -0,0 +1,60 @@
+from django.test import TestCase
+
+from releasecab_api.release.models import (ReleaseConfig, ReleaseEnvironment,
+                                           ReleaseStage,
+                                           ReleaseStageConnection, ReleaseType)
+from releasecab_api.user.models import Role, Team
+
+from ..default_data import TENANT_TEMPLATES
+from ..helpers import TenantHelpers
+from ..models import Tenant
+
+
+class TenantHelpersTest(TestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123")
+
+    def test_set_default_data(self):
+        with self.assertNumQueries(7):
+            TenantHelpers.set_default_data(self.tenant)
+        self.assertEqual(Role.objects.filter(tenant=self.tenant).count(), 3)
+        self.assertEqual(Team.objects.filter(tenant=self.tenant).count(), 3)
+        self.assertEqual(
+            ReleaseType.objects.filter(tenant=self.tenant).count(), 3)
+        self.assertEqual(
+            ReleaseEnvironment.objects.filter(tenant=self.tenant).count(), 2)
+        self.assertEqual(
+            set(ReleaseStage.objects.filter(
+                tenant=self.tenant, is_end_stage=True,
+            ).values_list('name', flat=True)),
+            {'Completed', 'Cancelled'})
+        self.assertEqual(
+            set(ReleaseStageConnection.objects.filter(
+                tenant=self.tenant,
+            ).values_list('from_stage__name', 'to_stage__name')),
+            set(TENANT_TEMPLATES['standard']['release_stage_connections']))
+        config = ReleaseConfig.objects.get(tenant=self.tenant)
+        self.assertEqual(config.initial_stage.name, 'Planning in Progress')
+
+    def test_every_template_applies(self):
+        for number, (name, template) in enumerate(TENANT_TEMPLATES.items()):
+            with self.subTest(template=name):
+                tenant = Tenant.objects.create(
+                    name=name,
+                    number_of_employees=50,
+                    invite_code=f"TEMPLATE{number}")
+                TenantHelpers.set_default_data(tenant, template=name)
+                self.assertEqual(
+                    ReleaseStage.objects.filter(tenant=tenant).count(),
+                    len(template['release_stages']))
+                self.assertEqual(
+                    ReleaseStageConnection.objects.filter(
+                        tenant=tenant).count(),
+                    len(template['release_stage_connections']))
+                self.assertEqual(
+                    ReleaseConfig.objects.get(
+                        tenant=tenant).initial_stage.name,
+                    template['initial_stage'])
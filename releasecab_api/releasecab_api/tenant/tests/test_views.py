@@ -1,8 +1,11 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from releasecab_api.release.models import ReleaseConfig, ReleaseStage
 from releasecab_api.user.models import User
 
 from ..models import InvitedUser, Tenant
@@ -74,6 +77,45 @@ class InvitedUserViewsTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def create_invites(self):
+        for email in ["b@example.com", "a@example.com", "c@example.com"]:
+            InvitedUser.objects.create(email=email, tenant=self.tenant)
+        for email in ["b@example.com", "c@example.com"]:
+            User.objects.create(email=email, tenant=self.tenant)
+        other_tenant = Tenant.objects.create(
+            name="Other Tenant",
+            number_of_employees=5,
+            invite_code="OTHER123")
+        User.objects.create(email="invited@example.com", tenant=other_tenant)
+
+    def test_invited_users_sorted_by_has_joined(self):
+        self.create_invites()
+        url = reverse('tenant-invited-users')
+        self.client.force_login(self.admin_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, {'sort_by': 'has_joined', 'order_by': 'desc'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(invite['email'], invite['has_joined'])
+             for invite in response.data['results']],
+            [("c@example.com", True),
+             ("b@example.com", True),
+             ("a@example.com", False),
+             ("invited@example.com", False)])
+        self.assertEqual(
+            len([query for query in queries.captured_queries
+                 if 'tenant_inviteduser' in query['sql']]), 2)
+
+    def test_invited_users_filtered_by_has_joined(self):
+        self.create_invites()
+        url = reverse('tenant-invited-users')
+        self.client.force_login(self.admin_user)
+        response = self.client.get(url, {'has_joined': 'false'})
+        self.assertEqual(
+            [invite['email'] for invite in response.data['results']],
+            ["a@example.com", "invited@example.com"])
+
     def test_normal_user_cannot_retrieve_invited_users_by_tenant_failure(self):
         url = reverse('tenant-invited-users')
         self.client.force_login(self.normal_user)
@@ -147,6 +189,41 @@ class TenantViewsTest(TestCase):
         response = self.client.post(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_create_tenant_from_template(self):
+        url = reverse('tenant-create')
+        payload = {
+            "name": "Small Tenant",
+            "number_of_employees": 5,
+            "template": "simple",
+        }
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn('template', response.data)
+        config = ReleaseConfig.objects.get(tenant_id=response.data['id'])
+        self.assertEqual(
+            ReleaseStage.objects.filter(tenant_id=response.data['id']).count(),
+            4)
+        self.assertEqual(config.initial_stage.name, 'Planning in Progress')
+
+    def test_create_tenant_unknown_template_failure(self):
+        url = reverse('tenant-create')
+        payload = {
+            "name": "New Tenant",
+            "number_of_employees": 100,
+            "template": "unknown",
+        }
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Tenant.objects.filter(name="New Tenant").exists())
+
+    def test_tenant_templates(self):
+        response = self.client.get(reverse('tenant-templates'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [template['name'] for template in response.data],
+            ['standard', 'simple', 'change_advisory'])
+        self.assertTrue(response.data[0]['is_default'])
+
     def test_admin_can_retrieve_tenant_by_invite_code_success(self):
         url = reverse('tenant-find-by-code')
         payload = {"tenant_code": self.invite_code}
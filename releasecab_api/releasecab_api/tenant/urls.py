@@ -8,7 +8,8 @@ from .views.invited_users_views import (AdminInvitedUserDetail,
                                         InvitedUserListByTenant)
 from .views.tenants_view import (AdminTenantDetail, AdminTenantList,
                                  FindTenantByInviteCodeView, MyTenant,
-                                 ReleaseCabSettingsView, TenantCreate)
+                                 ReleaseCabSettingsView, TenantCreate,
+                                 TenantTemplateList)
 
 urlpatterns = [
     # Admin
@@ -25,6 +26,10 @@ urlpatterns = [
          name='admin-invited-user-detail'),
     # Tenants
     path('create/', TenantCreate.as_view(), name='tenant-create'),
+    path(
+        'templates/',
+        TenantTemplateList.as_view(),
+        name='tenant-templates'),
     path('', MyTenant.as_view(), name='my-tenant-detail'),
     path(
         'find-by-invite-code/',
@@ -10,7 +10,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
-from releasecab_api.user.models import User
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import InvitedUser
 from ..serializers.invited_users_serializers import InvitedUserSerializer
@@ -22,7 +22,7 @@ class AdminInvitedUserList(ListAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = InvitedUser.objects.all()
+    queryset = InvitedUser.objects.with_has_joined()
     serializer_class = InvitedUserSerializer
 
 
@@ -34,13 +34,15 @@ class AdminInvitedUserDetail(RetrieveAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = InvitedUser.objects.all()
+    queryset = InvitedUser.objects.with_has_joined()
     serializer_class = InvitedUserSerializer
 
 
-class InvitedUserListByTenant(ListAPIView):
+class InvitedUserListByTenant(ReadOnlyViewMixin, ListAPIView):
     """
-    GET View to retrieve a list of invited users based on the user's tenant
+    GET View to retrieve a list of invited users based on the user's tenant.
+    Pass has_joined=true or false to only list invites that have or have
+    not been taken up
     """
     permission_classes = [IsAuthenticated, IsTenantOwnerPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
@@ -48,32 +50,26 @@ class InvitedUserListByTenant(ListAPIView):
 
     def get_queryset(self):
         tenant = self.request.user.tenant
-        invited_users = InvitedUser.objects.filter(tenant=tenant)
+        invited_users = InvitedUser.objects.filter(
+            tenant=tenant).with_has_joined()
         disable_pagination = self.request.query_params.get(
             'disable_pagination', False)
         if disable_pagination and disable_pagination.lower() == 'true':
             self.pagination_class = None
+        has_joined = self.request.query_params.get('has_joined', '').lower()
+        if has_joined in ['true', 'false']:
+            invited_users = invited_users.filter(
+                has_joined=has_joined == 'true')
         sort_by = self.request.query_params.get('sort_by', 'email')
         order = self.request.query_params.get('order_by', 'asc')
 
         if order not in ['asc', 'desc']:
             order = 'asc'
 
-        if sort_by == "has_joined":
-            def sorting_key(obj):
-                user = self.request.user
-                return User.objects.filter(
-                    email=obj.email, tenant=user.tenant).exists()
-            invited_users = sorted(
-                invited_users,
-                key=sorting_key,
-                reverse=(order == 'desc')
-            )
+        if order == 'asc':
+            invited_users = invited_users.order_by(sort_by, 'id')
         else:
-            if order == 'asc':
-                invited_users = invited_users.order_by(sort_by)
-            else:
-                invited_users = invited_users.order_by(f'-{sort_by}')
+            invited_users = invited_users.order_by(f'-{sort_by}', '-id')
 
         return invited_users
 
@@ -8,7 +8,9 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from releasecab_api.api_permissions import IsAdminPermission
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
+from ..default_data import DEFAULT_TENANT_TEMPLATE, TENANT_TEMPLATES
 from ..models import Tenant
 from ..serializers.tenant_serializers import TenantSerializer
 
@@ -45,7 +47,25 @@ class TenantCreate(CreateAPIView):
     serializer_class = TenantSerializer
 
 
-class MyTenant(RetrieveAPIView):
+class TenantTemplateList(ReadOnlyViewMixin, APIView):
+    """
+    GET the templates a new tenant can start from. Doesn't require auth,
+    it's needed before the tenant exists
+    """
+    permission_classes: list = []
+    authentication_classes: list = []
+
+    def get(self, request):
+        return Response([
+            {
+                'name': name,
+                'label': template['label'],
+                'description': template['description'],
+                'is_default': name == DEFAULT_TENANT_TEMPLATE,
+            } for name, template in TENANT_TEMPLATES.items()])
+
+
+class MyTenant(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET the user's tenant, user must be authenticated first
     """
@@ -75,7 +95,7 @@ class FindTenantByInviteCodeView(CreateAPIView):
                             status=status.HTTP_404_NOT_FOUND)
 
 
-class ReleaseCabSettingsView(APIView):
+class ReleaseCabSettingsView(ReadOnlyViewMixin, APIView):
     """
     GET tenant config, no auth required
     """
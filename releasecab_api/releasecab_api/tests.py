@@ -1,14 +1,36 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from rest_framework.test import APIRequestFactory
+from django.core.cache import cache
+from django.core.handlers.base import BaseHandler
+from django.db import connection, connections
+from django.test import (RequestFactory, TestCase, TransactionTestCase,
+                         override_settings)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
 
 from releasecab_api.api_permissions import (CanCreateBlackoutsPermission,
                                             CanCreateReleasesPermission,
                                             IsAdminPermission,
                                             IsTenantOwnerOrTeamManager,
                                             IsTenantOwnerPermission)
+from releasecab_api.blackout.helpers import BlackoutHelpers
+from releasecab_api.blackout.models import Blackout
+from releasecab_api.db_router import (PrimaryPinMiddleware,
+                                      PrimaryReplicaRouter,
+                                      is_pinned_to_primary, pin_to_primary,
+                                      start_replica_reads, stop_replica_reads)
+from releasecab_api.release.models import Release, ReleaseStage, ReleaseType
+from releasecab_api.release.stats import get_open_release_counts
+from releasecab_api.release.workflow import WorkflowGraph
 from releasecab_api.tenant.models import Tenant
 from releasecab_api.user.models import Team
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 User = get_user_model()
 
@@ -60,6 +82,8 @@ class PermissionsTestCase(TestCase):
                 request, None))
         self.team.can_create_blackouts = True
         self.team.save()
+        # Team changes are seen from the next request on
+        request.user = User.objects.get(pk=self.user.pk)
         self.assertTrue(
             CanCreateBlackoutsPermission().has_permission(
                 request, None))
@@ -72,6 +96,8 @@ class PermissionsTestCase(TestCase):
                 request, None))
         self.team.can_create_releases = True
         self.team.save()
+        # Team changes are seen from the next request on
+        request.user = User.objects.get(pk=self.user.pk)
         self.assertTrue(
             CanCreateReleasesPermission().has_permission(
                 request, None))
@@ -95,6 +121,294 @@ class PermissionsTestCase(TestCase):
                 request, None))
 
         self.team.managers.add(self.user)
+        # Team changes are seen from the next request on
+        request.user = User.objects.get(pk=self.user.pk)
         self.assertTrue(
             IsTenantOwnerOrTeamManager().has_permission(
                 request, None))
+
+    def test_permissions_share_one_principal_per_request(self):
+        self.team.can_create_releases = True
+        self.team.save()
+        self.team.managers.add(self.user)
+        request = APIRequestFactory().get('/')
+        request.user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertTrue(
+                CanCreateReleasesPermission().has_permission(
+                    request, None))
+            self.assertFalse(
+                CanCreateBlackoutsPermission().has_permission(
+                    request, None))
+            self.assertTrue(
+                IsTenantOwnerOrTeamManager().has_permission(
+                    request, None))
+            self.assertTrue(
+                IsTenantOwnerOrTeamManager().has_object_permission(
+                    request, None, self.team))
+
+
+class TransactionProbeView(APIView):
+    permission_classes: list = []
+    authentication_classes: list = []
+
+    def get(self, request):
+        return Response({'atomic': connection.in_atomic_block})
+
+    def post(self, request):
+        return Response({'atomic': connection.in_atomic_block})
+
+
+class ReadOnlyTransactionProbeView(ReadOnlyViewMixin, TransactionProbeView):
+    pass
+
+
+class ReadOnlyViewMixinTestCase(TransactionTestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def get_response(self, view_class, method):
+        # Wraps the view the way the request handler does for
+        # ATOMIC_REQUESTS
+        view = BaseHandler().make_view_atomic(view_class.as_view())
+        request = getattr(self.factory, method)('/')
+        return view(request).data
+
+    def test_views_run_in_request_transaction(self):
+        self.assertTrue(
+            self.get_response(TransactionProbeView, 'get')['atomic'])
+
+    def test_read_only_view_reads_outside_transaction(self):
+        self.assertFalse(
+            self.get_response(ReadOnlyTransactionProbeView, 'get')['atomic'])
+
+    def test_read_only_view_writes_in_transaction(self):
+        self.assertTrue(
+            self.get_response(
+                ReadOnlyTransactionProbeView, 'post')['atomic'])
+
+
+class RoutingProbeView(APIView):
+    permission_classes: list = []
+
+    def get(self, request):
+        return Response({'db': Tenant.objects.all().db})
+
+    def post(self, request):
+        return Response({'db': Tenant.objects.all().db})
+
+
+class ReadOnlyRoutingProbeView(ReadOnlyViewMixin, RoutingProbeView):
+    pass
+
+
+class TenantNamesView(ReadOnlyViewMixin, APIView):
+    permission_classes: list = []
+
+    def get(self, request):
+        return Response(list(Tenant.objects.values_list('name', flat=True)))
+
+
+class PrimaryReplicaRouterTestCase(TransactionTestCase):
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123"
+        )
+        self.user = User.objects.create(
+            email='test@example.com',
+            password='password123',
+            tenant=self.tenant
+        )
+
+    def get_response(self, view_class, method, user):
+        view = BaseHandler().make_view_atomic(view_class.as_view())
+        request = getattr(self.factory, method)('/')
+        force_authenticate(request, user)
+        return view(request).data
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_read_only_view_reads_from_replica(self):
+        self.assertEqual(
+            self.get_response(ReadOnlyRoutingProbeView, 'get', self.user)[
+                'db'],
+            'replica_1')
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_other_reads_stay_on_primary(self):
+        self.assertEqual(
+            self.get_response(RoutingProbeView, 'get', self.user)['db'],
+            'default')
+        self.assertEqual(
+            self.get_response(ReadOnlyRoutingProbeView, 'post', self.user)[
+                'db'],
+            'default')
+        # Nothing outside the request is routed to the replica
+        self.assertEqual(Tenant.objects.all().db, 'default')
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_pinned_user_reads_from_primary(self):
+        pin_to_primary(self.user)
+        self.assertEqual(
+            self.get_response(ReadOnlyRoutingProbeView, 'get', self.user)[
+                'db'],
+            'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_reads_from_primary_without_replicas(self):
+        self.assertEqual(
+            self.get_response(ReadOnlyRoutingProbeView, 'get', self.user)[
+                'db'],
+            'default')
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_replicas_are_not_migrated(self):
+        router = PrimaryReplicaRouter()
+        self.assertTrue(router.allow_migrate('default', 'release'))
+        self.assertFalse(router.allow_migrate('replica_1', 'release'))
+
+    @skipUnless(
+        settings.DATABASE_REPLICAS, 'POSTGRES_REPLICA_HOSTS is not set')
+    def test_read_only_view_queries_replica(self):
+        replica = settings.DATABASE_REPLICAS[0]
+        with override_settings(DATABASE_REPLICAS=[replica]), \
+                CaptureQueriesContext(connections[replica]) as queries:
+            names = self.get_response(TenantNamesView, 'get', self.user)
+        self.assertEqual(names, ['Test Tenant'])
+        self.assertEqual(len(queries), 1)
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1'])
+class PrimaryPinMiddlewareTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123"
+        )
+        self.user = User.objects.create(
+            email='test@example.com',
+            password='password123',
+            tenant=self.tenant
+        )
+
+    def call_middleware(self, method):
+        request = getattr(RequestFactory(), method)('/')
+
+        def get_response(request):
+            # The user is only known once the view has authenticated them
+            request.user = self.user
+            return Response()
+
+        return PrimaryPinMiddleware(get_response)(request)
+
+    def test_write_pins_user_to_primary(self):
+        self.call_middleware('post')
+        self.assertTrue(is_pinned_to_primary(self.user))
+
+    def test_read_does_not_pin_user(self):
+        self.call_middleware('get')
+        self.assertFalse(is_pinned_to_primary(self.user))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_pin_without_replicas(self):
+        self.call_middleware('post')
+        self.assertFalse(is_pinned_to_primary(self.user))
+
+    @override_settings(REPLICA_STICKY_SECONDS=0)
+    def test_pin_expires(self):
+        self.call_middleware('post')
+        self.assertFalse(is_pinned_to_primary(self.user))
+
+
+class StaleReplicaTestCase(TransactionTestCase):
+    '''
+    Shared caches rebuilt during a replica read, while the replica has not
+    caught up with a change just committed on the primary
+    '''
+    replica = 'stale_replica'
+
+    def setUp(self):
+        cache.clear()
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            number_of_employees=50,
+            invite_code="TEST123"
+        )
+        self.user = User.objects.create(
+            email='test@example.com',
+            password='password123',
+            tenant=self.tenant
+        )
+        # A second connection to the test database that keeps reading from
+        # a snapshot taken before the test makes its change
+        connections.settings[self.replica] = {
+            **connections['default'].settings_dict}
+        with connections[self.replica].cursor() as cursor:
+            cursor.execute('BEGIN ISOLATION LEVEL REPEATABLE READ')
+            cursor.execute('SELECT 1')
+        self.addCleanup(self.remove_replica)
+
+    def remove_replica(self):
+        connections[self.replica].close()
+        del connections[self.replica]
+        del connections.settings[self.replica]
+
+    def read_from_replica(self, read):
+        token = start_replica_reads()
+        try:
+            with override_settings(DATABASE_REPLICAS=[self.replica]):
+                return read()
+        finally:
+            stop_replica_reads(token)
+
+    def assertStaleOnReplica(self, queryset):
+        self.assertTrue(queryset.exists())
+        self.assertFalse(self.read_from_replica(queryset.exists))
+
+    def test_workflow_graph_compiled_from_primary(self):
+        stage = ReleaseStage.objects.create(
+            name="New Stage", tenant=self.tenant)
+        self.assertStaleOnReplica(ReleaseStage.objects.filter(pk=stage.pk))
+        graph = self.read_from_replica(
+            lambda: WorkflowGraph.for_tenant(self.tenant.id))
+        self.assertTrue(graph.has_stage(stage.id))
+
+    def test_blackout_schedule_built_from_primary(self):
+        now = timezone.now()
+        blackout = Blackout.objects.create(
+            name="New Blackout",
+            start_date=now + timedelta(days=1),
+            end_date=now + timedelta(days=2),
+            tenant=self.tenant,
+            owner=self.user)
+        self.assertStaleOnReplica(Blackout.objects.filter(pk=blackout.pk))
+        schedule = self.read_from_replica(
+            lambda: BlackoutHelpers.get_schedule(self.tenant.id))
+        self.assertEqual(
+            [window['id'] for window in schedule['windows']], [blackout.id])
+
+    def test_release_counts_from_primary(self):
+        now = timezone.now()
+        release = Release.objects.create(
+            name="New Release",
+            identifier="TEST-1",
+            tenant=self.tenant,
+            release_type=ReleaseType.objects.create(
+                name="Test Type", tenant=self.tenant),
+            start_date=now,
+            end_date=now + timedelta(hours=1),
+            owner=self.user,
+            current_stage=ReleaseStage.objects.create(
+                name="Test Stage", tenant=self.tenant))
+        self.assertStaleOnReplica(Release.objects.filter(pk=release.pk))
+        self.assertEqual(
+            self.read_from_replica(
+                lambda: get_open_release_counts(self.user)),
+            (1, 1))
@@ -1,4 +1,8 @@
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from releasecab_api.tenant.models import Tenant
@@ -32,3 +36,37 @@ class CustomUserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
 
         return self._create_user(email, password, **extra_fields)
+
+
+class TeamQuerySet(models.QuerySet):
+    def with_members(self):
+        '''
+        Prefetch the members and managers TeamSerializer lists, loading
+        only the columns their labels are built from
+        '''
+        names_only = get_user_model().objects.only(
+            'id', 'first_name', 'last_name')
+        return self.prefetch_related(
+            Prefetch('members', queryset=names_only),
+            Prefetch('managers', queryset=names_only),
+        )
+
+    def with_member_counts(self):
+        '''
+        Annotate member_count and manager_count, for listing large teams
+        without loading who is in them
+        '''
+        return self.annotate(
+            member_count=self._count_links('members'),
+            manager_count=self._count_links('managers'),
+        )
+
+    def _count_links(self, field_name):
+        # A subquery per relation, joining both would multiply the rows
+        through = self.model._meta.get_field(field_name).remote_field.through
+        links = through.objects.filter(
+            team=OuterRef('pk'),
+        ).order_by().values('team').annotate(
+            count=Count('*'),
+        ).values('count')
+        return Coalesce(Subquery(links), 0)
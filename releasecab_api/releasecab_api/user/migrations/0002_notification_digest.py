@@ -0,0 +1,20 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='notification_digest_minutes',
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text='Collect notifications into one summary message sent at             most this often. 0 sends each notification straight away.'),
+        ),
+    ]
@@ -5,7 +5,7 @@ from django.db import models
 
 from releasecab_api.base_model import BaseReleaseCabModel
 
-from .managers import CustomUserManager
+from .managers import CustomUserManager, TeamQuerySet
 
 
 class User(AbstractUser, BaseReleaseCabModel):
@@ -28,6 +28,10 @@ class User(AbstractUser, BaseReleaseCabModel):
         default=True,
         help_text='Designates whether this user is active and allowed \
             to sign in')
+    notification_digest_minutes = models.PositiveIntegerField(
+        default=0,
+        help_text='Collect notifications into one summary message sent at \
+            most this often. 0 sends each notification straight away.')
     # TODO: Add profile picture
     # TODO: Add preferred homepage
 
@@ -44,6 +48,7 @@ class Role(BaseReleaseCabModel):
 
 
 class Team(BaseReleaseCabModel):
+    objects = TeamQuerySet.as_manager()
     name = models.CharField(max_length=100)
     members = models.ManyToManyField(
         User, related_name='teams_as_member', blank=True)
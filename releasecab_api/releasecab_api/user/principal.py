@@ -0,0 +1,111 @@
+from django.db.models import Value
+from django.utils.functional import cached_property
+
+from .models import Team
+
+
+class Principal:
+    '''
+    Everything authorization needs to know about a user: their tenant,
+    whether they own it, their roles, the teams they are a member or
+    manager of, and what those teams let them create. Each part is loaded
+    on first use and kept for the rest of the request
+    '''
+
+    def __init__(self, user):
+        self.user = user
+
+    @property
+    def tenant_id(self):
+        return self.user.tenant_id
+
+    @property
+    def is_tenant_owner(self):
+        return self.user.is_tenant_owner
+
+    @classmethod
+    def for_user(cls, user):
+        '''
+        The principal for a user. request.user is built per request, so
+        keeping it on the user shares it between permission classes,
+        helpers and serializers for that request only
+        '''
+        if not hasattr(user, '_principal'):
+            user._principal = cls(user)
+        return user._principal
+
+    def _is_prefetched(self, *relations):
+        prefetched = getattr(self.user, '_prefetched_objects_cache', {})
+        return all(relation in prefetched for relation in relations)
+
+    @cached_property
+    def role_ids(self):
+        if self._is_prefetched('role'):
+            return frozenset(role.id for role in self.user.role.all())
+        return frozenset(self.user.role.values_list('id', flat=True))
+
+    @cached_property
+    def _team_links(self):
+        '''
+        (team id, can create blackouts, can create releases, is manager)
+        for every team the user belongs to, in one query unless a list
+        view already prefetched the teams
+        '''
+        if self._is_prefetched('teams_as_member', 'teams_as_manager'):
+            return [
+                (team.id,
+                 team.can_create_blackouts,
+                 team.can_create_releases,
+                 is_manager)
+                for is_manager, teams in (
+                    (False, self.user.teams_as_member.all()),
+                    (True, self.user.teams_as_manager.all()))
+                for team in teams]
+        fields = (
+            'team_id',
+            'team__can_create_blackouts',
+            'team__can_create_releases',
+            'is_manager')
+        memberships = Team.members.through.objects.filter(
+            user_id=self.user.id,
+        ).annotate(is_manager=Value(False)).values_list(*fields)
+        managements = Team.managers.through.objects.filter(
+            user_id=self.user.id,
+        ).annotate(is_manager=Value(True)).values_list(*fields)
+        return list(memberships.union(managements, all=True))
+
+    @cached_property
+    def member_team_ids(self):
+        return frozenset(
+            team_id for team_id, _, _, is_manager in self._team_links
+            if not is_manager)
+
+    @cached_property
+    def managed_team_ids(self):
+        return frozenset(
+            team_id for team_id, _, _, is_manager in self._team_links
+            if is_manager)
+
+    @property
+    def team_ids(self):
+        return self.member_team_ids | self.managed_team_ids
+
+    @property
+    def is_manager(self):
+        return bool(self.managed_team_ids)
+
+    @property
+    def can_create_blackouts(self):
+        # Tenant owners are assumed to be able to create blackouts
+        return self.is_tenant_owner or any(
+            can_create_blackouts
+            for _, can_create_blackouts, _, is_manager in self._team_links
+            if not is_manager)
+
+    @property
+    def can_create_releases(self):
+        # Tenant owners are assumed to be able to create releases
+        return self.is_tenant_owner or any(
+            can_create_releases
+            for _, _, can_create_releases, is_manager in self._team_links
+            if not is_manager)
@@ -16,6 +16,16 @@ class TeamSerializer(serializers.ModelSerializer):
         kwargs['partial'] = True
         super(TeamSerializer, self).__init__(*args, **kwargs)
 
+    def get_fields(self):
+        fields = super().get_fields()
+        # Teams annotated by TeamQuerySet.with_member_counts
+        if self.context.get('member_counts'):
+            del fields['members'], fields['managers']
+            fields['member_count'] = serializers.IntegerField(read_only=True)
+            fields['manager_count'] = serializers.IntegerField(
+                read_only=True)
+        return fields
+
     def update(self, instance, validated_data):
         members_data = self.context['request'].data.get('members', None)
         if members_data is not None:
@@ -32,6 +42,8 @@ class TeamSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
+        if 'managers' not in representation:
+            return representation
         representation['managers'] = [
             {
                 'label': f'{manager.first_name} {manager.last_name}',
@@ -1,10 +1,10 @@
 import os
 
-from django.conf import settings
-from django.core.mail import send_mail
 from django.dispatch import receiver
 from django_rest_passwordreset.signals import reset_password_token_created
 
+from releasecab_api.communication.helpers import CommunicationHelpers
+
 
 @receiver(reset_password_token_created)
 def password_reset_token_created(
@@ -40,9 +40,9 @@ def password_reset_token_created(
         f"If you didn't request this, you can ignore this email.\n\n" \
         f"Thank you,\nThe Release CAB Team"
 
-    send_mail(
+    # Sent by the send_outbox command once the token is committed
+    CommunicationHelpers.queue_email(
+        reset_password_token.user.tenant_id,
+        reset_password_token.user.email,
         email_subject,
-        email_body,
-        settings.FROM_EMAIL,
-        [reset_password_token.user.email],
-    )
+        email_body)
@@ -1,8 +1,12 @@
+from django.core import mail
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from releasecab_api.communication.models import OutboxEmail
 from releasecab_api.tenant.models import Tenant
 
 from ..models import Role, Team, User
@@ -204,6 +208,53 @@ class TeamViewsTest(TestCase):
         response = self.client.post(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def add_team(self, number):
+        team = Team.objects.create(
+            name=f"Team {number}", tenant=self.tenant)
+        team.members.add(self.admin_user, self.tenant_owner)
+        team.managers.add(self.tenant_owner)
+        return team
+
+    def test_team_list_query_count_is_constant(self):
+        url = reverse('team-list-by-tenant') + '?disable_pagination=true'
+        self.client.force_login(self.admin_user)
+        self.add_team(1)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(url)
+        for number in range(2, 7):
+            self.add_team(number)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(len(queries), len(baseline))
+        team = next(team for team in response.data if team['name'] == 'Team 6')
+        self.assertEqual(len(team['members']), 2)
+        self.assertEqual(
+            team['managers'], [{'label': ' ', 'value': self.tenant_owner.id}])
+
+    def test_team_list_member_counts(self):
+        self.add_team(1)
+        url = reverse('team-list-by-tenant') + \
+            '?disable_pagination=true&member_counts=true'
+        self.client.force_login(self.admin_user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {
+            team['name']: (team['member_count'], team['manager_count'])
+            for team in response.data}
+        self.assertEqual(counts, {'Test Team': (0, 0), 'Team 1': (2, 1)})
+        self.assertNotIn('members', response.data[0])
+        self.assertNotIn('managers', response.data[0])
+
+    def test_team_retrieve_member_counts(self):
+        team = self.add_team(1)
+        url = reverse('team-retrieve', kwargs={'pk': team.pk})
+        self.client.force_login(self.admin_user)
+        response = self.client.get(url, {'member_counts': 'true'})
+        self.assertEqual(response.data['member_count'], 2)
+        self.assertEqual(response.data['manager_count'], 1)
+
 
 class UserViewsTest(TestCase):
     def setUp(self):
@@ -289,6 +340,49 @@ class UserViewsTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def add_team_user(self, number):
+        user = User.objects.create(
+            email=f"member{number}@example.com",
+            password="password789",
+            tenant=self.tenant
+        )
+        team = Team.objects.create(
+            name=f"Team {number}", tenant=self.tenant)
+        team.members.add(user, self.user)
+        team.managers.add(user)
+        user.role.add(Role.objects.create(
+            name=f"Role {number}", tenant=self.tenant))
+        return user
+
+    def count_selects(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len([query for query in queries.captured_queries
+                    if query['sql'].startswith('SELECT')])
+
+    def test_user_list_by_tenant_query_count_is_constant(self):
+        url = reverse('user-list-by-tenant')
+        self.client.force_login(self.admin_user)
+        self.add_team_user(1)
+        baseline = self.count_selects(url)
+        for number in range(2, 7):
+            self.add_team_user(number)
+        self.assertEqual(self.count_selects(url), baseline)
+
+    def test_me_detail_query_count_is_constant(self):
+        url = reverse('me-detail')
+        self.client.force_login(self.user)
+        self.add_team_user(1)
+        baseline = self.count_selects(url)
+        for number in range(2, 7):
+            self.add_team_user(number)
+        self.assertEqual(self.count_selects(url), baseline)
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['teams']), 6)
+        self.assertEqual(len(response.data['teams'][0]['members']), 2)
+        self.assertFalse(response.data['is_manager'])
+
     def test_user_profile_search_view(self):
         url = reverse('user-profile-search')
         self.client.force_login(self.admin_user)
@@ -304,6 +398,17 @@ class UserViewsTest(TestCase):
         response = self.client.post(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_password_reset_queues_email(self):
+        url = reverse('password_reset:reset-password-request')
+        response = self.client.post(
+            url, {"email": "user@example.com"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to_email, "user@example.com")
+        self.assertEqual(email.tenant, self.tenant)
+        self.assertIn("/forgot-password?token=", email.body)
+
     def test_login_view(self):
         url = reverse('login')
         payload = {"email": "user@example.com", "password": "password789"}
@@ -11,6 +11,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import Role
 from ..serializers.role_serializers import RoleSerializer
@@ -38,7 +39,7 @@ class AdminRoleDetail(RetrieveAPIView):
     serializer_class = RoleSerializer
 
 
-class RoleListByTenant(ListAPIView):
+class RoleListByTenant(ReadOnlyViewMixin, ListAPIView):
     """
     GET View to retrieve a list of Roles for a specific user's tenant
     """
@@ -166,7 +167,7 @@ class RoleCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class GetRoleById(RetrieveAPIView):
+class GetRoleById(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET View to retrieve a detail of role
     """
@@ -13,23 +13,47 @@ from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerOrTeamManager,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import Team, User
 from ..serializers.team_serializers import (AddUserToTeamsSerializer,
                                             TeamSerializer)
 
 
-class AdminTeamList(ListAPIView):
+class TeamMembersMixin:
+    """
+    Loads what TeamSerializer renders up front. With member_counts=true
+    teams come back with member and manager counts instead of the lists
+    """
+
+    def member_counts_requested(self):
+        member_counts = self.request.query_params.get('member_counts', '')
+        return member_counts.lower() == 'true'
+
+    def with_members(self, teams):
+        if self.member_counts_requested():
+            return teams.with_member_counts()
+        return teams.with_members()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['member_counts'] = self.member_counts_requested()
+        return context
+
+
+class AdminTeamList(TeamMembersMixin, ListAPIView):
     """
     GET View to retrieve a list of Teams. Admin Only.
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = Team.objects.all()
     serializer_class = TeamSerializer
 
+    def get_queryset(self):
+        return self.with_members(Team.objects.all())
+
 
-class AdminTeamDetail(RetrieveAPIView):
+class AdminTeamDetail(TeamMembersMixin, RetrieveAPIView):
     """
     GET View to retrieve a detail of a specific Team
     Takes in the primary key of the User to retrieve.
@@ -37,11 +61,13 @@ class AdminTeamDetail(RetrieveAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = Team.objects.all()
     serializer_class = TeamSerializer
 
+    def get_queryset(self):
+        return self.with_members(Team.objects.all())
+
 
-class TeamListByTenant(ListAPIView):
+class TeamListByTenant(ReadOnlyViewMixin, TeamMembersMixin, ListAPIView):
     """
     GET View to retrieve a list of teams for a specific user's tenant
     """
@@ -51,7 +77,7 @@ class TeamListByTenant(ListAPIView):
 
     def get_queryset(self):
         tenant = self.request.user.tenant
-        teams = Team.objects.filter(tenant=tenant)
+        teams = self.with_members(Team.objects.filter(tenant=tenant))
         disable_pagination = self.request.query_params.get(
             'disable_pagination', False)
         if disable_pagination and disable_pagination.lower() == 'true':
@@ -128,7 +154,7 @@ class TeamDeleteAPIView(DestroyAPIView):
         super(TeamDeleteAPIView, self).perform_destroy(instance)
 
 
-class TeamRetrieve(RetrieveAPIView):
+class TeamRetrieve(ReadOnlyViewMixin, TeamMembersMixin, RetrieveAPIView):
     """
     GET a team by identifier.
     """
@@ -141,7 +167,7 @@ class TeamRetrieve(RetrieveAPIView):
         tenant = self.request.user.tenant
 
         try:
-            releases = Team.objects.get(
+            releases = self.with_members(Team.objects.all()).get(
                 id=id, tenant=tenant)
             self.check_object_permissions(self.request, releases)
             return releases
@@ -228,7 +254,8 @@ class AddUserToTeamsView(CreateAPIView):
                 status=status.HTTP_404_NOT_FOUND)
 
 
-class UserManagedTeamsListView(ListAPIView):
+class UserManagedTeamsListView(
+        ReadOnlyViewMixin, TeamMembersMixin, ListAPIView):
     """
     GET View to retrieve a list of teams the user manages
     """
@@ -239,7 +266,8 @@ class UserManagedTeamsListView(ListAPIView):
     def get_queryset(self):
         tenant = self.request.user.tenant
         user = self.request.user
-        teams = Team.objects.filter(managers=user, tenant=tenant)
+        teams = self.with_members(
+            Team.objects.filter(managers=user, tenant=tenant))
         disable_pagination = self.request.query_params.get(
             'disable_pagination', False)
         if disable_pagination and disable_pagination.lower() == 'true':
@@ -1,4 +1,5 @@
 from django.contrib.auth import authenticate, login, logout
+from django.db.models import prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from rest_framework import filters, status
 from rest_framework.authentication import SessionAuthentication
@@ -13,6 +14,7 @@ from releasecab_api.api_permissions import (IsAdminPermission,
                                             IsTenantOwnerOrTeamManager,
                                             IsTenantOwnerPermission)
 from releasecab_api.communication.helpers import CommunicationHelpers
+from releasecab_api.view_mixins import ReadOnlyViewMixin
 
 from ..models import User
 from ..serializers.user_serializers import (UserSerializer,
@@ -25,7 +27,8 @@ class AdminUserList(ListAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = User.objects.all()
+    queryset = User.objects.select_related('tenant').prefetch_related(
+        *UserSerializer.get_prefetches())
     serializer_class = UserSerializer
 
 
@@ -37,11 +40,12 @@ class AdminUserDetail(RetrieveAPIView):
     """
     permission_classes = [IsAuthenticated, IsAdminPermission]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
-    queryset = User.objects.all()
+    queryset = User.objects.select_related('tenant').prefetch_related(
+        *UserSerializer.get_prefetches())
     serializer_class = UserSerializer
 
 
-class MeDetail(RetrieveAPIView):
+class MeDetail(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET View to retrieve a detail of the current logged in user
     """
@@ -51,10 +55,12 @@ class MeDetail(RetrieveAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
+        user = self.request.user
+        prefetch_related_objects([user], *UserSerializer.get_prefetches())
+        return user
 
 
-class GetUserById(RetrieveAPIView):
+class GetUserById(ReadOnlyViewMixin, RetrieveAPIView):
     """
     GET View to retrieve a detail of a different user.
     Check if the user fetching the data is a tenant owner, and the
@@ -70,8 +76,11 @@ class GetUserById(RetrieveAPIView):
         tenant = self.request.user.tenant
 
         try:
-            releases = User.objects.get(
-                id=id, tenant=tenant)
+            releases = User.objects.select_related(
+                'tenant',
+            ).prefetch_related(
+                *UserSerializer.get_prefetches(),
+            ).get(id=id, tenant=tenant)
             self.check_object_permissions(self.request, releases)
             return releases
         except User.DoesNotExist:
@@ -166,7 +175,7 @@ class UserValidationView(APIView):
             return Response(status=200, data={'email_taken': email_taken})
 
 
-class UserListByTenant(ListAPIView):
+class UserListByTenant(ReadOnlyViewMixin, ListAPIView):
     """
     GET a list of all users for that tenant. Only tenant owners can view this
     """
@@ -176,7 +185,8 @@ class UserListByTenant(ListAPIView):
 
     def get_queryset(self):
         tenant = self.request.user.tenant
-        users = User.objects.filter(tenant=tenant)
+        users = User.objects.filter(tenant=tenant).select_related(
+            'tenant').prefetch_related(*UserSerializer.get_prefetches())
         sort_by = self.request.query_params.get('sort_by', 'last_name')
         order = self.request.query_params.get('order_by', 'asc')
 
@@ -191,7 +201,7 @@ class UserListByTenant(ListAPIView):
         return users
 
 
-class UserProfileSearchView(ListAPIView):
+class UserProfileSearchView(ReadOnlyViewMixin, ListAPIView):
     '''
     GET search for a user. Only tenant owners or managers can search
     '''
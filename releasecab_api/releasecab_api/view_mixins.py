@@ -0,0 +1,47 @@
+from django.db import connection, connections, transaction
+from rest_framework.permissions import SAFE_METHODS
+
+from releasecab_api.db_router import (is_pinned_to_primary,
+                                      start_replica_reads, stop_replica_reads)
+
+
+class ReadOnlyViewMixin:
+    '''
+    For views that only read on GET. ATOMIC_REQUESTS would wrap every
+    request in a transaction, this opts the view out of that so reads skip
+    the BEGIN and COMMIT and don't hold a snapshot open while the response
+    is rendered. Any other method the view supports is still run in a
+    transaction of its own, so writes keep their atomicity. Once the user
+    is authenticated, reads can also go to a replica, see db_router
+    '''
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        for alias in connections:
+            view = transaction.non_atomic_requests(using=alias)(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        self.replica_reads = None
+        try:
+            # A read that is already inside a transaction, as in tests,
+            # still gets a savepoint, so an error response only rolls back
+            # the read
+            if request.method in SAFE_METHODS and \
+                    not connection.in_atomic_block:
+                return super().dispatch(request, *args, **kwargs)
+            with transaction.atomic():
+                return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self.replica_reads is not None:
+                stop_replica_reads(self.replica_reads)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Authentication and the user lookup behind it stay on the primary,
+        # the rest of the read can go to a replica unless the user has just
+        # written something
+        if request.method in SAFE_METHODS and \
+                not is_pinned_to_primary(request.user):
+            self.replica_reads = start_replica_reads()